@@ -139,3 +139,39 @@ Ornek ifadeler:
 
 Ifade: {expression}
 """
+
+BATCH_PROMPT = """
+{domain_prompt}
+Yukaridaki gorevi asagidaki {count} ifadenin her biri icin birbirinden
+bagimsiz olarak uygula. Her ifade icin yukaridaki JSON formatinda bir
+obje uret ve ifadenin numarasini "index" alanina yaz. Tum objeleri tek
+bir JSON objesi icinde dondur:
+{{
+    "results": [
+        {{"index": 0, "result": ..., "steps": [...], ...}},
+        {{"index": 1, "result": ..., "steps": [...], ...}}
+    ]
+}}
+
+Ifadeler:
+{expressions}
+"""
+
+# Cevap modu (explain=False): prompt'tan "steps" alani cikarilir ve
+# sadece sonuc istenir; cikti token'lari ve gecikme azalir
+STEPS_FIELD_LINE = '    "steps": ["adim1", "adim2", ...],\n'
+ANSWER_ONLY_INSTRUCTION = """
+Sadece sonucu dondur: "steps" alani yazma, aciklama ekleme.
+"""
+
+
+def answer_only_prompt(prompt: str) -> str:
+    """Prompt template'inin adim istemeyen kisa varyantini dondurur
+
+    Args:
+        prompt: Modul prompt template'i
+
+    Returns:
+        "steps" alani cikarilmis, sadece sonuc isteyen template
+    """
+    return prompt.replace(STEPS_FIELD_LINE, "") + ANSWER_ONLY_INSTRUCTION
@@ -6,6 +6,36 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+MODULE_NAMES = (
+    "basic_math",
+    "calculus",
+    "linear_algebra",
+    "financial",
+    "equation_solver",
+    "graph_plotter",
+    "statistics",
+)
+ROUTING_MODES = ("local", "gemini", "race")
+LLM_BACKENDS = ("gemini", "fake")
+FAKE_LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+def _module_settings(name: str, default: str) -> Dict[str, str]:
+    """Modul bazli ayari okur (ornek: ROUTING_MODE_CALCULUS)
+
+    Args:
+        name: Genel ayar adi (ornek: "ROUTING_MODE")
+        default: Genel ayar da yoksa kullanilacak deger
+
+    Returns:
+        Modul adi -> ham deger dict'i
+    """
+    base_value = os.getenv(name, default)
+    return {
+        module: os.getenv(f"{name}_{module.upper()}", base_value)
+        for module in MODULE_NAMES
+    }
+
 
 class Settings:
     """Uygulama ayarlari"""
@@ -18,19 +48,85 @@ class Settings:
             os.getenv("GEMINI_MODEL", "gemini-2.5-flash") or
             "gemini-2.5-flash"
         ).strip()
+        # Model cagrilarini yapan backend; "fake" API'ye gitmeden sabit
+        # gecikme/hata dagilimi ile yanit uretir (offline benchmark)
+        self.LLM_BACKEND: str = os.getenv("LLM_BACKEND", "gemini").lower()
+        self.FAKE_LATENCY_MS: float = float(
+            os.getenv("FAKE_LATENCY_MS", "50")
+        )
+        self.FAKE_LATENCY_DISTRIBUTION: str = os.getenv(
+            "FAKE_LATENCY_DISTRIBUTION", "lognormal"
+        ).lower()
+        self.FAKE_ERROR_RATE: float = float(
+            os.getenv("FAKE_ERROR_RATE", "0")
+        )
+        self.FAKE_THROTTLE_RATE: float = float(
+            os.getenv("FAKE_THROTTLE_RATE", "0")
+        )
 
         self.RATE_LIMIT_CALLS_PER_MINUTE: int = int(
             os.getenv("RATE_LIMIT_CALLS_PER_MINUTE", "60")
         )
+        self.RATE_LIMIT_BURST: int = int(
+            os.getenv("RATE_LIMIT_BURST", "10")
+        )
+        # Adaptif hiz (AIMD) sinirlari; ust sinir varsayilan olarak
+        # RATE_LIMIT_CALLS_PER_MINUTE
+        self.RATE_LIMIT_MIN_CALLS_PER_MINUTE: float = float(
+            os.getenv("RATE_LIMIT_MIN_CALLS_PER_MINUTE", "1")
+        )
+        self.RATE_LIMIT_MAX_CALLS_PER_MINUTE: float = float(
+            os.getenv(
+                "RATE_LIMIT_MAX_CALLS_PER_MINUTE",
+                str(self.RATE_LIMIT_CALLS_PER_MINUTE),
+            )
+        )
+        # Model katmanlari: GEMINI_FAST_MODEL ayarlanirsa basit istekler
+        # bu modele, zorluk skoru esigi asanlar GEMINI_MODEL'e gider
+        self.GEMINI_FAST_MODEL: str = os.getenv(
+            "GEMINI_FAST_MODEL", ""
+        ).strip()
+        self.RATE_LIMIT_CALLS_PER_MINUTE_FAST: float = float(
+            os.getenv(
+                "RATE_LIMIT_CALLS_PER_MINUTE_FAST",
+                str(self.RATE_LIMIT_CALLS_PER_MINUTE),
+            )
+        )
+        self.TIER_COMPLEXITY_THRESHOLD: float = float(
+            os.getenv("TIER_COMPLEXITY_THRESHOLD", "0.5")
+        )
+        # Hizli model yaniti bu guven skorunun altindaysa guclu model
+        # ile tekrarlanir
+        self.TIER_ESCALATION_MIN_CONFIDENCE: float = float(
+            os.getenv("TIER_ESCALATION_MIN_CONFIDENCE", "0.7")
+        )
         self.TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.1"))
         self.TOP_P: float = float(os.getenv("TOP_P", "0.95"))
         self.MAX_OUTPUT_TOKENS: int = int(
             os.getenv("MAX_OUTPUT_TOKENS", "2048")
         )
+        # Gemini'den dogrudan JSON yanit (response_mime_type) istenir;
+        # JSON modunu desteklemeyen modeller icin false yapilabilir
+        self.GEMINI_JSON_MODE: bool = (
+            os.getenv("GEMINI_JSON_MODE", "true").lower() == "true"
+        )
+        # Cevap modunda (explain=False) kullanilan cikti token siniri;
+        # moduller kendi ust sinirini tanimlayabilir
+        self.ANSWER_ONLY_MAX_OUTPUT_TOKENS: int = int(
+            os.getenv("ANSWER_ONLY_MAX_OUTPUT_TOKENS", "256")
+        )
         self.MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
         self.RETRY_BACKOFF_BASE: int = int(
             os.getenv("RETRY_BACKOFF_BASE", "2")
         )
+        self.RETRY_BACKOFF_MAX: float = float(
+            os.getenv("RETRY_BACKOFF_MAX", "30")
+        )
+        # Istek basina toplam sure (saniye, 0 kapatir); parser, modul,
+        # agent ve grafik asamalari kalan sureyi kontrol eder
+        self.REQUEST_TIMEOUT: float = float(
+            os.getenv("REQUEST_TIMEOUT", "60")
+        )
 
         self.SAFETY_SETTINGS: Dict[str, str] = {
             "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
@@ -38,21 +134,132 @@ class Settings:
             "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
             "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
         }
+        # Gemini yanit cache'i (RESPONSE_CACHE_SIZE=0 cache'i kapatir)
+        self.RESPONSE_CACHE_SIZE: int = int(
+            os.getenv("RESPONSE_CACHE_SIZE", "512")
+        )
+        self.RESPONSE_CACHE_TTL: float = float(
+            os.getenv("RESPONSE_CACHE_TTL", "3600")
+        )
+        self.RESPONSE_CACHE_MAX_BYTES: int = int(
+            os.getenv("RESPONSE_CACHE_MAX_BYTES", str(8 * 1024 * 1024))
+        )
+        # Gemini devre kesici: son CIRCUIT_WINDOW cagrida hata orani
+        # esigi asarsa CIRCUIT_OPEN_SECONDS boyunca cagri yapilmaz
+        self.CIRCUIT_FAILURE_THRESHOLD: float = float(
+            os.getenv("CIRCUIT_FAILURE_THRESHOLD", "0.5")
+        )
+        self.CIRCUIT_WINDOW: int = int(os.getenv("CIRCUIT_WINDOW", "20"))
+        self.CIRCUIT_MIN_CALLS: int = int(
+            os.getenv("CIRCUIT_MIN_CALLS", "5")
+        )
+        self.CIRCUIT_OPEN_SECONDS: float = float(
+            os.getenv("CIRCUIT_OPEN_SECONDS", "30")
+        )
+        # Yavas Gemini cagrilari icin hedging (varsayilan kapali)
+        self.HEDGE_ENABLED: bool = (
+            os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+        )
+        self.HEDGE_PERCENTILE: float = float(
+            os.getenv("HEDGE_PERCENTILE", "95")
+        )
+        self.HEDGE_MAX_FRACTION: float = float(
+            os.getenv("HEDGE_MAX_FRACTION", "0.1")
+        )
+        self.HEDGE_MIN_SAMPLES: int = int(
+            os.getenv("HEDGE_MIN_SAMPLES", "20")
+        )
+        # Gemini micro-batching (BATCH_MAX_SIZE=1 kapatir)
+        self.BATCH_MAX_SIZE: int = int(os.getenv("BATCH_MAX_SIZE", "8"))
+        self.BATCH_MAX_WAIT_MS: float = float(
+            os.getenv("BATCH_MAX_WAIT_MS", "20")
+        )
+        # Batch yanitinin toplam cikti token siniri; grup boyutu ifade
+        # basina token sinirina gore buna sigacak sekilde kucultulur
+        self.BATCH_MAX_OUTPUT_TOKENS: int = int(
+            os.getenv("BATCH_MAX_OUTPUT_TOKENS", "8192")
+        )
+        # Kalici sonuc cache'i (bos RESULT_CACHE_PATH cache'i kapatir)
+        self.RESULT_CACHE_PATH: str = os.getenv(
+            "RESULT_CACHE_PATH", "cache/results.sqlite3"
+        ).strip()
+        self.RESULT_CACHE_MAX_BYTES: int = int(
+            os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+        )
+        self.SYMBOLIC_CACHE_SIZE: int = int(
+            os.getenv("SYMBOLIC_CACHE_SIZE", "256")
+        )
+        # Yerel motor yonlendirmesi: "local" once yerel motoru dener,
+        # "gemini" dogrudan Gemini'ye gider, "race" ikisini birlikte
+        # baslatip ilk gecerli sonucu kullanir
+        self.ROUTING_MODES: Dict[str, str] = {
+            module: mode.strip().lower()
+            for module, mode in _module_settings(
+                "ROUTING_MODE", "local"
+            ).items()
+        }
+        self.LOCAL_TIME_BUDGETS: Dict[str, float] = {
+            module: float(budget)
+            for module, budget in _module_settings(
+                "LOCAL_TIME_BUDGET", "2.0"
+            ).items()
+        }
+        # HTTP servisi (python -m src.server); ayni anda islenen hesaplama
+        # sayisi SERVER_MAX_CONCURRENCY ile sinirlanir, fazlasi sirada bekler
+        self.SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+        self.SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8000"))
+        self.SERVER_MAX_CONCURRENCY: int = int(
+            os.getenv("SERVER_MAX_CONCURRENCY", "64")
+        )
+        self.SERVER_MAX_BATCH_SIZE: int = int(
+            os.getenv("SERVER_MAX_BATCH_SIZE", "100")
+        )
+        self.SERVER_MAX_BODY_BYTES: int = int(
+            os.getenv("SERVER_MAX_BODY_BYTES", str(1024 * 1024))
+        )
         self.DEFAULT_CURRENCY: str = os.getenv("DEFAULT_CURRENCY", "TRY")
         self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
     def validate(self) -> bool:
         """Ayarlarin gecerli olup olmadigini kontrol eder"""
-        if not self.GEMINI_API_KEY:
+        if self.LLM_BACKEND not in LLM_BACKENDS:
+            raise ValueError(
+                f"Gecersiz LLM_BACKEND: {self.LLM_BACKEND}. "
+                f"Gecerli degerler: {', '.join(LLM_BACKENDS)}"
+            )
+        if self.LLM_BACKEND == "fake":
+            if (
+                self.FAKE_LATENCY_DISTRIBUTION
+                not in FAKE_LATENCY_DISTRIBUTIONS
+            ):
+                raise ValueError(
+                    "Gecersiz FAKE_LATENCY_DISTRIBUTION: "
+                    f"{self.FAKE_LATENCY_DISTRIBUTION}. Gecerli degerler: "
+                    f"{', '.join(FAKE_LATENCY_DISTRIBUTIONS)}"
+                )
+        elif not self.GEMINI_API_KEY:
             raise ValueError(
                 "GEMINI_API_KEY environment variable gerekli. "
                 "Lutfen .env dosyasina GEMINI_API_KEY ekleyin."
             )
-        if self.GEMINI_API_KEY == "your_gemini_api_key":
+        elif self.GEMINI_API_KEY == "your_gemini_api_key":
             raise ValueError(
                 "GECERSIZ API KEY: Placeholder deger kullanilamaz. "
                 "Lutfen gecerli bir GEMINI_API_KEY ayarlayin."
             )
+        if self.RATE_LIMIT_CALLS_PER_MINUTE <= 0 or self.RATE_LIMIT_BURST <= 0:
+            raise ValueError(
+                "RATE_LIMIT_CALLS_PER_MINUTE ve RATE_LIMIT_BURST "
+                "pozitif olmali"
+            )
+        if self.SERVER_MAX_CONCURRENCY <= 0:
+            raise ValueError("SERVER_MAX_CONCURRENCY pozitif olmali")
+        for module, mode in self.ROUTING_MODES.items():
+            if mode not in ROUTING_MODES:
+                raise ValueError(
+                    f"Gecersiz ROUTING_MODE ({module}): {mode}. "
+                    f"Gecerli degerler: {', '.join(ROUTING_MODES)}"
+                )
         return True
 
 
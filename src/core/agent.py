@@ -1,41 +1,237 @@
 """Gemini API communication layer"""
 
 import asyncio
+import hashlib
 import json
-import re
-from typing import Any, Dict, Optional, Sequence
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-import google.generativeai as genai
 import time
+from google.api_core import exceptions as google_exceptions
+from google.generativeai.types import (
+    BlockedPromptException,
+    StopCandidateException,
+)
 from src.config.settings import settings
-from src.utils.exceptions import GeminiAPIError
+from src.core.backends import LLMBackend, create_backend
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.deadline import (
+    check_deadline,
+    current_deadline,
+    remaining_time,
+)
+from src.core.hedging import RequestHedger
+from src.core.single_flight import SingleFlight
+from src.core.streaming import StepStreamParser, step_listener
+from src.utils.cache import LRUCache
+from src.utils.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    GeminiAPIError,
+)
+from src.utils.helpers import extract_json_object
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Gemini hata siniflari (classify_gemini_error)
+ERROR_RATE_LIMIT = "rate_limit"
+ERROR_SERVER = "server"
+ERROR_TIMEOUT = "timeout"
+ERROR_SAFETY = "safety"
+ERROR_OTHER = "other"
+
+RATE_LIMIT_MARKERS = ("429", "quota", "rate limit", "resource exhausted")
+SAFETY_MARKERS = ("safety", "blocked")
+TIMEOUT_MARKERS = ("timeout", "timed out", "deadline")
+SERVER_MARKERS = ("500", "502", "503", "504", "unavailable", "internal")
+
+JSON_MIME_TYPE = "application/json"
+
+# JSON olarak okunamayan yanitin sonucuna eklenen hata
+JSON_FALLBACK_ERROR = "Gemini yaniti JSON olarak okunamadi"
+
+
+def classify_gemini_error(error: BaseException) -> str:
+    """Gemini hatasini retry/rate kararlari icin siniflandirir
+
+    Once google-api-core ve SDK exception tipleri, taninmazsa hata
+    mesajindaki isaretler kullanilir.
+
+    Args:
+        error: Yakalanan exception
+
+    Returns:
+        ERROR_RATE_LIMIT, ERROR_SERVER, ERROR_TIMEOUT, ERROR_SAFETY
+        veya ERROR_OTHER
+    """
+    if isinstance(error, (BlockedPromptException, StopCandidateException)):
+        return ERROR_SAFETY
+    if isinstance(error, (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+    )):
+        return ERROR_RATE_LIMIT
+    if isinstance(error, (
+        google_exceptions.DeadlineExceeded,
+        asyncio.TimeoutError,
+        TimeoutError,
+    )):
+        return ERROR_TIMEOUT
+    if isinstance(error, google_exceptions.ServerError):
+        return ERROR_SERVER
+
+    message = str(error).lower()
+    for category, markers in (
+        (ERROR_RATE_LIMIT, RATE_LIMIT_MARKERS),
+        (ERROR_SAFETY, SAFETY_MARKERS),
+        (ERROR_TIMEOUT, TIMEOUT_MARKERS),
+        (ERROR_SERVER, SERVER_MARKERS),
+    ):
+        if any(marker in message for marker in markers):
+            return category
+    return ERROR_OTHER
+
 
 class RateLimiter:
-    """Basit rate limiter"""
+    """Token bucket rate limiter
+
+    Kova ``burst`` kadar token tutar ve dakikada ``calls_per_minute``
+    token dolar; dolu kova ile ``burst`` adet cagri beklemeden gecer.
+    Her caller kilit altinda sadece bir token rezerve eder (gerekirse
+    token sayisini eksiye dusurur) ve bekleme suresini kilidi birakip
+    uyuyarak gecirir. Rezervasyon sirasi bekleme sirasini belirledigi icin
+    caller'lar FIFO sirasiyla gecer.
+    """
 
-    def __init__(self, calls_per_minute: int):
+    def __init__(self, calls_per_minute: int, burst: int = 1):
+        """Limiter'i baslatir
+
+        Args:
+            calls_per_minute: Dakikadaki maksimum ortalama cagri sayisi
+            burst: Beklemeden gecebilecek maksimum ardisik cagri sayisi
+        """
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute pozitif olmali")
+        if burst <= 0:
+            raise ValueError("burst pozitif olmali")
         self.calls_per_minute = calls_per_minute
         self.min_interval = 60.0 / calls_per_minute
-        self.last_call_time = 0.0
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._waiting = 0
         self.lock = asyncio.Lock()
 
+    def _refill(self) -> None:
+        """Gecen sureye gore kovayi doldurur"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            float(self.capacity), self._tokens + elapsed / self.min_interval
+        )
+
+    def set_rate(self, calls_per_minute: float) -> None:
+        """Dolum hizini degistirir, birikmis tokenlar korunur"""
+        self._refill()
+        self.calls_per_minute = calls_per_minute
+        self.min_interval = 60.0 / calls_per_minute
+
+    @property
+    def tokens(self) -> float:
+        """Su an kullanilabilir token sayisi (rezervasyonlar dusulmus)"""
+        self._refill()
+        return max(self._tokens, 0.0)
+
+    @property
+    def queue_depth(self) -> int:
+        """Token bekleyen caller sayisi"""
+        return self._waiting
+
     async def acquire(self) -> None:
-        """Rate limit kontrolu yapar"""
+        """Bir token alir, gerekirse token dolana kadar bekler"""
         async with self.lock:
-            current_time = time.time()
-            time_since_last_call = current_time - self.last_call_time
+            self._refill()
+            self._tokens -= 1.0
+            wait_time = -self._tokens * self.min_interval
+
+        if wait_time <= 0:
+            return
+
+        self._waiting += 1
+        try:
+            await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            # Kullanilmayan rezervasyon kovaya iade edilir
+            self._tokens = min(float(self.capacity), self._tokens + 1.0)
+            raise
+        finally:
+            self._waiting -= 1
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Throttling sinyallerine gore hizini ayarlayan (AIMD) limiter
+
+    Her basarili cagride hiz ``increase_step`` kadar artar (additive
+    increase), her 429/kota hatasinda ``decrease_factor`` ile carpilir
+    (multiplicative decrease) ve kovadaki tokenlar bosaltilir. Hiz
+    ``min_calls_per_minute`` ile ``max_calls_per_minute`` arasinda kalir;
+    boylece limiter statik ayar yerine gercek kotaya yakinsar.
+    """
 
-            if time_since_last_call < self.min_interval:
-                wait_time = self.min_interval - time_since_last_call
-                # Minimum 1 saniye bekle (Gemini API gereksinimi)
-                actual_wait_time = max(wait_time, 1.0)
-                await asyncio.sleep(actual_wait_time)
+    def __init__(
+        self,
+        calls_per_minute: int,
+        burst: int = 1,
+        min_calls_per_minute: float = 1.0,
+        max_calls_per_minute: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 1.0
+    ):
+        """Limiter'i baslatir
 
-            self.last_call_time = time.time()
+        Args:
+            calls_per_minute: Baslangic hizi (dakikadaki cagri)
+            burst: Beklemeden gecebilecek maksimum ardisik cagri sayisi
+            min_calls_per_minute: Hizin inebilecegi alt sinir
+            max_calls_per_minute: Hizin cikabilecegi ust sinir
+                (varsayilan: baslangic hizi)
+            decrease_factor: Throttling'de hizin carpildigi katsayi
+            increase_step: Basarili cagri basina hiz artisi
+        """
+        super().__init__(calls_per_minute, burst)
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor 0 ile 1 arasinda olmali")
+        self.min_calls_per_minute = min_calls_per_minute
+        self.max_calls_per_minute = (
+            max_calls_per_minute if max_calls_per_minute is not None
+            else float(calls_per_minute)
+        )
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.throttles = 0
+
+    def record_success(self) -> None:
+        """Basarili cagri sonrasi hizi additive olarak artirir"""
+        if self.calls_per_minute < self.max_calls_per_minute:
+            self.set_rate(min(
+                self.max_calls_per_minute,
+                self.calls_per_minute + self.increase_step,
+            ))
+
+    def record_throttle(self) -> None:
+        """Throttling sonrasi hizi carpimsal olarak dusurur"""
+        self.throttles += 1
+        self.set_rate(max(
+            self.min_calls_per_minute,
+            self.calls_per_minute * self.decrease_factor,
+        ))
+        self._tokens = min(self._tokens, 0.0)
+        logger.warning(
+            f"Gemini throttled, rate reduced to "
+            f"{self.calls_per_minute:.1f} calls/min"
+        )
 
 
 class GeminiAgent:
@@ -44,180 +240,405 @@ class GeminiAgent:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        calls_per_minute: Optional[float] = None,
+        backend: Optional[LLMBackend] = None
     ):
         """Gemini agent'i baslatir
 
         Args:
             api_key: Gemini API anahtari
             model_name: Model adi
+            calls_per_minute: Bu agent'in dakikalik cagri limiti
+                (varsayilan: ``RATE_LIMIT_CALLS_PER_MINUTE``, adaptif ust
+                sinir ``RATE_LIMIT_MAX_CALLS_PER_MINUTE``)
+            backend: Model cagrilarini yapan backend (varsayilan:
+                ``LLM_BACKEND`` ayarina gore ``create_backend``)
+
+        Raises:
+            ValueError: Gemini backend'i icin API anahtari yok
         """
         self.api_key = api_key or settings.GEMINI_API_KEY
         self.model_name = model_name or settings.GEMINI_MODEL
-
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY gerekli")
-
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(
-            self.model_name,
-            safety_settings=self._get_safety_settings()
+        self.backend = backend or create_backend(
+            self.api_key, self.model_name
+        )
+        self.rate_limiter = AdaptiveRateLimiter(
+            calls_per_minute or settings.RATE_LIMIT_CALLS_PER_MINUTE,
+            burst=settings.RATE_LIMIT_BURST,
+            min_calls_per_minute=settings.RATE_LIMIT_MIN_CALLS_PER_MINUTE,
+            max_calls_per_minute=(
+                calls_per_minute
+                or settings.RATE_LIMIT_MAX_CALLS_PER_MINUTE
+            ),
+        )
+        self.response_cache: Optional[LRUCache] = None
+        if settings.RESPONSE_CACHE_SIZE > 0:
+            self.response_cache = LRUCache(
+                settings.RESPONSE_CACHE_SIZE,
+                ttl=settings.RESPONSE_CACHE_TTL,
+                max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+                sizeof=lambda text: len(text.encode("utf-8")),
+            )
+        self.in_flight = SingleFlight()
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            window=settings.CIRCUIT_WINDOW,
+            min_calls=settings.CIRCUIT_MIN_CALLS,
+            open_seconds=settings.CIRCUIT_OPEN_SECONDS,
         )
-        self.rate_limiter = RateLimiter(settings.RATE_LIMIT_CALLS_PER_MINUTE)
+        self.hedger: Optional[RequestHedger] = None
+        if settings.HEDGE_ENABLED:
+            self.hedger = RequestHedger(
+                percentile=settings.HEDGE_PERCENTILE,
+                max_fraction=settings.HEDGE_MAX_FRACTION,
+                min_samples=settings.HEDGE_MIN_SAMPLES,
+            )
+
+    def _generation_config(
+        self,
+        response_schema: Optional[Dict[str, Any]] = None,
+        max_output_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Gemini generation config'ini dondurur
 
-    def _get_safety_settings(self) -> list:
-        """Gemini guvenlik ayarlarini dondurur"""
-        import google.generativeai.types as genai_types
+        Args:
+            response_schema: Verilirse yanit bu schema'ya gore uretilir
+                (sadece JSON modunda)
+            max_output_tokens: Cikti token siniri (varsayilan:
+                ``MAX_OUTPUT_TOKENS``)
+        """
+        config: Dict[str, Any] = {
+            "temperature": settings.TEMPERATURE,
+            "top_p": settings.TOP_P,
+            "max_output_tokens": (
+                max_output_tokens or settings.MAX_OUTPUT_TOKENS
+            ),
+        }
+        if settings.GEMINI_JSON_MODE:
+            config["response_mime_type"] = JSON_MIME_TYPE
+            if response_schema is not None:
+                config["response_schema"] = response_schema
+        return config
 
-        return [
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
-            {
-                "category": (
-                    genai_types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT
-                ),
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
+    def _cache_key(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Model, generation config ve prompt'tan cache anahtari uretir"""
+        payload = json.dumps(
             {
-                "category": (
-                    genai_types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT
-                ),
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+                "model": self.model_name,
+                "config": generation_config or self._generation_config(),
+                "prompt": prompt,
             },
-        ]
-
-    def _extract_response_text(self, response: Any) -> str:
-        """Extract textual content from Gemini response safely."""
-        if not response:
-            return ""
-
-        TEXT_ATTRS = ("text", "output_text")
-        for attr in TEXT_ATTRS:
-            text_value = getattr(response, attr, None)
-            if isinstance(text_value, str) and text_value.strip():
-                return text_value
-
-        candidates: Sequence[Any] = getattr(response, "candidates", []) or []
-        collected_parts: list[str] = []
-        for candidate in candidates:
-            finish_reason = getattr(candidate, "finish_reason", None)
-            if finish_reason == 2:  # SAFETY or STOP reason without content
-                continue
-            content = getattr(candidate, "content", None)
-            parts = getattr(content, "parts", None) if content else None
-            if not parts and isinstance(candidate, dict):
-                parts = candidate.get("content", {}).get("parts")
-            if not parts:
-                continue
-            for part in parts:
-                part_text = getattr(part, "text", None)
-                if isinstance(part_text, str) and part_text.strip():
-                    collected_parts.append(part_text)
-                elif isinstance(part, dict):
-                    dict_text = part.get("text")
-                    if isinstance(dict_text, str) and dict_text.strip():
-                        collected_parts.append(dict_text)
-        return "\n".join(collected_parts).strip()
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     async def generate_with_retry(
         self,
         prompt: str,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        on_step: Optional[Callable[[str], None]] = None,
+        generation_config: Optional[Dict[str, Any]] = None
     ) -> str:
         """Rate limiting ve retry mekanizmasi ile Gemini cagrisi
 
         Args:
             prompt: Gonderilecek prompt
             max_retries: Maksimum deneme sayisi
+            on_step: Verilirse yanit akis modunda alinir ve ``steps``
+                dizisinin her elemani tamamlandigi anda bu callback'e
+                iletilir. Retry'da daha once iletilen adimlar tekrar
+                gonderilmez.
+            generation_config: Generation config (varsayilan:
+                ``_generation_config()``)
 
         Returns:
             Gemini'den donen metin
 
         Raises:
+            CircuitOpenError: Devre kesici acik (Gemini cagrilmadi)
+            DeadlineExceededError: Istegin suresi doldu ya da kalan sure
+                bir sonraki deneme icin yetersiz
             GeminiAPIError: API hatasi
         """
         max_retries = max_retries or settings.MAX_RETRIES
-        await self.rate_limiter.acquire()
+        generation_config = generation_config or self._generation_config()
+        emitted: List[str] = []
 
         for attempt in range(max_retries):
+            # Istegin suresi dolduysa yeni deneme baslatilmaz
+            check_deadline("gemini")
+            # Devre aciksa retry beklemeleri yerine aninda hata verilir
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError(
+                    "Gemini gecici olarak devre disi (circuit open)"
+                )
+            recorded = False
             try:
-                generation_config = {
-                    "temperature": settings.TEMPERATURE,
-                    "top_p": settings.TOP_P,
-                    "max_output_tokens": settings.MAX_OUTPUT_TOKENS,
-                }
-
-                response = await self.model.generate_content_async(
-                    prompt,
-                    generation_config=generation_config
+                # Limiter beklemesi ve cagri istegin kalan suresini asamaz
+                response_text = await asyncio.wait_for(
+                    self._attempt(
+                        prompt, on_step, emitted, generation_config
+                    ),
+                    timeout=remaining_time(),
                 )
-
-                response_text = self._extract_response_text(response)
-                if not response_text:
-                    finish_reason = getattr(
-                        response.candidates[0], "finish_reason", None
-                    ) if getattr(response, "candidates", None) else None
-                    raise GeminiAPIError(
-                        f"Bos yanit alindi (finish_reason={finish_reason})"
-                    )
+                self.rate_limiter.record_success()
+                self.circuit_breaker.record_success()
+                recorded = True
                 return response_text
 
             except Exception as e:
+                deadline = current_deadline.get()
+                if (
+                    isinstance(e, asyncio.TimeoutError)
+                    and deadline is not None
+                    and deadline.expired
+                ):
+                    # Istemcinin suresi doldu; servis hatasi sayilmaz ve
+                    # half-open deneme hakki finally'de birakilir
+                    raise DeadlineExceededError(
+                        f"Istek {deadline.timeout:g} saniyede "
+                        f"tamamlanamadi (gemini)"
+                    ) from e
+                category = classify_gemini_error(e)
+                if category == ERROR_RATE_LIMIT:
+                    self.rate_limiter.record_throttle()
+                elif category != ERROR_SAFETY:
+                    # Kota ve guvenlik hatalari servis kesintisi sayilmaz
+                    self.circuit_breaker.record_failure()
+                    recorded = True
                 logger.error(
-                    f"Gemini API hatasi "
-                    f"(deneme {attempt + 1}/{max_retries}): {e}"
+                    f"Gemini API hatasi ({category}, "
+                    f"deneme {attempt + 1}/{max_retries}): {e}"
                 )
+                check_deadline("gemini")
 
-                if attempt == max_retries - 1:
+                # Guvenlik filtresi ayni prompt'u tekrar engeller
+                if category == ERROR_SAFETY or attempt == max_retries - 1:
                     raise GeminiAPIError(f"API hatasi: {e}")
 
-                await asyncio.sleep(2 ** attempt)
+                delay = self._backoff_delay(attempt)
+                remaining = remaining_time()
+                if remaining is not None and delay >= remaining:
+                    # Beklemeden sonra deneme yapacak sure kalmaz
+                    raise DeadlineExceededError(
+                        f"Retry icin sure yetersiz ({remaining:.1f}s kaldi)"
+                    ) from e
+                await asyncio.sleep(delay)
+
+            finally:
+                if not recorded:
+                    self.circuit_breaker.release()
+
+    async def _attempt(
+        self,
+        prompt: str,
+        on_step: Optional[Callable[[str], None]],
+        emitted: List[str],
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Limiter'dan token alip tek deneme yapar
+
+        Raises:
+            GeminiAPIError: Yanit bos
+        """
+        # Her deneme limiter'dan gecer; retry'lar kotayi asamaz
+        await self.rate_limiter.acquire()
+        if on_step is not None:
+            response_text = await self._stream_response(
+                prompt, on_step, emitted, generation_config
+            )
+        else:
+            response_text = await self._generate_content(
+                prompt, generation_config
+            )
+        if not response_text:
+            raise GeminiAPIError("Bos yanit alindi")
+        return response_text
+
+    async def _generate_content(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Tek backend cagrisi; hedging aciksa yavas cagri kopyalanir"""
+        def call() -> Awaitable[str]:
+            return self.backend.generate(prompt, generation_config)
+
+        if self.hedger is None:
+            return await call()
+        # Hedge kopyasi da rate limiter'dan token alir
+        return await self.hedger.run(call, self.rate_limiter.acquire)
+
+    async def _stream_response(
+        self,
+        prompt: str,
+        on_step: Callable[[str], None],
+        emitted: List[str],
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Yaniti akis modunda alir, tamamlanan adimlari iletir
+
+        Args:
+            prompt: Gonderilecek prompt
+            on_step: Adim callback'i
+            emitted: Onceki denemelerde iletilmis adimlar (guncellenir)
+            generation_config: Generation config
+
+        Returns:
+            Birlestirilmis yanit metni
+        """
+        parser = StepStreamParser()
+        chunks: List[str] = []
+        seen = 0
+        async for text in self.backend.stream(prompt, generation_config):
+            chunks.append(text)
+            for step in parser.feed(text):
+                seen += 1
+                if seen > len(emitted):
+                    emitted.append(step)
+                    on_step(step)
+        return "".join(chunks).strip()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Jitter'li ustel bekleme suresi (equal jitter)
+
+        Ayni anda hata alan caller'larin retry'lari zamana yayilir.
+        """
+        delay = min(
+            settings.RETRY_BACKOFF_MAX,
+            settings.RETRY_BACKOFF_BASE ** attempt,
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
 
     async def generate_json_response(
         self,
         prompt: str,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        max_output_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
         """JSON formatinda yanit alir
 
+        JSON modunda (``GEMINI_JSON_MODE``) Gemini'den dogrudan JSON
+        istenir; ``response_schema`` verilirse yanit bu schema'ya uyar.
+
         Args:
             prompt: Gonderilecek prompt
             max_retries: Maksimum deneme sayisi
+            response_schema: Yanit schema'si (ornek:
+                ``build_response_schema`` ciktisi)
+            max_output_tokens: Cikti token siniri (varsayilan:
+                ``MAX_OUTPUT_TOKENS``)
 
         Returns:
             Parse edilmis JSON dict
         """
-        response_text = await self.generate_with_retry(prompt, max_retries)
+        generation_config = self._generation_config(
+            response_schema, max_output_tokens
+        )
+        cache_key = self._cache_key(prompt, generation_config)
+        if self.response_cache is not None:
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info("Gemini response cache hit")
+                return self._parse_json_response(cached_text)
+
+        on_step = step_listener.get()
+        if on_step is not None:
+            # Akis modundaki adimlar yalnizca bu caller'a iletilir
+            return await self._generate_and_cache(
+                prompt, cache_key, max_retries, on_step, generation_config
+            )
+
+        # Ayni prompt icin eszamanli cagrilar tek bir API istegini paylasir
+        return await self.in_flight.do(
+            cache_key,
+            lambda: self._generate_and_cache(
+                prompt, cache_key, max_retries,
+                generation_config=generation_config
+            ),
+        )
 
-        # JSON extract
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0)
-            try:
-                parsed_json = json.loads(json_str)
+    async def _generate_and_cache(
+        self,
+        prompt: str,
+        cache_key: str,
+        max_retries: Optional[int],
+        on_step: Optional[Callable[[str], None]] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Gemini'yi cagirir ve JSON yaniti cache'e yazar"""
+        response_text = await self.generate_with_retry(
+            prompt, max_retries, on_step=on_step,
+            generation_config=generation_config
+        )
+        parsed_json = self._extract_json(response_text)
+
+        # Sadece JSON olarak parse edilebilen yanitlar cache'lenir; metin
+        # her hit'te yeniden parse edildigi icin cagiranlar donen dict'i
+        # degistirse de cache etkilenmez
+        if self.response_cache is not None and parsed_json is not None:
+            self.response_cache.put(cache_key, response_text)
 
-                # Sonuç manipülasyonu kaldırıldı
-                # Sonuçlar olduğu gibi kullanılmalı
-                if ("result" in parsed_json and
-                        isinstance(parsed_json["result"], (int, float))):
-                    parsed_json["result"] = float(parsed_json["result"])
+        return self._build_response(response_text, parsed_json)
 
-                return parsed_json
-            except json.JSONDecodeError:
+    def _extract_json(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """Yanit metnindeki JSON objesini parse eder, yoksa None
+
+        JSON modunda yanit dogrudan parse edilir; JSON modu olmayan
+        backend'lerde aciklama metnine gomulu obje taranarak bulunur.
+        """
+        try:
+            parsed_json = json.loads(response_text)
+        except json.JSONDecodeError:
+            parsed_json = extract_json_object(response_text)
+            if parsed_json is None:
                 logger.warning("JSON parse hatasi, raw text donduruluyor")
+        return parsed_json if isinstance(parsed_json, dict) else None
+
+    def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
+        """Yanit metnini sonuc dict'ine cevirir"""
+        return self._build_response(
+            response_text, self._extract_json(response_text)
+        )
+
+    def _build_response(
+        self,
+        response_text: str,
+        parsed_json: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Parse edilmis JSON'dan veya ham metinden sonuc dict'i uretir
+
+        Args:
+            response_text: Gemini'den donen metin
+            parsed_json: Metinden cikarilan JSON objesi (yoksa None)
+
+        Returns:
+            JSON dict veya ham metni ``error`` ile ve sifir guvenle
+            iceren yedek yanit
+        """
+        if parsed_json is not None:
+            # Sonuç manipülasyonu kaldırıldı
+            # Sonuçlar olduğu gibi kullanılmalı
+            if ("result" in parsed_json and
+                    isinstance(parsed_json["result"], (int, float))):
+                parsed_json["result"] = float(parsed_json["result"])
+
+            return parsed_json
 
-        # Fallback: structured response
+        # Fallback: ham metin dogrulanmamis sonuc olarak isaretlenir
         fallback_text = (
             response_text or "Gemini yaniti alinmadan islem sonlandi"
         )
         return {
             "result": fallback_text,
             "steps": [fallback_text],
-            "confidence_score": 0.95,
+            "confidence_score": 0.0,
+            "error": JSON_FALLBACK_ERROR,
         }
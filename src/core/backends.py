@@ -0,0 +1,189 @@
+"""Pluggable LLM backends behind GeminiAgent"""
+
+from typing import Any, AsyncIterator, Dict, Optional, Protocol, Sequence
+
+import google.generativeai as genai
+
+from src.config.settings import settings
+from src.utils.exceptions import GeminiAPIError
+
+BACKEND_GEMINI = "gemini"
+BACKEND_FAKE = "fake"
+
+
+class LLMBackend(Protocol):
+    """``GeminiAgent``'in model cagrilari icin kullandigi arayuz
+
+    Rate limiting, retry, cache, hedging ve devre kesici agent'ta kalir;
+    backend yalnizca tek bir istegi modele iletir.
+    """
+
+    model_name: str
+
+    async def generate(self, prompt: str, config: Dict[str, Any]) -> str:
+        """Prompt'u gonderir ve yanit metnini dondurur
+
+        Raises:
+            GeminiAPIError: Yanit bos
+        """
+        ...
+
+    def stream(
+        self,
+        prompt: str,
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Prompt'u gonderir ve yanit metnini parca parca dondurur"""
+        ...
+
+
+def create_backend(api_key: Optional[str], model_name: str) -> LLMBackend:
+    """``LLM_BACKEND`` ayarina gore backend olusturur
+
+    Args:
+        api_key: Gemini API anahtari (fake backend icin gerekmez)
+        model_name: Model adi
+
+    Returns:
+        Backend instance'i
+    """
+    if settings.LLM_BACKEND == BACKEND_FAKE:
+        from src.core.fake_backend import FakeBackend
+
+        return FakeBackend.from_settings(model_name)
+    return GeminiBackend(api_key, model_name)
+
+
+class GeminiBackend:
+    """``google.generativeai`` uzerinden Gemini backend'i"""
+
+    def __init__(self, api_key: Optional[str], model_name: str):
+        """Gemini istemcisini yapilandirir
+
+        Args:
+            api_key: Gemini API anahtari
+            model_name: Model adi
+
+        Raises:
+            ValueError: API anahtari yok
+        """
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY gerekli")
+
+        self.model_name = model_name
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(
+            model_name,
+            safety_settings=self._get_safety_settings()
+        )
+
+    async def generate(self, prompt: str, config: Dict[str, Any]) -> str:
+        """Tek Gemini cagrisi yapar
+
+        Raises:
+            GeminiAPIError: Yanit bos (ornek: guvenlik filtresi)
+        """
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=config
+        )
+        response_text = self._extract_response_text(response)
+        if not response_text:
+            raise self._empty_response_error(response)
+        return response_text
+
+    async def stream(
+        self,
+        prompt: str,
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Yaniti akis modunda alir
+
+        Raises:
+            GeminiAPIError: Akista hic metin gelmedi
+        """
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=config,
+            stream=True
+        )
+        last_chunk = None
+        produced = False
+        async for chunk in response:
+            last_chunk = chunk
+            text = self._extract_response_text(chunk)
+            produced = produced or bool(text.strip())
+            yield text
+        if not produced:
+            raise self._empty_response_error(last_chunk)
+
+    @staticmethod
+    def _empty_response_error(response: Any) -> GeminiAPIError:
+        """Bos yanit icin finish_reason iceren hata olusturur"""
+        finish_reason = getattr(
+            response.candidates[0], "finish_reason", None
+        ) if getattr(response, "candidates", None) else None
+        finish_reason = getattr(finish_reason, "name", finish_reason)
+        return GeminiAPIError(
+            f"Bos yanit alindi (finish_reason={finish_reason})"
+        )
+
+    def _get_safety_settings(self) -> list:
+        """Gemini guvenlik ayarlarini dondurur"""
+        import google.generativeai.types as genai_types
+
+        return [
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": (
+                    genai_types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT
+                ),
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": (
+                    genai_types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT
+                ),
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+        ]
+
+    def _extract_response_text(self, response: Any) -> str:
+        """Extract textual content from Gemini response safely."""
+        if not response:
+            return ""
+
+        TEXT_ATTRS = ("text", "output_text")
+        for attr in TEXT_ATTRS:
+            text_value = getattr(response, attr, None)
+            if isinstance(text_value, str) and text_value.strip():
+                return text_value
+
+        candidates: Sequence[Any] = getattr(response, "candidates", []) or []
+        collected_parts: list[str] = []
+        for candidate in candidates:
+            finish_reason = getattr(candidate, "finish_reason", None)
+            if finish_reason == 2:  # SAFETY or STOP reason without content
+                continue
+            content = getattr(candidate, "content", None)
+            parts = getattr(content, "parts", None) if content else None
+            if not parts and isinstance(candidate, dict):
+                parts = candidate.get("content", {}).get("parts")
+            if not parts:
+                continue
+            for part in parts:
+                part_text = getattr(part, "text", None)
+                if isinstance(part_text, str) and part_text.strip():
+                    collected_parts.append(part_text)
+                elif isinstance(part, dict):
+                    dict_text = part.get("text")
+                    if isinstance(dict_text, str) and dict_text.strip():
+                        collected_parts.append(dict_text)
+        return "\n".join(collected_parts).strip()
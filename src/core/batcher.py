@@ -0,0 +1,339 @@
+"""Micro-batching of independent Gemini requests into one prompt"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config.prompts import BATCH_PROMPT
+from src.config.settings import settings
+from src.core.agent import GeminiAgent
+from src.core.deadline import (
+    Deadline,
+    check_deadline,
+    current_deadline,
+    remaining_time,
+)
+from src.core.streaming import step_listener
+from src.core.tiering import model_tier
+from src.schemas.response_schema import build_batch_schema
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+BATCH_EXPRESSION_PLACEHOLDER = "(asagidaki ifade listesi)"
+
+
+class _PendingRequest:
+    """Batch'te sirasini bekleyen tek bir istek"""
+
+    def __init__(self, expression: str, future: asyncio.Future):
+        self.expression = expression
+        self.future = future
+        self.batch: List["_PendingRequest"] = []
+        self.flush: Optional[asyncio.Future] = None
+        self.deadline: Optional[Deadline] = current_deadline.get()
+        self.tier: Optional[str] = model_tier.get()
+        self.listener: Optional[Callable[[str], None]] = step_listener.get()
+
+
+class GeminiBatcher:
+    """Ayni modula gelen bagimsiz istekleri tek Gemini prompt'unda toplar
+
+    Istekler ayni prompt parametreleri (ornek: para birimi) ve model
+    katmaniyla gruplanir. Grup ``max_size`` istege ulastiginda ya da ilk
+    istekten sonra ``max_wait`` saniye gectiginde tek bir prompt
+    gonderilir; Gemini'den ``index`` alanli bir sonuc listesi istenir ve
+    sonuclar bekleyen caller'lara dagitilir. Yanit bozuksa veya bir
+    indeksin sonucu eksikse o istekler tek tek gonderilir. API hatasi
+    batch'teki tum caller'lara iletilir. Bir batch'in tum caller'lari iptal
+    edilirse Gemini cagrisi da iptal edilir. Batch cagrisi gruptaki en gec
+    deadline ile sinirlanir; her caller kendi deadline'i dolunca beklemeyi
+    birakir. Kalan suresi ``max_wait`` kadar beklemeye yetmeyen istek tek
+    basina gonderilir. Batch yaniti ifade basina cikti token siniriyla
+    olceklenir; grup boyutu, toplam ``BATCH_MAX_OUTPUT_TOKENS`` sinirini
+    asmayacak sekilde kucultulur.
+    ``max_size`` 1 ise batching kapalidir.
+    """
+
+    def __init__(
+        self,
+        gemini_agent: GeminiAgent,
+        domain_prompt: str,
+        max_size: int = 8,
+        max_wait: float = 0.02,
+        response_schema: Optional[Dict[str, Any]] = None,
+        max_output_tokens: Optional[int] = None
+    ):
+        """Batcher'i baslatir
+
+        Args:
+            gemini_agent: Gemini agent instance
+            domain_prompt: Modulun prompt template'i
+            max_size: Bir prompt'taki maksimum istek sayisi
+            max_wait: Ilk istekten sonra batch icin beklenecek sure (saniye)
+            response_schema: Tek ifadelik yanitin schema'si; batch
+                yanitlari icin ``results`` listesine sarilir
+            max_output_tokens: Tek ifadelik yanitin cikti token siniri;
+                batch'lerde ifade sayisiyla carpilir. None ise
+                ``MAX_OUTPUT_TOKENS`` kullanilir.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size pozitif olmali")
+        self.gemini_agent = gemini_agent
+        self.domain_prompt = domain_prompt
+        item_output_tokens = max_output_tokens or settings.MAX_OUTPUT_TOKENS
+        # Adimli yanitlar uzun oldugu icin bir prompt'a daha az ifade girer
+        self.max_size = min(
+            max_size,
+            max(1, settings.BATCH_MAX_OUTPUT_TOKENS // item_output_tokens),
+        )
+        self.item_output_tokens = item_output_tokens
+        self.max_wait = max_wait
+        self.response_schema = response_schema
+        self.max_output_tokens = max_output_tokens
+        self.batch_schema = (
+            build_batch_schema(response_schema)
+            if response_schema is not None else None
+        )
+        self._groups: Dict[str, List[_PendingRequest]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._flushes: set = set()
+        self.batches = 0
+        self.fallbacks = 0
+
+    async def submit(
+        self,
+        expression: str,
+        **prompt_kwargs
+    ) -> Dict[str, Any]:
+        """Istegi siradaki batch'e ekler ve sonucunu bekler
+
+        Args:
+            expression: Hesaplanacak ifade
+            **prompt_kwargs: Prompt template'e gonderilecek ek parametreler
+
+        Returns:
+            Parse edilmis JSON response
+
+        Raises:
+            DeadlineExceededError: Istegin suresi doldu
+        """
+        check_deadline("batch")
+        remaining = remaining_time()
+        if self.max_size == 1 or (
+            remaining is not None and remaining <= self.max_wait
+        ):
+            return await self._call_single(expression, prompt_kwargs)
+
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(expression, loop.create_future())
+        # Farkli model katmanlarina giden istekler ayni prompt'a girmez
+        group_key = json.dumps(
+            [request.tier, prompt_kwargs], sort_keys=True, default=str
+        )
+        group = self._groups.setdefault(group_key, [])
+        group.append(request)
+
+        if len(group) >= self.max_size:
+            self._start_flush(group_key)
+        elif len(group) == 1:
+            self._timers[group_key] = loop.call_later(
+                self.max_wait, self._start_flush, group_key
+            )
+
+        try:
+            return await request.future
+        except asyncio.CancelledError:
+            self._cancel(group_key, request)
+            raise
+
+    def _cancel(self, group_key: str, request: _PendingRequest) -> None:
+        """Iptal edilen istegi gruptan cikarir, bos kalan isi durdurur"""
+        group = self._groups.get(group_key)
+        if group is not None and request in group:
+            group.remove(request)
+            if not group:
+                del self._groups[group_key]
+                self._timers.pop(group_key).cancel()
+            return
+        if request.flush is not None and all(
+            other.future.done() for other in request.batch
+        ):
+            request.flush.cancel()
+
+    def _start_flush(self, group_key: str) -> None:
+        """Grubu kuyruktan alir ve gonderimini arka planda baslatir"""
+        timer = self._timers.pop(group_key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._groups.pop(group_key, [])
+        if not group:
+            return
+        _, prompt_kwargs = json.loads(group_key)
+        task = asyncio.ensure_future(self._flush(group, prompt_kwargs))
+        for request in group:
+            request.batch = group
+            request.flush = task
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self,
+        group: List[_PendingRequest],
+        prompt_kwargs: Dict[str, Any]
+    ) -> None:
+        """Grubu gonderir ve sonuclari caller'lara dagitir"""
+        # Iptal edilen caller'lar icin istek gonderilmez
+        group = [request for request in group if not request.future.done()]
+        if not group:
+            return
+        if len(group) == 1:
+            await self._resolve_single(group[0], prompt_kwargs)
+            return
+
+        self.batches += 1
+        # Birden fazla ifadenin adimlari tek bir caller'a akitilmaz
+        step_listener.set(None)
+        current_deadline.set(self._latest_deadline(group))
+        model_tier.set(group[0].tier)
+        try:
+            response = await self.gemini_agent.generate_json_response(
+                self._build_prompt(group, prompt_kwargs),
+                response_schema=self.batch_schema,
+                max_output_tokens=self._batch_output_tokens(len(group)),
+            )
+        except Exception as e:
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        results = self._split_results(response, len(group))
+        missing = []
+        for index, request in enumerate(group):
+            result = results.get(index)
+            if result is None:
+                missing.append(request)
+            elif not request.future.done():
+                request.future.set_result(result)
+
+        if missing:
+            self.fallbacks += len(missing)
+            logger.warning(
+                f"Batch response missing {len(missing)}/{len(group)} "
+                f"results, falling back to individual calls"
+            )
+            await asyncio.gather(*(
+                self._resolve_single(request, prompt_kwargs)
+                for request in missing
+            ))
+
+    def _build_prompt(
+        self,
+        group: List[_PendingRequest],
+        prompt_kwargs: Dict[str, Any]
+    ) -> str:
+        """Gruptaki ifadeleri numaralandirilmis tek bir prompt'a cevirir"""
+        domain_prompt = self.domain_prompt.format(
+            expression=BATCH_EXPRESSION_PLACEHOLDER,
+            **prompt_kwargs
+        )
+        expressions = "\n".join(
+            f"{index}: {request.expression}"
+            for index, request in enumerate(group)
+        )
+        return BATCH_PROMPT.format(
+            domain_prompt=domain_prompt.strip(),
+            count=len(group),
+            expressions=expressions,
+        )
+
+    @staticmethod
+    def _split_results(
+        response: Dict[str, Any],
+        count: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """Batch yanitindaki gecerli sonuclari indekslerine gore ayirir
+
+        Returns:
+            Indeks -> sonuc dict'i (bozuk veya eksik indeksler yok)
+        """
+        items = response.get("results")
+        if not isinstance(items, list):
+            return {}
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict) or "result" not in item:
+                continue
+            index = item.get("index")
+            if not isinstance(index, int) or not 0 <= index < count:
+                continue
+            item = {key: value for key, value in item.items()
+                    if key != "index"}
+            if isinstance(item["result"], (int, float)):
+                item["result"] = float(item["result"])
+            results.setdefault(index, item)
+        return results
+
+    async def _resolve_single(
+        self,
+        request: _PendingRequest,
+        prompt_kwargs: Dict[str, Any]
+    ) -> None:
+        """Istegi tek basina gonderir ve sonucunu caller'a iletir
+
+        Flush task'i onu baslatan caller'in context'ini devraldigi icin
+        deadline, katman ve step listener istegin kendi degerlerine cekilir.
+        """
+        current_deadline.set(request.deadline)
+        model_tier.set(request.tier)
+        step_listener.set(request.listener)
+        try:
+            result = await self._call_single(
+                request.expression, prompt_kwargs
+            )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+        if not request.future.done():
+            request.future.set_result(result)
+
+    def _batch_output_tokens(self, count: int) -> int:
+        """Batch prompt'u icin cikti token siniri (ifade sayisiyla olcekli)"""
+        return self.item_output_tokens * count
+
+    @staticmethod
+    def _latest_deadline(
+        group: List[_PendingRequest]
+    ) -> Optional[Deadline]:
+        """Gruptaki en gec deadline (deadline'siz istek varsa None)"""
+        deadlines = [request.deadline for request in group]
+        if any(deadline is None for deadline in deadlines):
+            return None
+        return max(deadlines, key=lambda deadline: deadline.expires_at)
+
+    async def _call_single(
+        self,
+        expression: str,
+        prompt_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Tek ifadelik prompt ile Gemini'yi cagirir"""
+        prompt = self.domain_prompt.format(
+            expression=expression,
+            **prompt_kwargs
+        )
+        return await self.gemini_agent.generate_json_response(
+            prompt,
+            response_schema=self.response_schema,
+            max_output_tokens=self.max_output_tokens,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Batch sayaclarini dondurur"""
+        return {
+            "pending": sum(len(group) for group in self._groups.values()),
+            "batches": self.batches,
+            "fallbacks": self.fallbacks,
+        }
@@ -0,0 +1,204 @@
+"""Expression canonicalization shared by the parser and result caches"""
+
+import json
+import re
+import sys
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+# Klavyede olmayan matematik sembollerinin ASCII karsiliklari
+UNICODE_OPERATORS: Dict[str, str] = {
+    "\u00d7": "*",     # carpi isareti
+    "\u22c5": "*",     # nokta operatoru
+    "\u00b7": "*",     # orta nokta
+    "\u2217": "*",     # yildiz operatoru
+    "\u00f7": "/",     # bolu isareti
+    "\u2215": "/",     # bolme egik cizgisi
+    "\u2212": "-",     # eksi isareti
+    "\u2013": "-",     # en dash
+    "\u2264": "<=",
+    "\u2265": ">=",
+    "\u221a": "sqrt",
+    "\u00b2": "^2",
+    "\u00b3": "^3",
+}
+PI_SYMBOL = "\u03c0"
+IMPLICIT_PI_PATTERN = re.compile(rf"(?<=[\d)]){PI_SYMBOL}")
+OPERATOR_SPACING_PATTERN = re.compile(r"\s*([+\-*/^=(),\[\]<>%:;])\s*")
+WORD_PATTERN = re.compile(r"[^\W\d_]{2,}")
+NUMBER_PATTERN = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])")
+ATOM = r"(?:\d+(?:\.\d+)?|[^\W\d]\w*)"
+COMMUTATIVE_CHAIN_PATTERN = re.compile(
+    rf"^{ATOM}(?:(?P<op>[+*]){ATOM})(?:(?P=op){ATOM})*$"
+)
+# ``**`` ile ``^``'yu ayri dogrulayan moduller (basic_math ``^``'yu reddeder)
+OPERATOR_SENSITIVE_MODULES = frozenset({"basic_math"})
+# Carpimi degismeli olmayan moduller (matris carpimi: A*B != B*A)
+NON_COMMUTATIVE_PRODUCT_MODULES = frozenset({"linear_algebra"})
+REPLAY_FIELDS = ("command", "input", "expression", "query")
+
+
+class ExpressionCanonicalizer:
+    """Ayni anlama gelen ifadeleri tek bir anahtara indirger
+
+    ``normalize`` anlami degistirmeyen temizligi yapar (Unicode operator
+    donusumu, bosluklarin sadelestirilmesi) ve modullere iletilen ifadede
+    kullanilir. ``canonicalize`` bunun uzerine cache anahtarina ozgu
+    donusumleri uygular: operator etrafindaki bosluklar, kelime buyuk/kucuk
+    harfleri, sayi yazimi (``2.0`` -> ``2``), ``**`` -> ``^`` ve yalnizca
+    sayi/degisken iceren ``+`` veya ``*`` zincirlerinde operand sirasi.
+    Tek harfli degiskenlerin harf buyuklugu korunur (``X`` ile ``x`` farkli
+    semboller olabilir). Modul verildiginde operatoru dogrulayan
+    modullerde ``**`` korunur, carpimi degismeli olmayan modullerde ``*``
+    zincirleri siralanmaz.
+    """
+
+    def normalize(self, text: str) -> str:
+        """Unicode operatorleri ASCII'ye cevirir ve bosluklari sadelestirir
+
+        Args:
+            text: Ham ifade
+
+        Returns:
+            Anlami korunmus, normalize edilmis ifade
+        """
+        for symbol, replacement in UNICODE_OPERATORS.items():
+            text = text.replace(symbol, replacement)
+        text = IMPLICIT_PI_PATTERN.sub("*pi", text)
+        text = text.replace(PI_SYMBOL, "pi")
+        text = unicodedata.normalize("NFKC", text)
+        return " ".join(text.split())
+
+    def canonicalize(
+        self,
+        text: str,
+        module_name: Optional[str] = None
+    ) -> str:
+        """Ifadenin cache anahtari olarak kullanilacak kanonik bicimi
+
+        Args:
+            text: Ham veya normalize edilmis ifade
+            module_name: Ifadeyi isleyecek modul (donusumleri sinirlar)
+
+        Returns:
+            Kanonik ifade
+        """
+        text = self.normalize(text)
+        if module_name not in OPERATOR_SENSITIVE_MODULES:
+            text = text.replace("**", "^")
+        text = OPERATOR_SPACING_PATTERN.sub(r"\1", text)
+        text = WORD_PATTERN.sub(lambda match: match.group(0).lower(), text)
+        text = NUMBER_PATTERN.sub(
+            lambda match: self._normalize_number(match.group(0)), text
+        )
+        return self._sort_commutative(
+            text,
+            sort_products=module_name not in NON_COMMUTATIVE_PRODUCT_MODULES,
+        )
+
+    def key(self, module_name: Optional[str], text: str) -> str:
+        """Modul ve kanonik ifadeden tek bir istek anahtari uretir"""
+        return f"{module_name}:{self.canonicalize(text, module_name)}"
+
+    @staticmethod
+    def _normalize_number(number: str) -> str:
+        """Gereksiz sifirlari atar (``02.50`` -> ``2.5``, ``2.0`` -> ``2``)"""
+        if "." in number:
+            number = number.rstrip("0").rstrip(".")
+        number = number.lstrip("0")
+        if not number or number.startswith("."):
+            number = "0" + number
+        return number
+
+    @staticmethod
+    def _sort_commutative(text: str, sort_products: bool = True) -> str:
+        """Sadece atomlardan olusan ``+``/``*`` zincirini siralar"""
+        match = COMMUTATIVE_CHAIN_PATTERN.match(text)
+        if not match:
+            return text
+        operator = match.group("op")
+        if operator == "*" and not sort_products:
+            return text
+        return operator.join(sorted(text.split(operator)))
+
+
+canonicalizer = ExpressionCanonicalizer()
+
+
+def replay_cache_hits(commands: Iterable[str]) -> Dict[str, float]:
+    """Komut akisini tekrar oynatarak kanoniklestirmenin etkisini olcer
+
+    Sinirsiz bir cache varsayilir: bir anahtarin ilk gorulmesi miss,
+    sonraki tekrarlari hit sayilir. Ham anahtar kullanicinin yazdigi
+    metin, kanonik anahtar ise parser'in buldugu modul ve kanonik
+    ifadedir.
+
+    Args:
+        commands: Kullanici komutlari
+
+    Returns:
+        Istek sayisi, ham/kanonik hit sayilari ve oranlari
+    """
+    from src.core.parser import CommandParser
+
+    parser = CommandParser()
+    raw_keys = set()
+    canonical_keys = set()
+    requests = raw_hits = canonical_hits = 0
+
+    for command in commands:
+        requests += 1
+        if command in raw_keys:
+            raw_hits += 1
+        raw_keys.add(command)
+
+        module_name, expression = parser.parse(command)
+        key = canonicalizer.key(module_name, expression)
+        if key in canonical_keys:
+            canonical_hits += 1
+        canonical_keys.add(key)
+
+    return {
+        "requests": requests,
+        "raw_hits": raw_hits,
+        "canonical_hits": canonical_hits,
+        "raw_hit_ratio": raw_hits / requests if requests else 0.0,
+        "canonical_hit_ratio": (
+            canonical_hits / requests if requests else 0.0
+        ),
+    }
+
+
+def _read_commands(path: str) -> List[str]:
+    """JSONL dosyasindan komutlari okur
+
+    Her satir ``command``/``input``/``expression``/``query`` alanlarindan
+    birini iceren bir JSON objesi ya da duz metin olabilir; komut
+    icermeyen satirlar atlanir.
+    """
+    commands = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                commands.append(line)
+                continue
+            if not isinstance(record, dict):
+                continue
+            for field in REPLAY_FIELDS:
+                if isinstance(record.get(field), str):
+                    commands.append(record[field])
+                    break
+    return commands
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Kullanim: python -m src.core.canonical <requests.jsonl>")
+        sys.exit(1)
+    stats = replay_cache_hits(_read_commands(sys.argv[1]))
+    print(json.dumps(stats, indent=2))
@@ -0,0 +1,127 @@
+"""Circuit breaker that fails fast while Gemini is unavailable"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Hata orani esigi asildiginda cagrilari aninda reddeden devre
+
+    ``closed`` durumda son ``window`` cagrinin sonucu tutulur; en az
+    ``min_calls`` cagri varken hata orani ``failure_threshold`` degerine
+    ulasirsa devre ``open`` olur ve ``open_seconds`` boyunca cagrilara
+    izin verilmez. Sure dolunca ``half_open`` duruma gecilir ve
+    ``half_open_probes`` adet deneme cagrisina izin verilir: deneme
+    basariliysa devre kapanir, basarisizsa yeniden acilir.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1
+    ):
+        """Devreyi baslatir
+
+        Args:
+            failure_threshold: Devreyi acan hata orani (0-1)
+            window: Hata orani icin bakilan son cagri sayisi
+            min_calls: Oran hesaplanmadan once gereken minimum cagri sayisi
+            open_seconds: Acik kalma suresi (saniye)
+            half_open_probes: Yari acik durumda izin verilen deneme sayisi
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold 0 ile 1 arasinda olmali")
+        self.failure_threshold = failure_threshold
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self._outcomes: Deque[bool] = deque(maxlen=max(window, min_calls))
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Devrenin guncel durumu (acik kalma suresi dolduysa yari acik)"""
+        if (self._state == STATE_OPEN
+                and time.monotonic() - self._opened_at >= self.open_seconds):
+            self._state = STATE_HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info("Circuit half-open, probing Gemini")
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Cagriya izin verilip verilmedigini dondurur
+
+        Yari acik durumda izin verilen her cagri bir deneme hakki kullanir.
+        """
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if (state == STATE_HALF_OPEN
+                and self._probes_in_flight < self.half_open_probes):
+            self._probes_in_flight += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Basarili cagriyi kaydeder; yari acik devreyi kapatir"""
+        if self._state == STATE_HALF_OPEN:
+            logger.info("Circuit closed, Gemini recovered")
+            self._state = STATE_CLOSED
+            self._outcomes.clear()
+        self._outcomes.append(True)
+
+    def release(self) -> None:
+        """Sonucu kaydedilmeyen cagrinin deneme hakkini iade eder
+
+        Ornek: guvenlik engeli veya iptal gibi Gemini'nin sagligi hakkinda
+        bilgi vermeyen sonuclar.
+        """
+        if self._state == STATE_HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_failure(self) -> None:
+        """Basarisiz cagriyi kaydeder; esik asilirsa devreyi acar"""
+        if self._state == STATE_HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if self._state == STATE_CLOSED and len(self._outcomes) >= (
+            self.min_calls
+        ):
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        """Devreyi acar"""
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(
+            f"Circuit opened, failing fast for {self.open_seconds}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Devre durumunu ve sayaclarini dondurur"""
+        return {
+            "state": self.state,
+            "recent_calls": len(self._outcomes),
+            "recent_failures": self._outcomes.count(False),
+            "rejected": self.rejected,
+        }
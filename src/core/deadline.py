@@ -0,0 +1,67 @@
+"""Per-request deadlines propagated through the pipeline"""
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from src.utils.exceptions import DeadlineExceededError
+
+# Istegin bitmesi gereken an. Context degiskeni oldugu icin parser, modul,
+# batcher ve agent katmanlarina parametre olarak gecirilmesi gerekmez;
+# asyncio task'lari olusturulduklari context'i devralir.
+current_deadline: ContextVar[Optional["Deadline"]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+class Deadline:
+    """Istek icin mutlak bitis zamani
+
+    Her asama isi baslatmadan once ``check`` ile kalan sureyi kontrol
+    eder; suresi dolan istek icin yeni is baslatilmaz.
+    """
+
+    def __init__(self, timeout: float):
+        """Deadline'i simdiden ``timeout`` saniye sonrasina kurar
+
+        Args:
+            timeout: Istek icin toplam sure (saniye)
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """Kalan sure (saniye, en az 0)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Sure doldu mu"""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """Sure dolduysa asamayi baslatmadan hata verir
+
+        Args:
+            stage: Kontrol eden asamanin adi (log ve hata mesaji icin)
+
+        Raises:
+            DeadlineExceededError: Istek suresi doldu
+        """
+        if self.expired:
+            raise DeadlineExceededError(
+                f"Istek {self.timeout:g} saniyede tamamlanamadi ({stage})"
+            )
+
+
+def remaining_time() -> Optional[float]:
+    """Aktif deadline'a kalan sure (deadline yoksa None)"""
+    deadline = current_deadline.get()
+    return None if deadline is None else deadline.remaining()
+
+
+def check_deadline(stage: str) -> None:
+    """Aktif deadline varsa ``Deadline.check`` cagirir"""
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
@@ -0,0 +1,25 @@
+"""Per-request switch between explained and answer-only results"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Istegin adim adim cozum isteyip istemedigi. Context degiskeni oldugu
+# icin router, modul ve batcher katmanlarindan gecirilmesi gerekmez.
+explain_steps: ContextVar[bool] = ContextVar("explain_steps", default=True)
+
+FALSE_VALUES = ("false", "0", "no", "hayir")
+
+
+def explain_requested(parameters: Optional[Dict[str, Any]]) -> bool:
+    """``CalculationRequest.parameters`` icindeki ``explain`` degerini okur
+
+    Args:
+        parameters: Istek parametreleri
+
+    Returns:
+        Adimlar isteniyorsa True (varsayilan)
+    """
+    value = (parameters or {}).get("explain", True)
+    if isinstance(value, str):
+        return value.strip().lower() not in FALSE_VALUES
+    return bool(value)
@@ -0,0 +1,280 @@
+"""In-process fake LLM backend and offline throughput benchmark"""
+
+import asyncio
+import json
+import math
+import random
+import re
+import sys
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.config.settings import settings
+
+LATENCY_FIXED = "fixed"
+LATENCY_UNIFORM = "uniform"
+LATENCY_EXPONENTIAL = "exponential"
+LATENCY_LOGNORMAL = "lognormal"
+# Lognormal dagilimin yayilimi; ortalama ``latency_ms`` olarak kalir
+LOGNORMAL_SIGMA = 0.5
+# Akis modunda yanitin bolundugu parca boyu (karakter)
+STREAM_CHUNK_SIZE = 32
+
+# Prompt'tan ifadeleri cikarmak icin (bkz. prompts.py, BATCH_PROMPT)
+SINGLE_EXPRESSION_PATTERN = re.compile(r"^Ifade: (.*)$", re.MULTILINE)
+BATCH_EXPRESSIONS_MARKER = "Ifadeler:"
+BATCH_LINE_PATTERN = re.compile(r"^(\d+): (.*)$")
+
+
+class FakeBackendError(Exception):
+    """Fake backend'in urettigi yapay API hatasi
+
+    Mesajlar gercek Gemini hatalarinin isaretlerini icerir; boylece
+    ``classify_gemini_error`` retry, AIMD ve devre kesici kararlarini
+    gercek hatalardaki gibi verir.
+    """
+
+
+class FakeBackend:
+    """API'ye gitmeden yanit ureten ``LLMBackend``
+
+    Her cagri secilen dagilimdan gecikme bekler, verilen oranlarda kota
+    (429) veya servis (503) hatasi uretir ve ifade icin hazir cevabi
+    Gemini'nin JSON formatinda dondurur. Batch prompt'larinda her ifade
+    icin ``results`` listesine bir eleman yazilir.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake",
+        latency_ms: float = 50.0,
+        distribution: str = LATENCY_LOGNORMAL,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        answers: Optional[Dict[str, Any]] = None,
+        default_result: Any = 0,
+        seed: Optional[int] = None
+    ):
+        """Fake backend'i baslatir
+
+        Args:
+            model_name: Raporlarda gorunen model adi
+            latency_ms: Ortalama gecikme (milisaniye)
+            distribution: fixed, uniform, exponential veya lognormal
+            error_rate: 503 hatasi olasiligi (0-1)
+            throttle_rate: 429 hatasi olasiligi (0-1)
+            answers: Ifade -> sonuc eslemesi; deger dict ise yanit olarak
+                aynen kullanilir
+            default_result: Eslemede olmayan ifadelerin sonucu
+            seed: Tekrarlanabilir olcumler icin rastgele tohum
+
+        Raises:
+            ValueError: Gecersiz dagilim veya oran
+        """
+        if distribution not in (
+            LATENCY_FIXED,
+            LATENCY_UNIFORM,
+            LATENCY_EXPONENTIAL,
+            LATENCY_LOGNORMAL,
+        ):
+            raise ValueError(f"Gecersiz gecikme dagilimi: {distribution}")
+        if not 0 <= error_rate + throttle_rate <= 1:
+            raise ValueError("Hata oranlari toplami 0 ile 1 arasinda olmali")
+
+        self.model_name = model_name
+        self.latency_ms = latency_ms
+        self.distribution = distribution
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.answers = answers or {}
+        self.default_result = default_result
+        self.random = random.Random(seed)
+        self.calls = 0
+
+    @classmethod
+    def from_settings(cls, model_name: str) -> "FakeBackend":
+        """``FAKE_*`` ayarlarindan backend olusturur"""
+        return cls(
+            model_name=model_name,
+            latency_ms=settings.FAKE_LATENCY_MS,
+            distribution=settings.FAKE_LATENCY_DISTRIBUTION,
+            error_rate=settings.FAKE_ERROR_RATE,
+            throttle_rate=settings.FAKE_THROTTLE_RATE,
+        )
+
+    async def generate(self, prompt: str, config: Dict[str, Any]) -> str:
+        """Gecikmeden sonra hazir yaniti dondurur
+
+        Raises:
+            FakeBackendError: Yapay kota veya servis hatasi
+        """
+        await self._simulate_call()
+        return self.respond(prompt)
+
+    async def stream(
+        self,
+        prompt: str,
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Hazir yaniti parcalar halinde dondurur
+
+        Gecikme ilk parcadan once beklenir.
+        """
+        await self._simulate_call()
+        text = self.respond(prompt)
+        for start in range(0, len(text), STREAM_CHUNK_SIZE):
+            yield text[start:start + STREAM_CHUNK_SIZE]
+            await asyncio.sleep(0)
+
+    def respond(self, prompt: str) -> str:
+        """Prompt'taki ifade(ler) icin JSON yanit metni uretir"""
+        expressions = self._batch_expressions(prompt)
+        if expressions is not None:
+            return json.dumps({
+                "results": [
+                    {"index": index, **self._answer(expression)}
+                    for index, expression in expressions
+                ]
+            })
+        matches = SINGLE_EXPRESSION_PATTERN.findall(prompt)
+        expression = matches[-1].strip() if matches else ""
+        return json.dumps(self._answer(expression))
+
+    def sample_latency(self) -> float:
+        """Secilen dagilimdan bir gecikme (saniye) ceker"""
+        mean = self.latency_ms / 1000
+        if mean <= 0:
+            return 0.0
+        if self.distribution == LATENCY_UNIFORM:
+            return self.random.uniform(0, 2 * mean)
+        if self.distribution == LATENCY_EXPONENTIAL:
+            return self.random.expovariate(1 / mean)
+        if self.distribution == LATENCY_LOGNORMAL:
+            mu = math.log(mean) - LOGNORMAL_SIGMA ** 2 / 2
+            return self.random.lognormvariate(mu, LOGNORMAL_SIGMA)
+        return mean
+
+    async def _simulate_call(self) -> None:
+        """Gecikmeyi bekler ve gerekirse yapay hata uretir"""
+        self.calls += 1
+        await asyncio.sleep(self.sample_latency())
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            raise FakeBackendError("429 fake backend quota exceeded")
+        if roll < self.throttle_rate + self.error_rate:
+            raise FakeBackendError("503 fake backend unavailable")
+
+    def _answer(self, expression: str) -> Dict[str, Any]:
+        """Ifade icin yanit objesi"""
+        answer = self.answers.get(expression, self.default_result)
+        if isinstance(answer, dict):
+            return dict(answer)
+        return {
+            "result": answer,
+            "steps": [f"Ifade: {expression}", f"Sonuc: {answer}"],
+            "confidence_score": 1.0,
+        }
+
+    @staticmethod
+    def _batch_expressions(prompt: str) -> Optional[List[tuple]]:
+        """Batch prompt'undaki (indeks, ifade) ciftleri; batch degilse None"""
+        marker = prompt.rfind(BATCH_EXPRESSIONS_MARKER)
+        if marker < 0:
+            return None
+        expressions = []
+        lines = prompt[marker + len(BATCH_EXPRESSIONS_MARKER):].splitlines()
+        for line in lines:
+            match = BATCH_LINE_PATTERN.match(line.strip())
+            if match:
+                expressions.append((int(match.group(1)), match.group(2)))
+        return expressions
+
+
+def latency_percentile(latencies: List[float], percentile: float) -> float:
+    """Gecikme listesinin yuzdeligi (milisaniye, liste bossa 0)"""
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    index = round(percentile / 100 * (len(ordered) - 1))
+    return ordered[index] * 1000
+
+
+async def benchmark_throughput(
+    agent: Any,
+    commands: List[str],
+    concurrency: int
+) -> Dict[str, Any]:
+    """Komutlari ``process_command`` ile esli olarak calistirip olcer
+
+    Args:
+        agent: ``process_command`` metodu olan agent
+        commands: Calistirilacak komutlar
+        concurrency: Ayni anda islenen komut sayisi
+
+    Returns:
+        Istek sayisi, RPS, p50/p95/p99 gecikme ve hata sayisi
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for command in commands:
+        queue.put_nowait(command)
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while not queue.empty():
+            command = queue.get_nowait()
+            started = time.perf_counter()
+            output = await agent.process_command(command)
+            latencies.append(time.perf_counter() - started)
+            if not output or not output.startswith("✅"):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": round(latency_percentile(latencies, 50), 2),
+        "p95_ms": round(latency_percentile(latencies, 95), 2),
+        "p99_ms": round(latency_percentile(latencies, 99), 2),
+        "errors": errors,
+    }
+
+
+def _benchmark_agent() -> Any:
+    """Fake backend ile, cache'siz ve her istegi Gemini'ye yonlendiren
+    ``CalculatorAgent`` olusturur"""
+    settings.LLM_BACKEND = "fake"
+    settings.RESPONSE_CACHE_SIZE = 0
+    settings.RESULT_CACHE_PATH = ""
+    settings.RATE_LIMIT_CALLS_PER_MINUTE = 10 ** 9
+    settings.RATE_LIMIT_MAX_CALLS_PER_MINUTE = 10 ** 9
+    settings.RATE_LIMIT_BURST = 10 ** 6
+    settings.ROUTING_MODES = {
+        module: "gemini" for module in settings.ROUTING_MODES
+    }
+    from src.main import CalculatorAgent
+
+    return CalculatorAgent()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print(
+            "Kullanim: python -m src.core.fake_backend "
+            "<istek_sayisi> [esli_istek]"
+        )
+        sys.exit(1)
+    count = int(sys.argv[1])
+    concurrency = int(sys.argv[2]) if len(sys.argv) == 3 else 100
+    stats = asyncio.run(benchmark_throughput(
+        _benchmark_agent(),
+        [f"{index} + 1" for index in range(count)],
+        concurrency,
+    ))
+    print(json.dumps(stats, indent=2))
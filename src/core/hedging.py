@@ -0,0 +1,158 @@
+"""Request hedging to cut Gemini tail latency"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class RequestHedger:
+    """Yavas kalan cagri icin ikinci bir kopya gonderir
+
+    Son basarili cagrilarin gecikmeleri kayan bir pencerede tutulur.
+    Bir cagri bu gecikmelerin ``percentile`` yuzdeligi kadar surede
+    tamamlanmazsa ayni istek ikinci kez gonderilir; once basariyla biten
+    sonuc kullanilir ve digeri iptal edilir. Hedge sayisi toplam cagrilarin
+    ``max_fraction`` oranini asamaz ve her hedge ``before_hedge`` ile
+    (ornek: rate limiter) token alir. Pencerede ``min_samples`` kadar
+    olcum birikene kadar hedge yapilmaz.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_fraction: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        """Hedger'i baslatir
+
+        Args:
+            percentile: Hedge gecikmesinin alinacagi yuzdelik (0-100)
+            max_fraction: Hedge'lerin toplam cagrilara orani icin ust sinir
+            min_samples: Hedge yapmak icin gereken minimum olcum sayisi
+            window: Tutulacak son gecikme olcumu sayisi
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile 0 ile 100 arasinda olmali")
+        if not 0 <= max_fraction <= 1:
+            raise ValueError("max_fraction 0 ile 1 arasinda olmali")
+        self.percentile = percentile
+        self.max_fraction = max_fraction
+        self.min_samples = max(1, min_samples)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float) -> None:
+        """Basarili bir cagrinin gecikmesini kaydeder"""
+        self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Hedge gonderilmeden once beklenecek sure (yetersiz veride None)"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = round(self.percentile / 100 * (len(ordered) - 1))
+        return ordered[index]
+
+    def _hedge_allowed(self) -> bool:
+        """Hedge butcesinde yer var mi"""
+        return self.hedges + 1 <= self.max_fraction * self.calls
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        before_hedge: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Any:
+        """Cagriyi gerekirse hedge ederek calistirir
+
+        Args:
+            call: Ayni istegi her cagrildiginda yeniden gonderen fonksiyon
+            before_hedge: Hedge gonderilmeden once beklenecek coroutine
+                fonksiyonu (ornek: rate limiter ``acquire``)
+
+        Returns:
+            Once basariyla tamamlanan cagrinin sonucu
+
+        Raises:
+            Exception: Tum kopyalar hata verirse ilk cagrinin hatasi
+        """
+        self.calls += 1
+        started_at = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        pending = {primary}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self._hedge_allowed():
+                    hedge = await self._start_hedge(
+                        call, before_hedge, primary
+                    )
+                    if hedge is not None:
+                        pending.add(hedge)
+            result = await self._first_success(primary, pending)
+        finally:
+            for task in pending:
+                task.cancel()
+        self.record(time.monotonic() - started_at)
+        return result
+
+    async def _start_hedge(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        before_hedge: Optional[Callable[[], Awaitable[None]]],
+        primary: asyncio.Future
+    ) -> Optional[asyncio.Future]:
+        """Token alip hedge'i baslatir; ilk cagri once biterse vazgecer"""
+        if before_hedge is not None:
+            permit = asyncio.ensure_future(before_hedge())
+            await asyncio.wait(
+                {permit, primary}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not permit.done():
+                permit.cancel()
+                await asyncio.gather(permit, return_exceptions=True)
+                return None
+        self.hedges += 1
+        logger.info(
+            f"Hedging slow Gemini call after "
+            f"{self.hedge_delay():.2f}s"
+        )
+        return asyncio.ensure_future(call())
+
+    async def _first_success(
+        self,
+        primary: asyncio.Future,
+        pending: set
+    ) -> Any:
+        """Ilk basarili sonucu dondurur, hepsi hata verirse ilk hatayi"""
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            pending.difference_update(done)
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        self.hedge_wins += 1
+                    return task.result()
+                if task is primary or first_error is None:
+                    first_error = task.exception()
+        raise first_error
+
+    def stats(self) -> Dict[str, Any]:
+        """Hedge sayaclarini dondurur"""
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delay": self.hedge_delay(),
+        }
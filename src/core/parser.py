@@ -1,6 +1,7 @@
 """Natural language to semantic command parser"""
 
 from typing import Dict, Optional, Tuple
+from src.core.canonical import canonicalizer
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -34,9 +35,9 @@ class CommandParser:
             user_input: Kullanici girdisi
 
         Returns:
-            (modul_adi, ifade) tuple'i
+            (modul_adi, normalize edilmis ifade) tuple'i
         """
-        user_input = user_input.strip()
+        user_input = canonicalizer.normalize(user_input)
 
         # Prefix kontrolü
         for prefix, module in self.MODULE_PREFIXES.items():
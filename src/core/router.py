@@ -0,0 +1,424 @@
+"""Local-first hybrid routing between local engines and Gemini"""
+
+import asyncio
+import json
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from pydantic import ValidationError
+
+from src.config.settings import settings
+from src.core.canonical import canonicalizer
+from src.core.deadline import check_deadline, remaining_time
+from src.core.explain import explain_steps
+from src.core.single_flight import SingleFlight
+from src.core.streaming import step_listener
+from src.core.tiering import ModelTierSelector, model_tier
+from src.modules.base_module import BaseModule
+from src.schemas.models import (
+    ENGINE_CACHE,
+    ENGINE_DEGRADED,
+    ENGINE_GEMINI,
+    CalculationResult,
+)
+from src.utils.cache import PersistentCache
+from src.utils.exceptions import (
+    CircuitOpenError,
+    InvalidInputError,
+    SecurityViolationError,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+MODE_LOCAL = "local"
+MODE_GEMINI = "gemini"
+MODE_RACE = "race"
+
+# Cevap modunda (explain=False) uretilen sonuclarin cache anahtar eki
+ANSWER_ONLY_KEY_SUFFIX = " |answer"
+
+DEGRADED_MESSAGE = (
+    "⚠️ Degraded mod: Gemini gecici olarak kullanilamiyor ve bu ifade "
+    "icin yerel motor sonucu yok. Lutfen biraz sonra tekrar deneyin."
+)
+
+
+class HybridRouter:
+    """Istegi once yerel motora, gerekirse Gemini'ye yonlendirir
+
+    ``local`` modunda yerel motor zaman butcesi icinde denenir; motor
+    ifadeyi reddederse, hata verirse veya butceyi asarsa modulun
+    Gemini yolu (``calculate``) cagrilir. ``gemini`` modunda yerel motor
+    atlanir. ``race`` modunda ikisi ayni anda baslatilir, ilk gecerli
+    sonucu ureten kazanir ve digeri iptal edilir. ``result_cache``
+    verildiginde hatasiz sonuclar kalici cache'e yazilir ve ayni ifade
+    hangi modda olursa olsun once cache'ten okunur. Ayni modul ve kanonik
+    ifade icin eszamanli gelen istekler tek bir hesaplamayi paylasir.
+    Gemini devre kesicisi acikken istekler yerel motora, o da yoksa
+    ``degraded`` etiketli bir hata sonucuna duser. ``tier_selector``
+    verildiginde Gemini cagrisinin model katmani ifadenin zorluguna ve
+    yerel motorun ifadeyi cozememesine gore secilir. Her sonuc ``engine``
+    alaniyla etiketlenir.
+    """
+
+    def __init__(
+        self,
+        modes: Optional[Dict[str, str]] = None,
+        time_budgets: Optional[Dict[str, float]] = None,
+        result_cache: Optional[PersistentCache] = None,
+        tier_selector: Optional[ModelTierSelector] = None
+    ):
+        """Router'i baslatir
+
+        Args:
+            modes: Modul adi -> yonlendirme modu (varsayilan: Settings)
+            time_budgets: Modul adi -> yerel motor zaman butcesi (saniye)
+            result_cache: Sonuclarin saklandigi kalici cache (None: kapali)
+            tier_selector: Gemini model katmani secicisi (None: tek model)
+        """
+        self.modes = modes if modes is not None else settings.ROUTING_MODES
+        self.time_budgets = (
+            time_budgets if time_budgets is not None
+            else settings.LOCAL_TIME_BUDGETS
+        )
+        self.result_cache = result_cache
+        self.tier_selector = tier_selector
+        self.in_flight = SingleFlight()
+        self.counters: Dict[str, Counter] = {}
+
+    async def route(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        **kwargs
+    ) -> CalculationResult:
+        """Ifadeyi uygun hesaplama yoluna yonlendirir
+
+        Args:
+            module_name: Modul adi (ornek: "calculus")
+            module: Modul instance'i
+            expression: Hesaplanacak ifade
+            **kwargs: Modul calculate parametreleri
+
+        Returns:
+            Motor etiketli CalculationResult objesi
+        """
+        counter = self.counters.setdefault(module_name, Counter())
+
+        cache_key = self._cache_key(module_name, expression, kwargs)
+        # Adimsiz sonuc adim isteyen istege verilmez; tersi gecerlidir
+        cache_keys = [cache_key]
+        if not explain_steps.get():
+            cache_key += ANSWER_ONLY_KEY_SUFFIX
+            cache_keys.append(cache_key)
+        if self.result_cache is not None:
+            for key in cache_keys:
+                cached = await self._load_cached(module_name, key)
+                if cached is not None:
+                    counter["cache"] += 1
+                    logger.info(f"Result cache hit ({module_name})")
+                    return cached
+
+        if step_listener.get() is not None:
+            # Akis yapan istegin adimlari yalnizca kendi listener'ina gider
+            return await self._compute(
+                module_name, module, expression, cache_key, counter,
+                **kwargs
+            )
+
+        return await self.in_flight.do(
+            (module_name, cache_key),
+            lambda: self._compute(
+                module_name, module, expression, cache_key, counter,
+                **kwargs
+            ),
+        )
+
+    async def _compute(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        cache_key: str,
+        counter: Counter,
+        **kwargs
+    ) -> CalculationResult:
+        """Sonucu hesaplar ve kalici cache'e yazar"""
+        result = await self._dispatch(
+            module_name, module, expression, counter, **kwargs
+        )
+        if self.result_cache is not None:
+            await self._store_cached(module_name, cache_key, result)
+        return result
+
+    async def _dispatch(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        counter: Counter,
+        **kwargs
+    ) -> CalculationResult:
+        """Istegi moda gore yerel motora, Gemini'ye veya yarisa iletir"""
+        mode = self.modes.get(module_name, MODE_LOCAL)
+        try:
+            if mode == MODE_RACE:
+                return await self._race(
+                    module_name, module, expression, counter, **kwargs
+                )
+
+            if mode == MODE_LOCAL:
+                result = await self._try_local(
+                    module_name, module, expression, counter, **kwargs
+                )
+                if result is not None:
+                    counter["local"] += 1
+                    logger.info(
+                        f"Local calculation successful ({module_name}): "
+                        f"{result.result}"
+                    )
+                    return result
+
+            result = await self._calculate_remote(
+                module_name, module, expression,
+                local_declined=mode == MODE_LOCAL, **kwargs
+            )
+            counter["gemini"] += 1
+            if getattr(result, "engine", None) is None:
+                result.engine = ENGINE_GEMINI
+            return result
+
+        except CircuitOpenError:
+            return await self._degrade(
+                module_name, module, expression, counter,
+                local_tried=mode != MODE_GEMINI, **kwargs
+            )
+
+    async def _degrade(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        counter: Counter,
+        local_tried: bool,
+        **kwargs
+    ) -> CalculationResult:
+        """Devre acikken yerel motoru dener, yoksa degraded sonuc dondurur"""
+        counter["circuit_open"] += 1
+        if not local_tried:
+            result = await self._try_local(
+                module_name, module, expression, counter, **kwargs
+            )
+            if result is not None:
+                counter["local"] += 1
+                return result
+
+        counter["degraded"] += 1
+        logger.warning(f"Returning degraded result ({module_name})")
+        return CalculationResult(
+            result=DEGRADED_MESSAGE,
+            confidence_score=0.0,
+            domain=module_name,
+            error=DEGRADED_MESSAGE,
+            module=module_name,
+            engine=ENGINE_DEGRADED,
+        )
+
+    async def _calculate_remote(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        local_declined: bool = False,
+        **kwargs
+    ) -> CalculationResult:
+        """Modulun Gemini yolunu secilen model katmaniyla cagirir"""
+        if self.tier_selector is None:
+            return await module.calculate(expression, **kwargs)
+
+        tier = self.tier_selector.select(
+            module_name, expression, local_declined
+        )
+        self.counters[module_name][f"tier_{tier}"] += 1
+        token = model_tier.set(tier)
+        try:
+            return await module.calculate(expression, **kwargs)
+        finally:
+            model_tier.reset(token)
+
+    async def _try_local(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        counter: Counter,
+        **kwargs
+    ) -> Optional[CalculationResult]:
+        """Yerel motoru zaman butcesi icinde dener
+
+        Butce asildiginda bekleme iptal edilir; worker thread'deki
+        hesaplama arka planda tamamlanir ve sonucu atilir. Butce istegin
+        kalan suresiyle sinirlanir.
+
+        Raises:
+            DeadlineExceededError: Istegin suresi doldu
+        """
+        check_deadline("local")
+        budget = self.time_budgets.get(module_name)
+        remaining = remaining_time()
+        if remaining is not None:
+            budget = remaining if budget is None else min(budget, remaining)
+        try:
+            result = await asyncio.wait_for(
+                module.calculate_locally(expression, **kwargs),
+                timeout=budget,
+            )
+        except (InvalidInputError, SecurityViolationError):
+            raise
+        except asyncio.TimeoutError:
+            counter["timeout"] += 1
+            logger.warning(
+                f"Local {module_name} engine exceeded {budget}s budget"
+            )
+            return None
+        except Exception as e:
+            counter["failed"] += 1
+            logger.warning(f"Local {module_name} engine failed: {e}")
+            return None
+
+        if result is None:
+            counter["declined"] += 1
+        return result
+
+    async def _race(
+        self,
+        module_name: str,
+        module: BaseModule,
+        expression: str,
+        counter: Counter,
+        **kwargs
+    ) -> CalculationResult:
+        """Yerel motor ile Gemini'yi yaristirir, kaybedeni iptal eder
+
+        Gecerli sonuc hata icermeyen sonuctur. Taraflardan biri
+        reddeder ya da hata verirse digeri beklenir; hicbiri gecerli
+        sonuc uretmezse yerel hata sonucu, o da yoksa Gemini hatasi
+        dondurulur. Iptal edilen yerel hesaplamanin worker thread'i
+        arka planda tamamlanir, sonucu atilir.
+        """
+        local_task = asyncio.create_task(
+            self._try_local(
+                module_name, module, expression, counter, **kwargs
+            )
+        )
+        gemini_task = asyncio.create_task(
+            self._calculate_remote(
+                module_name, module, expression, **kwargs
+            )
+        )
+        pending = {local_task, gemini_task}
+        fallback: Optional[CalculationResult] = None
+        gemini_error: Optional[BaseException] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task is gemini_task and task.exception() is not None:
+                        gemini_error = task.exception()
+                        logger.warning(
+                            f"Gemini failed during race ({module_name}): "
+                            f"{gemini_error}"
+                        )
+                        continue
+
+                    result = task.result()
+                    if result is None:
+                        continue
+                    if task is gemini_task and result.engine is None:
+                        result.engine = ENGINE_GEMINI
+                    if not result.error:
+                        winner = "local" if task is local_task else "gemini"
+                        counter[f"race_{winner}_wins"] += 1
+                        logger.info(
+                            f"Race won by {winner} engine ({module_name})"
+                        )
+                        return result
+                    if fallback is None or task is local_task:
+                        fallback = result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        counter["race_no_winner"] += 1
+        if fallback is not None:
+            return fallback
+        raise gemini_error
+
+    @staticmethod
+    def _cache_key(
+        module_name: str,
+        expression: str,
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """Kanonik ifade ve parametrelerden kalici cache anahtari uretir"""
+        key = canonicalizer.canonicalize(expression, module_name)
+        if kwargs:
+            key += " " + json.dumps(kwargs, sort_keys=True, default=str)
+        return key
+
+    async def _load_cached(
+        self,
+        module_name: str,
+        cache_key: str
+    ) -> Optional[CalculationResult]:
+        """Kalici cache'teki sonucu okur, bozuk kayitlari miss sayar
+
+        SQLite cagrisi event loop'u bloklamamasi icin worker thread'de
+        yapilir.
+        """
+        payload = await asyncio.to_thread(
+            self.result_cache.get, module_name, cache_key
+        )
+        if payload is None:
+            return None
+        try:
+            result = CalculationResult.model_validate_json(payload)
+        except ValidationError as e:
+            logger.warning(f"Discarding unreadable cached result: {e}")
+            return None
+        result.engine = ENGINE_CACHE
+        return result
+
+    async def _store_cached(
+        self,
+        module_name: str,
+        cache_key: str,
+        result: CalculationResult
+    ) -> None:
+        """Hatasiz sonucu kalici cache'e yazar
+
+        Grafik gibi diskteki dosyalara referans veren sonuclar, dosyalarin
+        yasam suresi cache'ten bagimsiz oldugu icin saklanmaz.
+        """
+        if not isinstance(result, CalculationResult):
+            return
+        if result.error or result.visual_data:
+            return
+        await asyncio.to_thread(
+            self.result_cache.put,
+            module_name, cache_key, result.model_dump_json()
+        )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Modul bazli yonlendirme sayaclarini dondurur"""
+        return {
+            module_name: dict(counter)
+            for module_name, counter in self.counters.items()
+        }
@@ -0,0 +1,133 @@
+"""Single-flight de-duplication of concurrent identical async calls"""
+
+import asyncio
+import copy
+import math
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from src.core.deadline import Deadline, current_deadline, remaining_time
+from src.core.streaming import step_listener
+from src.utils.exceptions import DeadlineExceededError
+
+
+class _Flight:
+    """Devam eden tek bir cagri, bekleyen caller sayisi ve ortak deadline"""
+
+    def __init__(self, deadline: Optional[Deadline]):
+        self.deadline = deadline
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+
+    def join(self, deadline: Optional[Deadline]) -> None:
+        """Ortak deadline'i katilan caller'in deadline'ina kadar uzatir"""
+        if self.deadline is None:
+            return
+        if deadline is None:
+            self.deadline.expires_at = math.inf
+        elif deadline.expires_at > self.deadline.expires_at:
+            self.deadline.expires_at = deadline.expires_at
+            self.deadline.timeout = deadline.timeout
+
+
+class SingleFlight:
+    """Ayni anahtarla eszamanli gelen cagrilari tek bir isleme indirger
+
+    Anahtar icin devam eden bir cagri varsa yeni caller'lar ayni sonucu
+    bekler. Sonuc (veya hata) tum bekleyenlere iletilir; ilk caller
+    disindakilere sonucun derin kopyasi verilir, boylece bir caller'in
+    sonucu degistirmesi digerlerini etkilemez.
+
+    Paylasilan cagri kendi task'inda, bekleyenlerin en gec deadline'i ile
+    ve step listener olmadan calisir: ilk caller'in suresi dolsa da is
+    digerleri icin surer, herkes ayrildiginda ise alt asamalarin deadline
+    kontrolleri isi durdurur. Her caller yalnizca kendi deadline'ina kadar
+    bekler. Bir caller iptal edildiginde ya da suresi doldugunda is
+    yalnizca onu bekleyen baska caller kalmadiysa iptal edilir.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Anahtar icin ``func``'i calistirir ya da devam edene katilir
+
+        Args:
+            key: Cagriyi tanimlayan anahtar
+            func: Sonucu ureten coroutine fonksiyonu
+
+        Returns:
+            ``func``'in sonucu (katilan caller'lar icin kopyasi)
+
+        Raises:
+            DeadlineExceededError: Caller'in deadline'i sonuc gelmeden doldu
+        """
+        self.calls += 1
+        deadline = current_deadline.get()
+        flight = self._flights.get(key)
+        # Bekleyeni kalmayan cagri iptal edilmistir, yenisi baslatilir
+        leader = flight is None or flight.waiters == 0
+        if leader:
+            # Kopya: katilanlar uzattiginda ilk caller'in deadline'i degismez
+            flight = _Flight(copy.copy(deadline))
+            flight.task = asyncio.ensure_future(self._run(flight, func))
+            self._flights[key] = flight
+            flight.task.add_done_callback(
+                lambda _, key=key, flight=flight: self._forget(key, flight)
+            )
+        else:
+            flight.join(deadline)
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(flight.task), remaining_time()
+            )
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            flight.waiters -= 1
+            if flight.waiters == 0:
+                flight.task.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                raise DeadlineExceededError(
+                    f"Istek {deadline.timeout:g} saniyede tamamlanamadi "
+                    f"(paylasilan sonuc bekleniyor)"
+                )
+            raise
+        flight.waiters -= 1
+        return result if leader else copy.deepcopy(result)
+
+    @staticmethod
+    async def _run(
+        flight: _Flight,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """``func``'i ortak deadline ile ve listener olmadan calistirir
+
+        Task kendi context kopyasinda calistigi icin degiskenleri
+        degistirmek cagriyi baslatan caller'i etkilemez.
+        """
+        current_deadline.set(flight.deadline)
+        step_listener.set(None)
+        return await func()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Tamamlanan cagriyi tablodan siler"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        """Cagri ve paylasilan cagri sayilarini dondurur"""
+        return {
+            "in_flight": len(self._flights),
+            "calls": self.calls,
+            "shared": self.shared,
+        }
@@ -0,0 +1,104 @@
+"""Incremental parsing of streamed Gemini JSON responses"""
+
+import json
+import re
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+# Akis modunda tamamlanan her adimi alan callback. Context degiskeni
+# oldugu icin router, modul ve batcher katmanlarindan gecirilmesi
+# gerekmez; asyncio task'lari olusturulduklari context'i devralir.
+step_listener: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "step_listener", default=None
+)
+
+# Listener'a gonderildiginde o ana kadar iletilen adimlarin gecersiz
+# oldugunu bildirir (ornek: hizli modelin yaniti reddedilip istek guclu
+# modelle tekrarlandiginda). Adim metninde bulunamayacak bir degerdir.
+STEPS_RESET = "\x00steps-reset"
+
+STEPS_KEY_PATTERN = re.compile(r'"steps"\s*:\s*\[')
+
+_SEARCH = "search"
+_ARRAY = "array"
+_STRING = "string"
+_DONE = "done"
+
+
+class StepStreamParser:
+    """Parca parca gelen JSON metninden ``steps`` elemanlarini cikarir
+
+    Yanitin tamami beklenmeden, ``steps`` dizisindeki her string eleman
+    kapanis tirnagi geldigi anda dondurulur. Dizide string olmayan bir
+    eleman gorulurse akis durdurulur; tam yanit yine sonunda parse edilir.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._state = _SEARCH
+        self._string_start = 0
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """Yeni metin parcasini isler
+
+        Args:
+            chunk: Akistan gelen metin parcasi
+
+        Returns:
+            Bu parca ile tamamlanan adimlar
+        """
+        self._buffer += chunk
+        steps: List[str] = []
+
+        while self._state != _DONE:
+            if self._state == _SEARCH:
+                match = STEPS_KEY_PATTERN.search(self._buffer, self._pos)
+                if not match:
+                    # Anahtar parcalara bolunmus olabilir, sonunu sakla
+                    self._pos = max(self._pos, len(self._buffer) - 16)
+                    break
+                self._pos = match.end()
+                self._state = _ARRAY
+
+            elif self._state == _ARRAY:
+                while (self._pos < len(self._buffer)
+                       and self._buffer[self._pos] in " \t\r\n,"):
+                    self._pos += 1
+                if self._pos >= len(self._buffer):
+                    break
+                char = self._buffer[self._pos]
+                if char == '"':
+                    self._string_start = self._pos
+                    self._pos += 1
+                    self._escaped = False
+                    self._state = _STRING
+                else:
+                    self._state = _DONE
+
+            else:
+                step = self._scan_string()
+                if step is None:
+                    break
+                steps.append(step)
+                self._state = _ARRAY
+
+        return steps
+
+    def _scan_string(self) -> Optional[str]:
+        """Acik string'in kapanisini arar, tamamlandiysa cozer"""
+        while self._pos < len(self._buffer):
+            char = self._buffer[self._pos]
+            self._pos += 1
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                raw = self._buffer[self._string_start:self._pos]
+                try:
+                    return json.loads(raw)
+                except json.JSONDecodeError:
+                    return raw[1:-1]
+        return None
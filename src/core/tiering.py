@@ -0,0 +1,211 @@
+"""Model tiering: cheap requests to a fast model, hard ones to a strong one"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from src.core.agent import GeminiAgent
+from src.core.streaming import STEPS_RESET, step_listener
+from src.utils.exceptions import CircuitOpenError
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+TIER_FAST = "fast"
+TIER_STRONG = "strong"
+
+# Istek icin secilen model katmani. Router tarafindan Gemini cagrisindan
+# once kurulur; modul ve batcher katmanlarindan gecirilmesi gerekmez.
+model_tier: ContextVar[Optional[str]] = ContextVar("model_tier", default=None)
+
+# Modullerin temel zorluk agirliklari (0-1)
+MODULE_COMPLEXITY: Dict[str, float] = {
+    "basic_math": 0.0,
+    "statistics": 0.1,
+    "financial": 0.2,
+    "graph_plotter": 0.3,
+    "linear_algebra": 0.3,
+    "equation_solver": 0.4,
+    "calculus": 0.5,
+}
+# Skor bilesenlerinin ust sinirlari ve olcekleri
+LENGTH_SCALE = 200
+LENGTH_WEIGHT = 0.3
+NESTING_WEIGHT = 0.1
+NESTING_MAX = 0.3
+LOCAL_DECLINED_WEIGHT = 0.3
+
+OPENING_BRACKETS = "([{"
+CLOSING_BRACKETS = ")]}"
+
+
+def nesting_depth(expression: str) -> int:
+    """Ifadedeki en derin parantez seviyesini dondurur"""
+    depth = deepest = 0
+    for char in expression:
+        if char in OPENING_BRACKETS:
+            depth += 1
+            deepest = max(deepest, depth)
+        elif char in CLOSING_BRACKETS and depth > 0:
+            depth -= 1
+    return deepest
+
+
+def complexity_score(
+    module_name: str,
+    expression: str,
+    local_declined: bool = False
+) -> float:
+    """Istegin zorluk skorunu hesaplar
+
+    Skor modul agirligi, ifade uzunlugu, parantez derinligi ve yerel
+    motorun ifadeyi cozememesinden olusur.
+
+    Args:
+        module_name: Modul adi
+        expression: Hesaplanacak ifade
+        local_declined: Yerel motor ifadeyi reddetti ya da cozemedi
+
+    Returns:
+        0 ve uzeri zorluk skoru (tipik olarak 0-1.5)
+    """
+    score = MODULE_COMPLEXITY.get(module_name, 0.5)
+    score += LENGTH_WEIGHT * min(1.0, len(expression) / LENGTH_SCALE)
+    # Tek seviye parantez (ornek: liste verisi) zorluk sayilmaz
+    score += min(
+        NESTING_MAX,
+        NESTING_WEIGHT * max(0, nesting_depth(expression) - 1),
+    )
+    if local_declined:
+        score += LOCAL_DECLINED_WEIGHT
+    return score
+
+
+class ModelTierSelector:
+    """Zorluk skoruna gore model katmani secer"""
+
+    def __init__(self, threshold: float = 0.5):
+        """Secicinin esigini ayarlar
+
+        Args:
+            threshold: Bu skor ve uzeri guclu modele gider
+        """
+        self.threshold = threshold
+
+    def select(
+        self,
+        module_name: str,
+        expression: str,
+        local_declined: bool = False
+    ) -> str:
+        """Istek icin model katmanini dondurur"""
+        score = complexity_score(module_name, expression, local_declined)
+        return TIER_STRONG if score >= self.threshold else TIER_FAST
+
+
+class TieredAgentPool:
+    """Katman basina bir ``GeminiAgent`` tutan ve istegi yonlendiren havuz
+
+    ``GeminiAgent.generate_json_response`` ile ayni arayuzu sunar; katman
+    ``model_tier`` context degiskeninden okunur (yoksa guclu model). Her
+    katmanin kendi rate limiter'i, cache'i ve devre kesicisi vardir. Hizli
+    modelin yaniti dogrulamadan gecemezse ya da devresi aciksa istek guclu
+    modelle tekrarlanir. Akis modunda hizli modelin adimlari beklemeden
+    iletilir; yukseltmede listener'a once ``STEPS_RESET`` gonderilir,
+    boylece listener hizli modelden gelen adimlari geri alip guclu modelin
+    adimlarini bastan gosterebilir.
+    """
+
+    def __init__(
+        self,
+        fast_agent: GeminiAgent,
+        strong_agent: GeminiAgent,
+        min_confidence: float = 0.7
+    ):
+        """Havuzu baslatir
+
+        Args:
+            fast_agent: Hafif/hizli model agent'i
+            strong_agent: Guclu model agent'i
+            min_confidence: Hizli model yanitinin kabul edildigi minimum
+                guven skoru
+        """
+        self.agents = {TIER_FAST: fast_agent, TIER_STRONG: strong_agent}
+        self.min_confidence = min_confidence
+        self.escalations = 0
+
+    async def generate_json_response(
+        self,
+        prompt: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Secilen katmanin agent'i ile JSON yanit alir
+
+        Args:
+            prompt: Gonderilecek prompt
+            **kwargs: ``GeminiAgent.generate_json_response`` parametreleri
+
+        Returns:
+            Parse edilmis JSON dict
+        """
+        strong = self.agents[TIER_STRONG]
+        if model_tier.get() != TIER_FAST:
+            return await strong.generate_json_response(prompt, **kwargs)
+
+        listener = step_listener.get()
+        streamed = 0
+
+        def forward(step: str) -> None:
+            nonlocal streamed
+            streamed += 1
+            listener(step)
+
+        token = step_listener.set(None if listener is None else forward)
+        try:
+            response = await self.agents[TIER_FAST].generate_json_response(
+                prompt, **kwargs
+            )
+        except CircuitOpenError:
+            response = None
+        finally:
+            step_listener.reset(token)
+        if response is not None and self._is_valid(response):
+            return response
+
+        self.escalations += 1
+        logger.info("Escalating request to the strong model tier")
+        if streamed:
+            listener(STEPS_RESET)
+        return await strong.generate_json_response(prompt, **kwargs)
+
+    def _is_valid(self, response: Dict[str, Any]) -> bool:
+        """Hizli model yanitinin kabul edilip edilemeyecegini dondurur
+
+        Batch yanitlarinda (``results`` listesi) her eleman kontrol edilir.
+        """
+        items = response.get("results")
+        if not isinstance(items, list):
+            items = [response]
+        return bool(items) and all(
+            self._is_valid_item(item) for item in items
+        )
+
+    def _is_valid_item(self, item: Any) -> bool:
+        """Tek sonucun sonuc, hata ve guven skoru kontrolu"""
+        if not isinstance(item, dict) or item.get("error"):
+            return False
+        if item.get("result") in (None, ""):
+            return False
+        confidence = item.get("confidence_score", 1.0)
+        return (
+            isinstance(confidence, (int, float))
+            and confidence >= self.min_confidence
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Katman ve yukseltme sayaclarini dondurur"""
+        return {
+            "escalations": self.escalations,
+            "models": {
+                tier: agent.model_name for tier, agent in self.agents.items()
+            },
+        }
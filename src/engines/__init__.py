@@ -0,0 +1,19 @@
+"""Local calculation engines for Calculator Agent"""
+
+from .base_engine import BaseEngine
+from .arithmetic import ArithmeticEngine
+from .calculus import CalculusEngine
+from .equation import EquationEngine
+from .financial import FinancialEngine
+from .linear_algebra import LinearAlgebraEngine
+from .statistics import StatisticsEngine
+
+__all__ = [
+    "BaseEngine",
+    "ArithmeticEngine",
+    "CalculusEngine",
+    "EquationEngine",
+    "FinancialEngine",
+    "LinearAlgebraEngine",
+    "StatisticsEngine",
+]
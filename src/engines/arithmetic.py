@@ -0,0 +1,153 @@
+"""Safe AST based arithmetic engine"""
+
+import ast
+import math
+import operator
+from typing import Any, Callable, Dict, List, Union
+
+from src.engines.base_engine import BaseEngine
+from src.utils.exceptions import UnsupportedExpressionError
+from src.utils.helpers import format_result_for_display
+
+Number = Union[int, float]
+
+DIVISION_BY_ZERO_MESSAGE = "Hatalı işlem: Sıfıra bölme tanımsızdır."
+
+# Us alma siniri: buyuk usler ve float araligini asan sonuclar yerel
+# motorda hesaplanmaz (CPU/bellek harcamamak icin)
+MAX_POWER_EXPONENT = 1024
+MAX_POWER_RESULT_DIGITS = 308
+
+
+def bounded_power(base: Number, exponent: Number) -> Number:
+    """Us ve sonuc buyuklugu sinirli us alma
+
+    Raises:
+        UnsupportedExpressionError: Us veya sonuc sinir disinda ya da
+            sonuc karmasik sayi
+        ZeroDivisionError: 0 negatif use yukseltildi
+    """
+    if abs(exponent) > MAX_POWER_EXPONENT:
+        raise UnsupportedExpressionError(
+            f"Us cok buyuk: {format_result_for_display(exponent)}"
+        )
+    if base < 0 and not float(exponent).is_integer():
+        raise UnsupportedExpressionError(
+            "Negatif tabanin kesirli ussu karmasik sayidir"
+        )
+    if base == 0 and exponent < 0:
+        raise ZeroDivisionError("0 negatif use yukseltilemez")
+    if base != 0 and (
+        exponent * math.log10(abs(base)) > MAX_POWER_RESULT_DIGITS
+    ):
+        raise UnsupportedExpressionError("Us alma sonucu cok buyuk")
+    return base ** exponent
+
+
+class ArithmeticEngine(BaseEngine):
+    """Whitelist tabanli AST yuruyucusu ile dort islem motoru
+
+    ``eval`` kullanilmaz; sadece sayi sabitleri, +, -, *, /, sinirli ``**``
+    ve tekli isaretler degerlendirilir. Diger her dugum tipi
+    ``UnsupportedExpressionError`` ile reddedilir.
+    """
+
+    domain = "basic_math"
+
+    BINARY_OPERATORS: Dict[type, Callable[[Number, Number], Number]] = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.Pow: bounded_power,
+    }
+    UNARY_OPERATORS: Dict[type, Callable[[Number], Number]] = {
+        ast.UAdd: operator.pos,
+        ast.USub: operator.neg,
+    }
+    OPERATOR_SYMBOLS: Dict[type, str] = {
+        ast.Add: "+",
+        ast.Sub: "-",
+        ast.Mult: "*",
+        ast.Div: "/",
+        ast.Pow: "**",
+    }
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Aritmetik ifadeyi hesaplar
+
+        Args:
+            expression: Hesaplanacak ifade (ornek: "2 + 3 * 4")
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Ifade desteklenmiyor
+        """
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise UnsupportedExpressionError(
+                f"Ifade ayristirilamadi: {e.msg}"
+            )
+
+        steps: List[str] = [f"Ifade: {expression.strip()}"]
+        try:
+            value = self._visit(tree.body, steps)
+            result = float(value)
+        except ZeroDivisionError:
+            return {"error": DIVISION_BY_ZERO_MESSAGE, "steps": steps}
+        except OverflowError as e:
+            raise UnsupportedExpressionError(f"Sayi tasmasi: {e}")
+
+        steps.append(f"Sonuc: {format_result_for_display(result)}")
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+        }
+
+    def _visit(self, node: ast.AST, steps: List[str]) -> Number:
+        """AST dugumunu whitelist'e gore degerlendirir"""
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(
+                node.value, (int, float)
+            ):
+                raise UnsupportedExpressionError(
+                    f"Desteklenmeyen sabit: {node.value!r}"
+                )
+            return node.value
+
+        if isinstance(node, ast.UnaryOp):
+            unary = self.UNARY_OPERATORS.get(type(node.op))
+            if unary is None:
+                raise UnsupportedExpressionError(
+                    f"Desteklenmeyen tekli operator: "
+                    f"{type(node.op).__name__}"
+                )
+            return unary(self._visit(node.operand, steps))
+
+        if isinstance(node, ast.BinOp):
+            binary = self.BINARY_OPERATORS.get(type(node.op))
+            if binary is None:
+                raise UnsupportedExpressionError(
+                    f"Desteklenmeyen operator: {type(node.op).__name__}"
+                )
+            left = self._visit(node.left, steps)
+            right = self._visit(node.right, steps)
+            value = binary(left, right)
+            symbol = self.OPERATOR_SYMBOLS[type(node.op)]
+            steps.append(
+                f"{format_result_for_display(left)} {symbol} "
+                f"{format_result_for_display(right)} = "
+                f"{format_result_for_display(value)}"
+            )
+            return value
+
+        raise UnsupportedExpressionError(
+            f"Desteklenmeyen ifade tipi: {type(node).__name__}"
+        )
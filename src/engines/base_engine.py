@@ -0,0 +1,31 @@
+"""Abstract base class for local calculation engines"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class BaseEngine(ABC):
+    """Gemini'ye gitmeden hesaplama yapan yerel motorlar icin base class
+
+    Motorlar Gemini JSON yaniti ile ayni yapida bir dict dondurur
+    (result, steps, confidence_score, metadata). Boylece moduller
+    sonucu ``BaseModule._create_result`` ile ayni sekilde isler.
+    """
+
+    domain: str = ""
+
+    @abstractmethod
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Ifadeyi yerel olarak hesaplar
+
+        Args:
+            expression: Hesaplanacak ifade
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Ifade bu motor ile yorumlanamaz
+        """
+        pass
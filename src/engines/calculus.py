@@ -0,0 +1,413 @@
+"""SymPy backed calculus engine (derivative, integral, limit, Taylor)"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.engines.symbolic import SymbolicEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+OPERATION_PATTERN = re.compile(
+    r"^(?P<keyword>derivative|differentiate|diff|turev|integral|integrate|"
+    r"limit|taylor|series|seri)\b\s*(?:of\s+)?(?P<body>.+)$",
+    re.IGNORECASE,
+)
+LEIBNIZ_PATTERN = re.compile(r"^d/d(?P<var>[A-Za-z])\s+(?P<body>.+)$")
+AT_POINT_PATTERN = re.compile(
+    r"\s+at\s+(?P<var>[A-Za-z])\s*=\s*(?P<point>.+)$", re.IGNORECASE
+)
+WRT_PATTERN = re.compile(
+    r"\s+(?:wrt|with\s+respect\s+to)\s+(?P<var>[A-Za-z])\b", re.IGNORECASE
+)
+BOUNDS_PATTERN = re.compile(
+    r"\s+from\s+(?P<lower>.+?)\s+to\s+(?P<upper>.+)$", re.IGNORECASE
+)
+DIFFERENTIAL_PATTERN = re.compile(r"\s+d(?P<var>[A-Za-z])$")
+LIMIT_SUFFIX_PATTERN = re.compile(
+    r"^(?P<func>.+?)\s+(?:as\s+)?(?P<var>[A-Za-z])\s*"
+    r"(?:->|→|approaches\s+|goes\s+to\s+)\s*(?P<point>\S+)$",
+    re.IGNORECASE,
+)
+LIMIT_PREFIX_PATTERN = re.compile(
+    r"^(?P<var>[A-Za-z])\s*(?:->|→)\s*(?P<point>\S+)\s+(?P<func>.+)$"
+)
+TAYLOR_ORDER_PATTERN = re.compile(
+    r"\s+(?:order|n|derece)\s*=?\s*(?P<order>\d+)", re.IGNORECASE
+)
+TAYLOR_POINT_PATTERN = re.compile(
+    r"\s+(?:at|around|about)\s+(?:(?P<var>[A-Za-z])\s*=\s*)?(?P<point>\S+)",
+    re.IGNORECASE,
+)
+
+OPERATION_NAMES: Dict[str, str] = {
+    "derivative": "derivative",
+    "differentiate": "derivative",
+    "diff": "derivative",
+    "turev": "derivative",
+    "integral": "integral",
+    "integrate": "integral",
+    "limit": "limit",
+    "taylor": "taylor",
+    "series": "taylor",
+    "seri": "taylor",
+}
+
+UNDEFINED_RESULT_MESSAGE = "Hatalı işlem: Sonuç tanımsız."
+INFINITE_RESULT_MESSAGE = "Hatalı işlem: Sonuç sonlu değil"
+NON_FINITE_MESSAGE = "Hatalı işlem: Sonuç sayısal sınırları aşıyor."
+
+DEFAULT_TAYLOR_ORDER = 6
+MAX_TAYLOR_ORDER = 30
+
+
+class CalculusEngine(SymbolicEngine):
+    """Turev, integral, limit ve Taylor serisini SymPy ile hesaplar
+
+    Parse edilen ifadeler ``SymbolicParser`` cache'inde, hesaplanan
+    turev/integral/limit/seri sonuclari ise SymPy'nin kanonik ifade
+    agaci uzerinden anahtarlanan ayri bir LRU cache'te tutulur.
+    Tanimsiz (nan, zoo) ya da sonlu olmayan sonuclar cevap yerine hata
+    olarak dondurulur.
+    """
+
+    domain = "calculus"
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Kalkulus ifadesini sembolik olarak hesaplar
+
+        Args:
+            expression: Hesaplanacak ifade
+                (ornek: "derivative x^2 sin(x) at x=pi")
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Ifade yorumlanamadi
+        """
+        text = self.parser.canonical_text(expression)
+
+        leibniz = LEIBNIZ_PATTERN.match(text)
+        if leibniz:
+            return self._derivative(
+                leibniz.group("body"), leibniz.group("var")
+            )
+
+        match = OPERATION_PATTERN.match(text)
+        if not match:
+            raise UnsupportedExpressionError(
+                "Kalkulus islem anahtar kelimesi bulunamadi"
+            )
+
+        operation = OPERATION_NAMES[match.group("keyword").lower()]
+        body = match.group("body").strip()
+        if operation == "derivative":
+            return self._derivative(body)
+        if operation == "integral":
+            return self._integral(body)
+        if operation == "limit":
+            return self._limit(body)
+        return self._taylor(body)
+
+    def _derivative(
+        self,
+        body: str,
+        variable_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Turev (ve istenirse bir noktadaki degeri)"""
+        point_text = None
+        at_point = AT_POINT_PATTERN.search(body)
+        if at_point:
+            point_text = at_point.group("point")
+            variable_name = variable_name or at_point.group("var")
+            body = body[:at_point.start()]
+
+        wrt = WRT_PATTERN.search(body)
+        if wrt:
+            variable_name = wrt.group("var")
+            body = body[:wrt.start()] + body[wrt.end():]
+
+        function = self.parser.parse(body)
+        variable = self._resolve_variable(function, variable_name)
+
+        derivative = self._cached(
+            ("derivative", function, variable),
+            lambda: self._sympy.diff(function, variable),
+        )
+
+        fmt = self.parser.format
+        steps = [
+            f"f({variable}) = {fmt(function)}",
+            f"d/d{variable} f({variable}) = {fmt(derivative)}",
+        ]
+        metadata: Dict[str, Any] = {
+            "operation": "derivative",
+            "variable": str(variable),
+            "derivative": fmt(derivative),
+        }
+
+        exact = derivative
+        if point_text is not None:
+            point = self.parser.parse(point_text)
+            exact = self._sympy.simplify(derivative.subs(variable, point))
+            metadata["point"] = fmt(point)
+            steps.append(
+                f"{variable} = {fmt(point)} noktasinda: "
+                f"f'({fmt(point)}) = {fmt(exact)}"
+            )
+
+        return self._build_response(exact, steps, metadata)
+
+    def _integral(self, body: str) -> Dict[str, Any]:
+        """Belirli veya belirsiz integral"""
+        bounds = None
+        bounds_match = BOUNDS_PATTERN.search(body)
+        if bounds_match:
+            lower_text = bounds_match.group("lower")
+            upper_text = bounds_match.group("upper")
+            body = body[:bounds_match.start()]
+            body, variable_name = self._strip_differential(body)
+            upper_text, upper_variable = self._strip_differential(upper_text)
+            variable_name = variable_name or upper_variable
+            bounds = (
+                self.parser.parse(lower_text),
+                self.parser.parse(upper_text),
+            )
+        else:
+            body, variable_name = self._strip_differential(body)
+
+        function = self.parser.parse(body)
+        variable = self._resolve_variable(function, variable_name)
+        sympy = self._sympy
+        fmt = self.parser.format
+
+        antiderivative = self._cached(
+            ("integral", function, variable, None),
+            lambda: sympy.integrate(function, variable),
+        )
+        if bounds is None:
+            integral = antiderivative
+        else:
+            integral = self._cached(
+                ("integral", function, variable, bounds),
+                lambda: sympy.integrate(
+                    function, (variable, bounds[0], bounds[1])
+                ),
+            )
+
+        metadata: Dict[str, Any] = {
+            "operation": "integral",
+            "variable": str(variable),
+        }
+        if bounds is None:
+            if integral.has(sympy.Integral):
+                raise UnsupportedExpressionError(
+                    "Belirsiz integral kapali formda bulunamadi"
+                )
+            steps = [
+                f"f({variable}) = {fmt(function)}",
+                f"∫ f({variable}) d{variable} = {fmt(integral)} + C",
+            ]
+            response = self._build_response(integral, steps, metadata)
+            if "error" not in response:
+                response["result"] = f"{fmt(integral)} + C"
+            return response
+
+        lower, upper = bounds
+        metadata["bounds"] = [fmt(lower), fmt(upper)]
+        steps = [
+            f"f({variable}) = {fmt(function)}",
+            f"∫[{fmt(lower)}, {fmt(upper)}] f({variable}) d{variable}",
+        ]
+        if integral.has(sympy.Integral):
+            steps.append("Kapali form bulunamadi, sayisal integral alindi")
+            integral = self._numeric_integral(function, variable, bounds)
+            steps.append(f"Sayisal deger: {float(integral):.10g}")
+        else:
+            if not antiderivative.has(sympy.Integral):
+                steps.append(f"F({variable}) = {fmt(antiderivative)}")
+            steps.append(
+                f"F({fmt(upper)}) - F({fmt(lower)}) = {fmt(integral)}"
+            )
+        return self._build_response(integral, steps, metadata)
+
+    def _limit(self, body: str) -> Dict[str, Any]:
+        """Tek ya da iki yonlu limit"""
+        match = (
+            LIMIT_SUFFIX_PATTERN.match(body)
+            or LIMIT_PREFIX_PATTERN.match(body)
+        )
+        at_point = AT_POINT_PATTERN.search(body)
+        if match:
+            function_text = match.group("func")
+            variable_name = match.group("var")
+            point_text = match.group("point")
+        elif at_point:
+            function_text = body[:at_point.start()]
+            variable_name = at_point.group("var")
+            point_text = at_point.group("point").strip()
+        else:
+            raise UnsupportedExpressionError("Limit noktasi belirtilmemis")
+
+        direction = "+-"
+        if len(point_text) > 1 and point_text[-1] in "+-":
+            direction = point_text[-1]
+            point_text = point_text[:-1]
+
+        function = self.parser.parse(function_text)
+        variable = self._resolve_variable(function, variable_name)
+        point = self.parser.parse(point_text)
+        sympy = self._sympy
+        fmt = self.parser.format
+
+        if point in (sympy.oo, -sympy.oo):
+            direction = "+" if point == -sympy.oo else "-"
+
+        limit = self._cached(
+            ("limit", function, variable, point, direction),
+            lambda: sympy.limit(function, variable, point, dir=direction),
+        )
+        if isinstance(limit, sympy.Limit):
+            raise UnsupportedExpressionError("Limit kapali formda bulunamadi")
+
+        side = {"+": " (sagdan)", "-": " (soldan)"}.get(direction, "")
+        if point in (sympy.oo, -sympy.oo):
+            side = ""
+        steps = [
+            f"f({variable}) = {fmt(function)}",
+            f"lim {variable}→{fmt(point)}{side} f({variable}) = {fmt(limit)}",
+        ]
+        metadata = {
+            "operation": "limit",
+            "variable": str(variable),
+            "point": fmt(point),
+            "direction": direction,
+        }
+        return self._build_response(limit, steps, metadata)
+
+    def _taylor(self, body: str) -> Dict[str, Any]:
+        """Bir nokta etrafinda Taylor polinomu"""
+        order = DEFAULT_TAYLOR_ORDER
+        order_match = TAYLOR_ORDER_PATTERN.search(body)
+        if order_match:
+            order = int(order_match.group("order"))
+            body = body[:order_match.start()] + body[order_match.end():]
+        if not 1 <= order <= MAX_TAYLOR_ORDER:
+            raise UnsupportedExpressionError(
+                f"Taylor derecesi 1-{MAX_TAYLOR_ORDER} arasinda olmali"
+            )
+
+        variable_name = None
+        point_text = "0"
+        point_match = TAYLOR_POINT_PATTERN.search(body)
+        if point_match:
+            variable_name = point_match.group("var")
+            point_text = point_match.group("point")
+            body = body[:point_match.start()] + body[point_match.end():]
+
+        function = self.parser.parse(body)
+        variable = self._resolve_variable(function, variable_name)
+        point = self.parser.parse(point_text)
+        fmt = self.parser.format
+
+        polynomial = self._cached(
+            ("taylor", function, variable, point, order),
+            lambda: self._sympy.series(
+                function, variable, point, order
+            ).removeO(),
+        )
+
+        steps = [
+            f"f({variable}) = {fmt(function)}",
+            f"{variable} = {fmt(point)} etrafinda {order}. dereceye kadar "
+            f"Taylor acilimi (O({variable}^{order}) terimi atildi)",
+            f"T({variable}) = {fmt(polynomial)}",
+        ]
+        metadata = {
+            "operation": "taylor",
+            "variable": str(variable),
+            "point": fmt(point),
+            "order": order,
+        }
+        response = self._build_response(polynomial, steps, metadata)
+        if "error" not in response:
+            response["result"] = fmt(polynomial)
+        return response
+
+    def _numeric_integral(
+        self,
+        function: Any,
+        variable: Any,
+        bounds: Tuple[Any, Any]
+    ) -> Any:
+        """Kapali formu olmayan belirli integrali sayisal hesaplar"""
+        sympy = self._sympy
+        value = sympy.N(sympy.Integral(function, (variable, *bounds)))
+        if not value.has(sympy.Integral):
+            return value
+
+        lower = self.parser.to_number(bounds[0])
+        upper = self.parser.to_number(bounds[1])
+        if lower is None or upper is None:
+            raise UnsupportedExpressionError(
+                "Integral sinirlari sayisal degil"
+            )
+
+        from scipy.integrate import quad
+
+        integrand = sympy.lambdify(variable, function, "math")
+        try:
+            numeric, _ = quad(integrand, lower, upper)
+        except (ArithmeticError, TypeError, ValueError) as e:
+            raise UnsupportedExpressionError(
+                f"Sayisal integral hesaplanamadi: {e}"
+            )
+        return sympy.Float(numeric)
+
+    def _strip_differential(self, text: str) -> Tuple[str, Optional[str]]:
+        """Ifadenin sonundaki 'dx' kismini ayirir"""
+        match = DIFFERENTIAL_PATTERN.search(text)
+        if not match:
+            return text, None
+        return text[:match.start()], match.group("var")
+
+    def _build_response(
+        self,
+        exact: Any,
+        steps: List[str],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Kesin ve sayisal sonucu Gemini yaniti formatinda dondurur
+
+        Tanimsiz (nan, zoo), sonsuz ya da float araligini asan sonuclar
+        cevap olarak donmez; hata mesaji adimlarla birlikte dondurulur.
+        """
+        fmt = self.parser.format
+        sympy = self._sympy
+        numeric = self.parser.to_number(exact)
+        metadata["exact"] = fmt(exact)
+        error = None
+        if exact.has(sympy.nan, sympy.zoo):
+            error = UNDEFINED_RESULT_MESSAGE
+        elif exact.has(sympy.oo, -sympy.oo):
+            error = f"{INFINITE_RESULT_MESSAGE} ({fmt(exact)})"
+        elif numeric is not None and not math.isfinite(numeric):
+            error = NON_FINITE_MESSAGE
+        if error is not None:
+            return {"error": error, "steps": steps, "metadata": metadata}
+
+        if numeric is not None:
+            metadata["numeric"] = numeric
+            if not (exact.is_Integer or exact.is_Float
+                    or exact.is_infinite):
+                steps.append(f"Sayisal deger: {fmt(exact)} ≈ {numeric:.10g}")
+
+        return {
+            "result": numeric if numeric is not None else fmt(exact),
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+            "metadata": metadata,
+        }
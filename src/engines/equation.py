@@ -0,0 +1,487 @@
+"""Polynomial, symbolic and numeric equation solving engine"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.engines.numeric import ROUND_DECIMALS
+from src.engines.symbolic import SymbolicEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+SOLVE_PREFIX_PATTERN = re.compile(
+    r"^(?:solve|coz|çöz)\s*:?\s+", re.IGNORECASE
+)
+FOR_VARIABLE_PATTERN = re.compile(
+    r"\s+(?:for|icin|wrt)\s+(?P<var>[A-Za-z])\s*$", re.IGNORECASE
+)
+INTERVAL_PATTERN = re.compile(
+    r"\s+(?:(?:[A-Za-z]\s+)?in\s+\[(?P<lower>[^,\]]+),(?P<upper>[^\]]+)\]"
+    r"|between\s+(?P<low>\S+)\s+and\s+(?P<high>\S+))\s*$",
+    re.IGNORECASE,
+)
+
+DEFAULT_INTERVAL = (-10.0, 10.0)
+SCAN_POINTS = 4001
+ROOT_TOLERANCE = 1e-9
+CLUSTER_TOLERANCE = 1e-6
+MAX_POLYNOMIAL_DEGREE = 100
+
+Root = Tuple[complex, int]
+
+
+class EquationEngine(SymbolicEngine):
+    """Tek degiskenli denklemleri yerel olarak cozer
+
+    - Sayisal katsayili polinomlar (ve rasyonel ifadelerin payi) once
+      karesiz carpanlara ayrilir, her carpanin kokleri ``numpy.roots``
+      (companion matris ozdegerleri) ile bulunur; katliliklar
+      carpanlara ayirmadan gelir.
+    - Parametreli ya da koklu (cebirsel) denklemler SymPy ``solve`` ile
+      kapali formda cozulur.
+    - Transandant denklemler (sin, exp, log ...) bir aralikta taranir;
+      isaret degisimleri ``brentq`` ile, isaret degistirmeyen (teget)
+      kokler Newton ile bulunur.
+
+    Denklem sistemleri ve diferansiyel denklemler Gemini'ye birakilir.
+    """
+
+    domain = "equation_solver"
+    VARIABLE_KEYWORD = "for"
+    DEFAULT_VARIABLE = None
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Denklemi cozer
+
+        Args:
+            expression: Cozulecek denklem (ornek: "2x^2 - 5x + 3 = 0")
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Denklem yorumlanamadi
+        """
+        text = SOLVE_PREFIX_PATTERN.sub("", expression.strip())
+        text = self.parser.canonical_text(text)
+
+        interval = None
+        interval_match = INTERVAL_PATTERN.search(text)
+        if interval_match:
+            groups = interval_match.groupdict()
+            interval = self._parse_interval(
+                groups["lower"] or groups["low"],
+                groups["upper"] or groups["high"],
+            )
+            text = text[:interval_match.start()]
+
+        variable_name = None
+        for_match = FOR_VARIABLE_PATTERN.search(text)
+        if for_match:
+            variable_name = for_match.group("var")
+            text = text[:for_match.start()]
+
+        if text.count("=") != 1 or "," in text:
+            raise UnsupportedExpressionError(
+                "Tek esitlikli tek denklem bekleniyor"
+            )
+        left_text, right_text = text.split("=")
+        left = self.parser.parse(left_text)
+        right = self.parser.parse(right_text)
+
+        sympy = self._sympy
+        difference = left - right
+        # expand (x+1)^3000 gibi ifadelerde saniyelerce surer; derece
+        # siniri acilmadan once yapisal ust sinirla kontrol edilir
+        expandable = (
+            self._degree_bound(difference) <= MAX_POLYNOMIAL_DEGREE
+        )
+        function = sympy.expand(difference) if expandable else difference
+        variable = self._resolve_variable(function, variable_name)
+        fmt = self.parser.format
+        steps = [
+            f"Denklem: {fmt(left)} = {fmt(right)}",
+            f"f({variable}) = {fmt(function)} = 0",
+        ]
+        metadata: Dict[str, Any] = {"variable": str(variable)}
+
+        parameters = function.free_symbols - {variable}
+        if not expandable and (
+            parameters or function.is_algebraic_expr(variable)
+        ):
+            raise UnsupportedExpressionError("Polinom derecesi cok yuksek")
+        if parameters:
+            return self._solve_symbolic(function, variable, steps, metadata)
+
+        numerator, denominator = sympy.together(function).as_numer_denom()
+        if numerator.is_polynomial(variable) and denominator.is_polynomial(
+            variable
+        ):
+            return self._solve_polynomial(
+                numerator, denominator, variable, steps, metadata, interval
+            )
+        if function.is_algebraic_expr(variable):
+            return self._solve_symbolic(
+                function, variable, steps, metadata, interval
+            )
+        return self._solve_numeric(
+            function, variable, interval or DEFAULT_INTERVAL, steps, metadata
+        )
+
+    def _solve_polynomial(
+        self,
+        numerator: Any,
+        denominator: Any,
+        variable: Any,
+        steps: List[str],
+        metadata: Dict[str, Any],
+        interval: Optional[Tuple[float, float]] = None
+    ) -> Dict[str, Any]:
+        """Polinom koklerini companion matris ozdegerleriyle bulur
+
+        Aralik verilmisse sadece araliktaki gercel kokler dondurulur.
+        """
+        sympy = self._sympy
+        polynomial = sympy.Poly(numerator, variable)
+        degree = polynomial.degree()
+        if polynomial.is_zero:
+            raise UnsupportedExpressionError(
+                "Denklem bir ozdeslik (her deger cozum)"
+            )
+        if degree > MAX_POLYNOMIAL_DEGREE:
+            raise UnsupportedExpressionError("Polinom derecesi cok yuksek")
+
+        roots: List[Root] = [] if degree < 1 else self._cached(
+            ("polynomial", polynomial.as_expr(), variable),
+            lambda: self._polynomial_roots(polynomial),
+        )
+        if denominator != 1:
+            poles = sympy.Poly(denominator, variable)
+            roots = [
+                (root, multiplicity) for root, multiplicity in roots
+                if abs(complex(poles.eval(root))) > ROOT_TOLERANCE
+            ]
+            steps.append(
+                f"Payda sifir olmamali: {self.parser.format(denominator)}"
+                " ≠ 0"
+            )
+
+        coefficients = [
+            self.parser.format(c) for c in polynomial.all_coeffs()
+        ]
+        steps.append(f"{degree}. dereceden polinom, katsayilar: "
+                     f"[{', '.join(coefficients)}]")
+        steps.append(
+            "Kokler: companion matrisin ozdegerleri (numpy.roots), "
+            "katliliklar karesiz carpanlara ayirma ile"
+        )
+        metadata.update({"method": "polynomial", "degree": degree})
+        return self._build_response(
+            self._within(roots, interval, steps, metadata), steps, metadata
+        )
+
+    def _polynomial_roots(self, polynomial: Any) -> List[Root]:
+        """Karesiz carpanlarin koklerini katliliklariyla dondurur"""
+        sympy = self._sympy
+        if polynomial.domain.is_Exact:
+            _, factors = sympy.sqf_list(polynomial)
+        else:
+            factors = [(polynomial, 1)]
+
+        roots: List[Root] = []
+        for factor, multiplicity in factors:
+            if factor.degree() < 1:
+                continue
+            coefficients = np.array(
+                [complex(c) for c in factor.all_coeffs()], dtype=complex
+            )
+            if not coefficients.imag.any():
+                coefficients = coefficients.real
+            for root in np.roots(coefficients):
+                roots.append((complex(root), multiplicity))
+        return self._cluster(roots)
+
+    def _solve_symbolic(
+        self,
+        function: Any,
+        variable: Any,
+        steps: List[str],
+        metadata: Dict[str, Any],
+        interval: Optional[Tuple[float, float]] = None
+    ) -> Dict[str, Any]:
+        """Parametreli veya cebirsel denklemi SymPy solve ile cozer
+
+        Aralik sadece parametresiz denklemlerin gercel koklerine uygulanir.
+        """
+        sympy = self._sympy
+        try:
+            solutions = self._cached(
+                ("solve", function, variable),
+                lambda: sympy.solve(function, variable),
+            )
+        except (NotImplementedError, ValueError) as e:
+            raise UnsupportedExpressionError(f"SymPy cozemedi: {e}")
+
+        fmt = self.parser.format
+        metadata["method"] = "symbolic"
+        steps.append("SymPy solve ile kapali form cozum")
+        if function.free_symbols - {variable}:
+            formatted = [fmt(solution) for solution in solutions]
+            steps.extend(f"{variable} = {solution}" for solution in formatted)
+            if not formatted:
+                steps.append("Cozum yok")
+            metadata["solutions"] = formatted
+            return {
+                "result": {str(variable): formatted},
+                "steps": steps,
+                "visualization_needed": False,
+                "domain": self.domain,
+                "confidence_score": 1.0,
+                "metadata": metadata,
+            }
+
+        metadata["exact"] = [fmt(solution) for solution in solutions]
+        roots = self._cluster([
+            (complex(sympy.N(solution)), 1) for solution in solutions
+        ])
+        return self._build_response(
+            self._within(roots, interval, steps, metadata), steps, metadata
+        )
+
+    @staticmethod
+    def _within(
+        roots: List[Root],
+        interval: Optional[Tuple[float, float]],
+        steps: List[str],
+        metadata: Dict[str, Any]
+    ) -> List[Root]:
+        """Kokleri verilen araliktaki gercel koklerle sinirlar"""
+        if interval is None:
+            return roots
+        lower, upper = interval
+        steps.append(f"Sadece [{lower:g}, {upper:g}] araligindaki gercel "
+                     "kokler")
+        metadata["interval"] = [lower, upper]
+        return [
+            (root, multiplicity) for root, multiplicity in roots
+            if root.imag == 0 and lower <= root.real <= upper
+        ]
+
+    def _degree_bound(self, expression: Any) -> int:
+        """Ifade acildiginda (expand) olusacak derecenin ust siniri
+
+        Fonksiyon cagrilari (sin(x) gibi) tek bir uretec sayilir;
+        ifade acilmadan agac uzerinden hesaplandigi icin ucuzdur.
+        """
+        if not expression.free_symbols:
+            return 0
+        if expression.is_Symbol:
+            return 1
+        if expression.is_Pow:
+            base, exponent = expression.as_base_exp()
+            bound = max(1, self._degree_bound(base))
+            if exponent.is_Integer:
+                return abs(int(exponent)) * bound
+            return bound
+        bounds = [self._degree_bound(arg) for arg in expression.args]
+        if expression.is_Mul:
+            return sum(bounds)
+        return max([1, *bounds])
+
+    def _solve_numeric(
+        self,
+        function: Any,
+        variable: Any,
+        interval: Tuple[float, float],
+        steps: List[str],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Transandant denklemi aralik taramasi ve brentq/Newton ile cozer"""
+        sympy = self._sympy
+        roots = self._cached(
+            ("numeric", function, variable, interval),
+            lambda: self._scan_roots(
+                sympy.lambdify(variable, function, "numpy"),
+                sympy.lambdify(
+                    variable, sympy.diff(function, variable), "numpy"
+                ),
+                interval,
+            ),
+        )
+
+        lower, upper = interval
+        steps.append(
+            f"[{lower:g}, {upper:g}] araligi {SCAN_POINTS} noktada tarandi"
+        )
+        steps.append(
+            "Isaret degisimleri brentq ile, teget kokler Newton ile "
+            "yakinsatildi"
+        )
+        metadata.update({"method": "numeric", "interval": [lower, upper]})
+        return self._build_response(roots, steps, metadata)
+
+    def _scan_roots(
+        self,
+        function: Callable[[np.ndarray], np.ndarray],
+        derivative: Callable[[np.ndarray], np.ndarray],
+        interval: Tuple[float, float]
+    ) -> List[Root]:
+        """Araliktaki gercel kokleri vektorel tarama ile bulur"""
+        from scipy.optimize import brentq, newton
+
+        grid = np.linspace(interval[0], interval[1], SCAN_POINTS)
+        with np.errstate(all="ignore"):
+            values = np.broadcast_to(
+                np.asarray(function(grid), dtype=float), grid.shape
+            )
+
+        def scalar(x: float) -> float:
+            with np.errstate(all="ignore"):
+                return float(function(np.float64(x)))
+
+        def slope(x: float) -> float:
+            with np.errstate(all="ignore"):
+                return float(derivative(np.float64(x)))
+
+        def converged(root: float) -> bool:
+            value = abs(scalar(root))
+            return bool(np.isfinite(value) and value < ROOT_TOLERANCE)
+
+        finite = np.isfinite(values)
+        candidates: List[float] = grid[finite & (values == 0)].tolist()
+
+        sign_change = (
+            finite[:-1] & finite[1:] & (values[:-1] * values[1:] < 0)
+        )
+        for index in np.flatnonzero(sign_change):
+            root = brentq(scalar, grid[index], grid[index + 1])
+            # Kutup (tan(x) gibi) isaret degistirir ama kok degildir
+            if converged(root):
+                candidates.append(root)
+
+        magnitude = np.where(finite, np.abs(values), np.inf)
+        local_minimum = (
+            (magnitude[1:-1] <= magnitude[:-2])
+            & (magnitude[1:-1] <= magnitude[2:])
+            & ~sign_change[:-1] & ~sign_change[1:]
+            & (magnitude[1:-1] > 0)
+        )
+        for index in np.flatnonzero(local_minimum) + 1:
+            # Teget kok f'in koku; isaret degisimi varsa brentq ile
+            # karesel yakinsama kaybi olmadan bulunur
+            left, right = grid[index - 1], grid[index + 1]
+            try:
+                if slope(left) * slope(right) < 0:
+                    root = brentq(slope, left, right)
+                else:
+                    root = newton(scalar, grid[index], fprime=slope)
+            except (RuntimeError, ArithmeticError, ValueError):
+                continue
+            if interval[0] <= root <= interval[1] and converged(root):
+                candidates.append(float(root))
+
+        return self._cluster([(complex(root), 1) for root in candidates],
+                             merge=False)
+
+    def _cluster(
+        self,
+        roots: List[Root],
+        merge: bool = True
+    ) -> List[Root]:
+        """Ayni koke yakinsayan degerleri birlestirir
+
+        Args:
+            roots: (kok, katlilik) listesi
+            merge: True ise yakin koklerin katliliklari toplanir,
+                False ise tekrar eden degerler atilir
+
+        Returns:
+            Gercel kokler once olmak uzere sirali (kok, katlilik) listesi
+        """
+        clustered: List[List[Any]] = []
+        for root, multiplicity in roots:
+            scale = max(1.0, abs(root))
+            if abs(root.imag) <= ROOT_TOLERANCE * scale:
+                root = complex(root.real, 0.0)
+            for entry in clustered:
+                if abs(entry[0] - root) <= CLUSTER_TOLERANCE * scale:
+                    if merge:
+                        entry[1] += multiplicity
+                    break
+            else:
+                clustered.append([root, multiplicity])
+        clustered.sort(key=lambda entry: (
+            entry[0].imag != 0, entry[0].real, entry[0].imag
+        ))
+        return [(root, multiplicity) for root, multiplicity in clustered]
+
+    def _build_response(
+        self,
+        roots: List[Root],
+        steps: List[str],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Kokleri gercel/karmasik ayrilmis Gemini formatina cevirir"""
+        variable = metadata["variable"]
+        real_roots: List[Dict[str, Any]] = []
+        complex_roots: List[Dict[str, Any]] = []
+        for root, multiplicity in roots:
+            real = round(root.real, ROUND_DECIMALS) + 0.0
+            imag = round(root.imag, ROUND_DECIMALS) + 0.0
+            if imag == 0:
+                real_roots.append(
+                    {"value": real, "multiplicity": multiplicity}
+                )
+                label = f"{variable} = {real:.10g}"
+            else:
+                complex_roots.append({
+                    "real": real,
+                    "imag": imag,
+                    "multiplicity": multiplicity,
+                })
+                sign = "+" if imag >= 0 else "-"
+                label = f"{variable} = {real:.10g} {sign} {abs(imag):.10g}i"
+            if multiplicity > 1:
+                label += f" (katlilik {multiplicity})"
+            steps.append(label)
+
+        if not roots:
+            steps.append("Kok bulunamadi")
+
+        real_values = [root["value"] for root in real_roots]
+        result: Any = real_values
+        if complex_roots:
+            result = {
+                "real": real_values,
+                "complex": [
+                    {"real": root["real"], "imag": root["imag"]}
+                    for root in complex_roots
+                ],
+            }
+        metadata.update({
+            "real_roots": real_roots,
+            "complex_roots": complex_roots,
+        })
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+            "metadata": metadata,
+        }
+
+    def _parse_interval(
+        self,
+        lower_text: str,
+        upper_text: str
+    ) -> Tuple[float, float]:
+        """Tarama araligini sayiya cevirir"""
+        lower = self.parser.to_number(self.parser.parse(lower_text))
+        upper = self.parser.to_number(self.parser.parse(upper_text))
+        if lower is None or upper is None or not (
+            np.isfinite(lower) and np.isfinite(upper) and lower < upper
+        ):
+            raise UnsupportedExpressionError("Gecersiz tarama araligi")
+        return lower, upper
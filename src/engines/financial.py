@@ -0,0 +1,540 @@
+"""Closed-form Decimal financial engine"""
+
+import re
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation, localcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.engines.base_engine import BaseEngine
+from src.utils.exceptions import UnsupportedExpressionError
+from src.utils.helpers import find_bracket_literals
+
+DECIMAL_PRECISION = 28
+MONEY_QUANTUM = Decimal("0.01")
+RATE_QUANTUM = Decimal("0.0000000001")
+IRR_TOLERANCE = Decimal("1e-20")
+IRR_MAX_ITERATIONS = 200
+MAX_RATE = Decimal(10)
+MAX_PERIODS = Decimal(36500)
+MAX_COMPOUNDING = Decimal(365)
+OVERFLOW_MESSAGE = (
+    "Hatalı işlem: Sonuç hesaplanamadı (sayısal sınırlar aşıldı)."
+)
+IRR_SCAN_POINTS = (
+    "-0.99", "-0.9", "-0.75", "-0.5", "-0.25", "-0.1", "0", "0.05", "0.1",
+    "0.15", "0.2", "0.3", "0.5", "0.75", "1", "1.5", "2", "3", "5", "10",
+)
+
+OPERATION_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("npv", re.compile(r"\b(?:npv|net\s+present\s+value|nbd)\b")),
+    ("irr", re.compile(r"\b(?:irr|internal\s+rate\s+of\s+return|ivo)\b")),
+    ("compound_interest", re.compile(
+        r"\b(?:compound(?:\s+interest)?|bilesik(?:\s+faiz)?)\b"
+    )),
+    ("loan_payment", re.compile(
+        r"\b(?:loan|payment|annuity|pmt|mortgage|kredi|taksit)\b"
+    )),
+    ("future_value", re.compile(r"\b(?:fv|future\s+value|gelecek\s+deger)\b")),
+    ("present_value", re.compile(
+        r"\b(?:pv|present\s+value|bugunku\s+deger)\b"
+    )),
+]
+PARAMETER_PATTERN = re.compile(
+    r"\b(?P<name>[a-z_]+)\s*[=:]\s*(?P<value>-?\d+(?:\.\d+)?)\s*(?P<pct>%)?"
+)
+CURRENCY_PATTERN = re.compile(r"\bcurrency\s*[=:]\s*(?P<code>[a-z]{3})\b")
+PARAMETER_ALIASES: Dict[str, str] = {
+    "rate": "rate",
+    "r": "rate",
+    "faiz": "rate",
+    "oran": "rate",
+    "principal": "principal",
+    "amount": "principal",
+    "anapara": "principal",
+    "tutar": "principal",
+    "p": "principal",
+    "pv": "principal",
+    "fv": "future_value",
+    "years": "years",
+    "year": "years",
+    "yil": "years",
+    "t": "years",
+    "months": "months",
+    "month": "months",
+    "ay": "months",
+    "periods": "periods",
+    "period": "periods",
+    "n": "n",
+    "vade": "periods",
+    "frequency": "frequency",
+    "compounding": "frequency",
+    "m": "frequency",
+}
+COMPOUNDING_NAMES: Dict[str, int] = {
+    "annually": 1,
+    "yearly": 1,
+    "semiannually": 2,
+    "quarterly": 4,
+    "monthly": 12,
+    "daily": 365,
+}
+KNOWN_WORDS = {
+    "npv", "net", "present", "value", "nbd", "irr", "internal", "rate",
+    "of", "return", "ivo", "compound", "interest", "bilesik", "faiz",
+    "loan", "payment", "annuity", "pmt", "mortgage", "kredi", "taksit",
+    "fv", "future", "gelecek", "deger", "pv", "bugunku", "cash", "flows",
+    "nakit", "akisi", "monthly", "with", "for", "at", "and",
+    *COMPOUNDING_NAMES,
+}
+
+FinancialOutput = Tuple[Decimal, List[str], Dict[str, Any]]
+
+
+class FinancialEngine(BaseEngine):
+    """NPV, IRR, kredi taksiti, FV/PV ve bilesik faizi Decimal ile hesaplar
+
+    Parametreler isimli verilir (``rate=10%``, ``principal=10000``,
+    ``years=5``); nakit akislari koseli parantez icinde yazilir. Oran
+    ``%`` isaretsiz ve 1'den buyukse yuzde olarak yorumlanir; isaretsiz
+    ``rate=1`` (%1 mi %100 mu) belirsiz sayilir. Isimsiz
+    konumsal argumanlar (ornek: "NPV 1000 0.1 5") belirsiz oldugu icin
+    Gemini'ye birakilir.
+    """
+
+    domain = "financial"
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Finansal hesaplamayi Decimal aritmetigiyle yapar
+
+        Args:
+            expression: Hesaplanacak ifade
+                (ornek: "npv rate=10% [-1000, 300, 400, 500]")
+            currency: Para birimi kodu (varsayilan: TRY)
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict (result Decimal)
+
+        Raises:
+            UnsupportedExpressionError: Ifade yorumlanamadi
+        """
+        text = expression.lower()
+        currency = str(kwargs.get("currency") or "TRY").upper()
+        currency_match = CURRENCY_PATTERN.search(text)
+        if currency_match:
+            currency = currency_match.group("code").upper()
+            text = text[:currency_match.start()] + text[currency_match.end():]
+
+        cash_flows, text = self._split_cash_flows(text)
+        operation = self._detect_operation(text)
+        parameters = self._parse_parameters(text)
+
+        handler: Callable[..., FinancialOutput] = getattr(
+            self, f"_{operation}"
+        )
+        with localcontext() as context:
+            context.prec = DECIMAL_PRECISION
+            try:
+                self._validate_rate(parameters)
+                result, steps, extra = handler(
+                    parameters, cash_flows, currency
+                )
+            except ValueError as e:
+                return {"error": f"Hatalı işlem: {e}", "steps": []}
+            except ArithmeticError:
+                return {"error": OVERFLOW_MESSAGE, "steps": []}
+
+        metadata: Dict[str, Any] = {
+            "operation": operation,
+            "currency": currency,
+        }
+        metadata.update(extra)
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+            "currency": currency,
+            "metadata": metadata,
+        }
+
+    def _split_cash_flows(
+        self,
+        text: str
+    ) -> Tuple[Optional[List[Decimal]], str]:
+        """Koseli parantezli nakit akislarini Decimal listesine cevirir"""
+        try:
+            spans = find_bracket_literals(text)
+        except ValueError as e:
+            raise UnsupportedExpressionError(str(e))
+        if not spans:
+            return None, text
+        if len(spans) > 1:
+            raise UnsupportedExpressionError("Tek nakit akisi listesi olmali")
+
+        start, end = spans[0]
+        items = [item.strip() for item in text[start + 1:end - 1].split(",")]
+        try:
+            cash_flows = [Decimal(item) for item in items if item]
+        except InvalidOperation:
+            raise UnsupportedExpressionError("Nakit akislari sayisal olmali")
+        if not cash_flows or not all(cf.is_finite() for cf in cash_flows):
+            raise UnsupportedExpressionError("Nakit akisi listesi bos")
+        return cash_flows, text[:start] + " " + text[end:]
+
+    def _detect_operation(self, text: str) -> str:
+        """Islem tipini anahtar kelimeden bulur"""
+        for operation, pattern in OPERATION_PATTERNS:
+            if pattern.search(PARAMETER_PATTERN.sub(" ", text)):
+                return operation
+        raise UnsupportedExpressionError("Finansal islem anahtar kelimesi yok")
+
+    def _parse_parameters(self, text: str) -> Dict[str, Decimal]:
+        """Isimli parametreleri Decimal olarak okur"""
+        parameters: Dict[str, Decimal] = {}
+        for match in PARAMETER_PATTERN.finditer(text):
+            name = PARAMETER_ALIASES.get(match.group("name"))
+            if name is None:
+                raise UnsupportedExpressionError(
+                    f"Taninmayan parametre: {match.group('name')}"
+                )
+            value = Decimal(match.group("value"))
+            if name == "rate" and not match.group("pct"):
+                # Yuzde isareti yoksa 1'den kucuk deger oran (0.05),
+                # buyuk deger yuzde (5); tam 1 hem %1 hem %100 olabilir
+                if value == 1:
+                    raise UnsupportedExpressionError(
+                        "Faiz orani belirsiz: rate=1 (ornek: rate=1%)"
+                    )
+                if value > 1:
+                    value = value / 100
+            elif name == "rate":
+                value = value / 100
+            parameters[name] = value
+
+        residual = PARAMETER_PATTERN.sub(" ", text)
+        for word in re.findall(r"[^\W\d_]+", residual):
+            if word in COMPOUNDING_NAMES:
+                parameters["frequency"] = Decimal(COMPOUNDING_NAMES[word])
+            elif word not in KNOWN_WORDS:
+                raise UnsupportedExpressionError(
+                    f"Taninmayan ifade parcasi: {word}"
+                )
+        if re.search(r"(?<![\w.=:])-?\d", residual):
+            raise UnsupportedExpressionError(
+                "Isimsiz sayisal arguman belirsiz (ornek: rate=10%)"
+            )
+        return parameters
+
+    def _require(
+        self,
+        parameters: Dict[str, Decimal],
+        *names: str
+    ) -> List[Decimal]:
+        """Zorunlu parametreleri dondurur, eksikse ifadeyi reddeder"""
+        missing = [name for name in names if name not in parameters]
+        if missing:
+            raise UnsupportedExpressionError(
+                f"Eksik parametre: {', '.join(missing)}"
+            )
+        return [parameters[name] for name in names]
+
+    @staticmethod
+    def _validate_rate(parameters: Dict[str, Decimal]) -> None:
+        """Faiz oraninin -%100 ile %1000 arasinda oldugunu dogrular"""
+        rate = parameters.get("rate")
+        if rate is not None and not -1 < rate <= MAX_RATE:
+            raise ValueError(
+                f"Faiz oranı -%100'den büyük ve en fazla "
+                f"%{MAX_RATE * 100:f} olmalı."
+            )
+
+    def _periods(
+        self,
+        parameters: Dict[str, Decimal],
+        frequency: Decimal
+    ) -> Decimal:
+        """Toplam donem sayisini years/months/periods'tan cikarir"""
+        if "periods" in parameters:
+            periods = parameters["periods"]
+        elif "months" in parameters:
+            periods = parameters["months"] * frequency / 12
+        elif "years" in parameters:
+            periods = parameters["years"] * frequency
+        else:
+            raise UnsupportedExpressionError(
+                "Eksik parametre: years, months veya periods"
+            )
+        if periods <= 0:
+            raise ValueError("Vade pozitif olmalı.")
+        if periods > MAX_PERIODS:
+            raise ValueError(
+                f"Dönem sayısı en fazla {MAX_PERIODS:f} olabilir."
+            )
+        return periods
+
+    @staticmethod
+    def _compounding(parameters: Dict[str, Decimal]) -> Decimal:
+        """Yillik bilesik sayisi (formuldeki n; varsayilan yillik)"""
+        frequency = parameters.get("frequency", parameters.get("n", 1))
+        if not 0 < frequency <= MAX_COMPOUNDING:
+            raise ValueError(
+                f"Bileşik sıklığı 0'dan büyük ve en fazla "
+                f"{MAX_COMPOUNDING:f} olmalı."
+            )
+        return Decimal(frequency)
+
+    @staticmethod
+    def _money(value: Decimal, currency: str) -> str:
+        """Tutari para birimiyle gosterir"""
+        quantized = value.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+        return f"{quantized:,} {currency}"
+
+    @staticmethod
+    def _percent(rate: Decimal) -> str:
+        """Orani yuzde olarak gosterir"""
+        return f"%{(rate * 100).quantize(RATE_QUANTUM).normalize():f}"
+
+    def _npv(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Net bugunku deger: Σ CF_t / (1 + r)^t, t = 0..n"""
+        (rate,) = self._require(parameters, "rate")
+        if not cash_flows:
+            raise UnsupportedExpressionError("NPV icin nakit akislari gerekli")
+
+        npv = self._net_present_value(rate, cash_flows)
+        steps = [
+            f"Iskonto orani: {self._percent(rate)}",
+            f"Nakit akislari (t=0..{len(cash_flows) - 1}): "
+            f"{[str(cf) for cf in cash_flows]}",
+            "NPV = Σ CF_t / (1 + r)^t",
+            f"NPV = {self._money(npv, currency)}",
+        ]
+        result = npv.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+        return result, steps, {"periods": len(cash_flows) - 1}
+
+    def _irr(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Ic verim orani: NPV(r) = 0 koku (braketli Newton)"""
+        if not cash_flows or len(cash_flows) < 2:
+            raise UnsupportedExpressionError("IRR icin nakit akislari gerekli")
+        if all(cf >= 0 for cf in cash_flows) or all(
+            cf <= 0 for cf in cash_flows
+        ):
+            raise ValueError(
+                "IRR için nakit akışlarında işaret değişimi olmalı."
+            )
+
+        brackets = self._irr_brackets(cash_flows)
+        if not brackets:
+            # Kok tarama araliginin (-%99..%1000) disinda kalabilir
+            raise UnsupportedExpressionError(
+                "IRR tarama araliginda bulunamadi"
+            )
+        lower, upper = brackets[0]
+        irr, iterations = self._safeguarded_newton(cash_flows, lower, upper)
+
+        steps = [
+            f"Nakit akislari: {[str(cf) for cf in cash_flows]}",
+            "IRR: NPV(r) = Σ CF_t / (1 + r)^t = 0 denkleminin koku",
+            f"Kok araligi: [{lower}, {upper}]",
+            f"Braketli Newton-Raphson {iterations} iterasyonda yakinsadi",
+            f"IRR = {self._percent(irr.quantize(RATE_QUANTUM))}",
+        ]
+        if len(brackets) > 1:
+            steps.append(
+                f"Uyari: {len(brackets)} farkli kok araligi var, "
+                "sifira en yakin kok secildi"
+            )
+        return irr.quantize(RATE_QUANTUM), steps, {"iterations": iterations}
+
+    def _loan_payment(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Anuite taksiti: P r / (1 - (1 + r)^-n)"""
+        principal, annual_rate = self._require(parameters, "principal", "rate")
+        frequency = self._compounding(
+            {"frequency": parameters.get("frequency", Decimal(12))}
+        )
+        if "n" in parameters:
+            parameters.setdefault("periods", parameters["n"])
+        periods = self._periods(parameters, frequency)
+        if periods != periods.to_integral_value():
+            raise ValueError(
+                f"Kredi vadesi tam sayı dönem olmalı "
+                f"(hesaplanan: {periods.normalize():f})."
+            )
+
+        rate = annual_rate / frequency
+        if rate == 0:
+            payment = principal / periods
+        else:
+            payment = principal * rate / (1 - (1 + rate) ** -periods)
+        total = payment * periods
+
+        steps = [
+            f"Anapara: {self._money(principal, currency)}",
+            f"Yillik faiz: {self._percent(annual_rate)}, "
+            f"donem faizi: r = {self._percent(rate)}",
+            f"Donem sayisi: n = {periods.normalize():f}",
+            "Taksit = P · r / (1 - (1 + r)^-n)",
+            f"Taksit = {self._money(payment, currency)}",
+            f"Toplam odeme = {self._money(total, currency)}, "
+            f"toplam faiz = {self._money(total - principal, currency)}",
+        ]
+        result = payment.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+        extra = {
+            "periods": f"{periods.normalize():f}",
+            "total_payment": str(total.quantize(MONEY_QUANTUM)),
+            "total_interest": str(
+                (total - principal).quantize(MONEY_QUANTUM)
+            ),
+        }
+        return result, steps, extra
+
+    def _future_value(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Gelecek deger: PV (1 + r/m)^(m t)"""
+        principal, annual_rate = self._require(parameters, "principal", "rate")
+        frequency = self._compounding(parameters)
+        periods = self._periods(parameters, frequency)
+
+        future_value = principal * (1 + annual_rate / frequency) ** periods
+        steps = [
+            f"Bugunku deger: {self._money(principal, currency)}",
+            f"Faiz: {self._percent(annual_rate)}, yilda "
+            f"{frequency.normalize():f} kez, {periods.normalize():f} donem",
+            "FV = PV · (1 + r/m)^(m·t)",
+            f"FV = {self._money(future_value, currency)}",
+        ]
+        result = future_value.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+        return result, steps, {"periods": f"{periods.normalize():f}"}
+
+    def _present_value(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Bugunku deger: FV / (1 + r/m)^(m t)"""
+        future_value, annual_rate = self._require(
+            parameters, "future_value", "rate"
+        )
+        frequency = self._compounding(parameters)
+        periods = self._periods(parameters, frequency)
+
+        present_value = future_value / (
+            (1 + annual_rate / frequency) ** periods
+        )
+        steps = [
+            f"Gelecek deger: {self._money(future_value, currency)}",
+            f"Faiz: {self._percent(annual_rate)}, yilda "
+            f"{frequency.normalize():f} kez, {periods.normalize():f} donem",
+            "PV = FV / (1 + r/m)^(m·t)",
+            f"PV = {self._money(present_value, currency)}",
+        ]
+        result = present_value.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+        return result, steps, {"periods": f"{periods.normalize():f}"}
+
+    def _compound_interest(
+        self,
+        parameters: Dict[str, Decimal],
+        cash_flows: Optional[List[Decimal]],
+        currency: str
+    ) -> FinancialOutput:
+        """Bilesik faiz getirisi: FV - PV"""
+        future_value, steps, extra = self._future_value(
+            parameters, cash_flows, currency
+        )
+        interest = future_value - parameters["principal"]
+        steps.append(
+            f"Bilesik faiz = FV - PV = {self._money(interest, currency)}"
+        )
+        extra["future_value"] = str(future_value)
+        return interest, steps, extra
+
+    def _net_present_value(
+        self,
+        rate: Decimal,
+        cash_flows: List[Decimal]
+    ) -> Decimal:
+        """NPV(r) (Horner semasi ile)"""
+        discount = 1 / (1 + rate)
+        total = Decimal(0)
+        for cash_flow in reversed(cash_flows):
+            total = total * discount + cash_flow
+        return total
+
+    def _npv_derivative(
+        self,
+        rate: Decimal,
+        cash_flows: List[Decimal]
+    ) -> Decimal:
+        """dNPV/dr = Σ -t CF_t / (1 + r)^(t+1)"""
+        base = 1 + rate
+        return sum(
+            (-t * cf / base ** (t + 1) for t, cf in enumerate(cash_flows)),
+            Decimal(0),
+        )
+
+    def _irr_brackets(
+        self,
+        cash_flows: List[Decimal]
+    ) -> List[Tuple[Decimal, Decimal]]:
+        """NPV'nin isaret degistirdigi oran araliklarini bulur"""
+        points = [Decimal(point) for point in IRR_SCAN_POINTS]
+        values = [self._net_present_value(p, cash_flows) for p in points]
+        brackets = []
+        for index in range(len(points) - 1):
+            if values[index] == 0:
+                brackets.append((points[index], points[index]))
+            elif values[index] * values[index + 1] < 0:
+                brackets.append((points[index], points[index + 1]))
+        # Sifira en yakin (ekonomik olarak anlamli) kok once
+        brackets.sort(key=lambda bracket: abs(bracket[0] + bracket[1]))
+        return brackets
+
+    def _safeguarded_newton(
+        self,
+        cash_flows: List[Decimal],
+        lower: Decimal,
+        upper: Decimal
+    ) -> Tuple[Decimal, int]:
+        """Bracket disina cikan Newton adimlarini bisection ile degistirir"""
+        if lower == upper:
+            return lower, 0
+
+        f_lower = self._net_present_value(lower, cash_flows)
+        rate = (lower + upper) / 2
+        for iteration in range(1, IRR_MAX_ITERATIONS + 1):
+            value = self._net_present_value(rate, cash_flows)
+            if value == 0:
+                return rate, iteration
+            if (value < 0) == (f_lower < 0):
+                lower, f_lower = rate, value
+            else:
+                upper = rate
+
+            derivative = self._npv_derivative(rate, cash_flows)
+            candidate = rate - value / derivative if derivative else None
+            if candidate is None or not lower < candidate < upper:
+                candidate = (lower + upper) / 2
+            if abs(candidate - rate) < IRR_TOLERANCE:
+                return candidate, iteration
+            rate = candidate
+        raise ValueError("IRR yakınsamadı.")
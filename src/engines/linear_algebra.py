@@ -0,0 +1,266 @@
+"""NumPy backed linear algebra engine"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.engines.base_engine import BaseEngine
+from src.engines.numeric import clean_array
+from src.utils.exceptions import UnsupportedExpressionError
+from src.utils.helpers import find_bracket_literals, parse_matrix_string
+
+MATRIX_PLACEHOLDER = "M"
+NON_FINITE_MESSAGE = (
+    "Hatalı işlem: Sonuç sayısal sınırları aşıyor (sonsuz veya tanımsız)."
+)
+
+
+class LinearAlgebraEngine(BaseEngine):
+    """Matris literal'lerini parse edip numpy.linalg ile hesaplayan motor"""
+
+    domain = "linear_algebra"
+
+    BINARY_OPERATORS: Dict[str, str] = {
+        "*": "multiply",
+        "@": "multiply",
+        "·": "multiply",
+        "×": "multiply",
+        "+": "add",
+        "-": "subtract",
+    }
+    KEYWORDS: Dict[str, str] = {
+        "multiply": "multiply",
+        "product": "multiply",
+        "carp": "multiply",
+        "transpose": "transpose",
+        "devrik": "transpose",
+        "determinant": "determinant",
+        "det": "determinant",
+        "inverse": "inverse",
+        "inv": "inverse",
+        "ters": "inverse",
+        "rank": "rank",
+        "eigenvalues": "eigenvalues",
+        "eigenvalue": "eigenvalues",
+        "eigen": "eigenvalues",
+        "ozdeger": "eigenvalues",
+        "norm": "norm",
+        "solve": "solve",
+        "coz": "solve",
+    }
+    OPERAND_COUNTS: Dict[str, int] = {
+        "multiply": 2,
+        "add": 2,
+        "subtract": 2,
+        "solve": 2,
+        "transpose": 1,
+        "determinant": 1,
+        "inverse": 1,
+        "rank": 1,
+        "eigenvalues": 1,
+        "norm": 1,
+    }
+    NORM_ORDERS: Dict[str, Any] = {
+        "fro": "fro",
+        "nuc": "nuc",
+        "inf": np.inf,
+        "1": 1,
+        "2": 2,
+    }
+    SYMBOLS: Dict[str, str] = {
+        "multiply": "A · B",
+        "add": "A + B",
+        "subtract": "A - B",
+        "solve": "A x = b",
+        "transpose": "A^T",
+        "determinant": "det(A)",
+        "inverse": "A^-1",
+        "rank": "rank(A)",
+        "eigenvalues": "eig(A)",
+        "norm": "||A||",
+    }
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Matris/vektor islemini numpy ile hesaplar
+
+        Args:
+            expression: Hesaplanacak ifade
+                (ornek: "[[1,2],[3,4]] * [[5],[6]]", "det [[1,2],[3,4]]")
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Ifade yorumlanamadi
+        """
+        operation, operands, norm_order = self._parse(expression)
+
+        expected = self.OPERAND_COUNTS[operation]
+        if len(operands) != expected:
+            raise UnsupportedExpressionError(
+                f"{operation} icin {expected} operand gerekli, "
+                f"{len(operands)} bulundu"
+            )
+
+        names = ["A", "B"] if operation != "solve" else ["A", "b"]
+        steps = [
+            f"{name} = {clean_array(matrix)} "
+            f"(boyut: {'x'.join(str(d) for d in matrix.shape)})"
+            for name, matrix in zip(names, operands)
+        ]
+        steps.append(f"Islem: {self.SYMBOLS[operation]}")
+
+        try:
+            with np.errstate(over="ignore", invalid="ignore"):
+                value = self._compute(operation, operands, norm_order)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            return {
+                "error": self._error_message(e, operands),
+                "steps": steps,
+            }
+        if not np.all(np.isfinite(value)):
+            return {"error": NON_FINITE_MESSAGE, "steps": steps}
+
+        result = self._to_result(value)
+        steps.append(f"numpy.linalg ile hesaplandi: {result}")
+
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+            "metadata": {
+                "operation": operation,
+                "shapes": [list(matrix.shape) for matrix in operands],
+            },
+        }
+
+    def _parse(
+        self,
+        expression: str
+    ) -> Tuple[str, List[np.ndarray], Optional[Any]]:
+        """Ifadeden islem adini ve operand matrislerini cikarir"""
+        try:
+            spans = find_bracket_literals(expression)
+        except ValueError as e:
+            raise UnsupportedExpressionError(str(e))
+        if not spans:
+            raise UnsupportedExpressionError("Matris literal'i bulunamadi")
+
+        operands = [
+            self._to_array(expression[start:end]) for start, end in spans
+        ]
+
+        residual_parts = []
+        cursor = 0
+        for start, end in spans:
+            residual_parts.append(expression[cursor:start].lower())
+            residual_parts.append(f" {MATRIX_PLACEHOLDER} ")
+            cursor = end
+        residual_parts.append(expression[cursor:].lower())
+        residual = "".join(residual_parts)
+        tokens = [
+            token for token in re.split(r"[\s,:=()]+", residual) if token
+        ]
+
+        if (len(tokens) == 3 and tokens[0] == tokens[2] == MATRIX_PLACEHOLDER
+                and tokens[1] in self.BINARY_OPERATORS):
+            return self.BINARY_OPERATORS[tokens[1]], operands, None
+
+        words = [token for token in tokens if token != MATRIX_PLACEHOLDER]
+        operation = None
+        norm_order = None
+        for word in words:
+            if word in self.KEYWORDS and operation is None:
+                operation = self.KEYWORDS[word]
+            elif word in self.NORM_ORDERS and operation == "norm":
+                norm_order = self.NORM_ORDERS[word]
+            elif word not in ("of", "the", "matrix", "matris", "ord"):
+                raise UnsupportedExpressionError(
+                    f"Taninmayan ifade parcasi: {word}"
+                )
+
+        if operation is None:
+            raise UnsupportedExpressionError("Islem anahtar kelimesi yok")
+        return operation, operands, norm_order
+
+    def _to_array(self, literal: str) -> np.ndarray:
+        """Matris literal'ini float64 numpy dizisine cevirir"""
+        try:
+            values = parse_matrix_string(literal)
+            array = np.array(values, dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            raise UnsupportedExpressionError(f"Matris parse edilemedi: {e}")
+
+        if array.ndim not in (1, 2) or array.size == 0:
+            raise UnsupportedExpressionError(
+                "Sadece bos olmayan vektor ve matrisler destekleniyor"
+            )
+        return array
+
+    def _compute(
+        self,
+        operation: str,
+        operands: List[np.ndarray],
+        norm_order: Optional[Any]
+    ) -> Any:
+        """Islemi numpy/numpy.linalg ile calistirir"""
+        first = operands[0]
+        if operation in ("add", "subtract") and (
+            first.shape != operands[1].shape
+        ):
+            # numpy broadcasting farkli boyutlari sessizce genisletir
+            raise ValueError("operand shapes do not match")
+        if operation == "multiply":
+            return np.matmul(first, operands[1])
+        if operation == "add":
+            return np.add(first, operands[1])
+        if operation == "subtract":
+            return np.subtract(first, operands[1])
+        if operation == "transpose":
+            return first.T
+        if operation == "determinant":
+            return np.linalg.det(first)
+        if operation == "inverse":
+            return np.linalg.inv(first)
+        if operation == "rank":
+            return np.linalg.matrix_rank(first)
+        if operation == "eigenvalues":
+            return np.linalg.eigvals(first)
+        if operation == "norm":
+            if first.ndim == 1 and isinstance(norm_order, str):
+                norm_order = None
+            return np.linalg.norm(first, ord=norm_order)
+        return np.linalg.solve(first, operands[1])
+
+    def _to_result(self, value: Any) -> Any:
+        """numpy sonucunu CalculationResult uyumlu tipe cevirir"""
+        array = np.asarray(value)
+        if np.iscomplexobj(array):
+            if np.allclose(array.imag, 0.0):
+                array = array.real
+            else:
+                return {
+                    "real": clean_array(array.real),
+                    "imag": clean_array(array.imag),
+                }
+        return clean_array(array.astype(np.float64))
+
+    def _error_message(
+        self,
+        error: Exception,
+        operands: List[np.ndarray]
+    ) -> str:
+        """numpy hatasini kullanici dostu mesaja cevirir"""
+        message = str(error).lower()
+        if "singular" in message:
+            return "Hatalı işlem: Matris tekil (determinant 0), tersi yok."
+        if "square" in message:
+            return "Hatalı işlem: Bu işlem için kare matris gerekli."
+        shapes = ", ".join(
+            "x".join(str(d) for d in matrix.shape) for matrix in operands
+        )
+        return f"Hatalı işlem: Matris boyutları uyumsuz ({shapes})."
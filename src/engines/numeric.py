@@ -0,0 +1,46 @@
+"""Shared NumPy helpers for the local engines"""
+
+from typing import Any
+
+import numpy as np
+
+ROUND_DECIMALS = 10
+
+
+def clean_array(values: np.ndarray) -> Any:
+    """Float gurultusunu temizleyip JSON uyumlu listeye/sayiya cevirir"""
+    rounded = np.round(values, ROUND_DECIMALS) + 0.0
+    if rounded.ndim == 0:
+        return float(rounded)
+    return rounded.tolist()
+
+
+def parse_vector(literal: str) -> np.ndarray:
+    """Duz "[1, 2, 3]" listesini contiguous float64 diziye cevirir
+
+    ``ast.literal_eval`` yerine dogrudan ``float`` donusumu kullanilir;
+    binlerce elemanli veri setlerinde parse maliyeti boylece dusuk kalir.
+
+    Args:
+        literal: Koseli parantezli sayi listesi
+
+    Returns:
+        1 boyutlu float64 numpy dizisi
+
+    Raises:
+        ValueError: Liste duz degil, bos ya da sayisal olmayan eleman var
+    """
+    literal = literal.strip()
+    if not (literal.startswith("[") and literal.endswith("]")):
+        raise ValueError("Veri seti koseli parantez icinde olmali")
+
+    inner = literal[1:-1]
+    if "[" in inner or not inner.strip():
+        raise ValueError("Veri seti bos olmayan duz bir liste olmali")
+
+    values = np.fromiter(
+        map(float, inner.split(",")), dtype=np.float64
+    )
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Veri seti sonlu sayilardan olusmali")
+    return np.ascontiguousarray(values)
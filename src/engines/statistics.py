@@ -0,0 +1,392 @@
+"""Vectorized NumPy statistics engine"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.engines.base_engine import BaseEngine
+from src.engines.numeric import clean_array, parse_vector
+from src.utils.exceptions import UnsupportedExpressionError
+from src.utils.helpers import find_bracket_literals
+
+PREVIEW_SIZE = 10
+
+# Sira onemli: "z-score 75 mean=70 std=5" hem z-score hem mean/std icerir
+STATISTIC_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("z-score", re.compile(r"\bz[\s-]?(?:score|skor)\b")),
+    ("percentile", re.compile(r"\b(?:percentile|yuzdelik)\b")),
+    ("regression", re.compile(r"\b(?:regression|regresyon)\b")),
+    ("correlation", re.compile(r"\b(?:correlation|korelasyon|corr)\b")),
+    ("std_dev", re.compile(
+        r"\b(?:std\s*dev|stdev|std|standard\s+deviation|standart\s+sapma)\b"
+    )),
+    ("variance", re.compile(r"\b(?:variance|varyans|var)\b")),
+    ("median", re.compile(r"\b(?:median|medyan)\b")),
+    ("mode", re.compile(r"\b(?:mode|mod)\b")),
+    ("mean", re.compile(r"\b(?:mean|average|avg|ortalama)\b")),
+]
+PARAMETER_PATTERN = re.compile(
+    r"\b(?P<name>mean|mu|std|sigma)\s*=\s*(?P<value>-?\d+(?:\.\d+)?)"
+)
+NUMBER_PATTERN = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+POPULATION_PATTERN = re.compile(r"\b(?:population|populasyon|pop)\b")
+KNOWN_WORDS = {
+    "z", "score", "skor", "percentile", "yuzdelik", "regression",
+    "regresyon", "correlation", "korelasyon", "corr", "std", "dev",
+    "stdev", "standard", "deviation", "standart", "sapma", "variance",
+    "varyans", "var", "median", "medyan", "mode", "mod", "mean",
+    "average", "avg", "ortalama", "of", "the", "for", "and", "data",
+    "dataset", "veri", "seti", "sample", "orneklem", "population",
+    "populasyon", "pop",
+}
+NUMERIC_ARGUMENT_STATISTICS = {"z-score", "percentile"}
+
+StatisticOutput = Tuple[Any, List[str], Dict[str, Any]]
+
+
+class StatisticsEngine(BaseEngine):
+    """Bracket'li veri setlerini float64 dizilerde vektorel isleyen motor
+
+    Varsayilan olarak standart sapma ve varyans orneklem (ddof=1)
+    formuluyle hesaplanir; ifadede "population" geciyorsa ddof=0
+    kullanilir.
+    """
+
+    domain = "statistics"
+
+    def evaluate(self, expression: str, **kwargs) -> Dict[str, Any]:
+        """Istatistiksel islemi numpy ile hesaplar
+
+        Args:
+            expression: Istatistiksel islem (ornek: "mean [1,2,3,4,5]")
+            **kwargs: Ek parametreler
+
+        Returns:
+            Gemini yaniti formatinda dict
+
+        Raises:
+            UnsupportedExpressionError: Ifade yorumlanamadi
+        """
+        datasets, residual = self._split_datasets(expression)
+        statistic_type = self._detect_statistic(residual)
+        population = bool(POPULATION_PATTERN.search(residual))
+        parameters = {
+            match.group("name"): float(match.group("value"))
+            for match in PARAMETER_PATTERN.finditer(residual)
+        }
+        residual = PARAMETER_PATTERN.sub(" ", residual)
+        numbers = [float(n) for n in NUMBER_PATTERN.findall(residual)]
+        self._check_residual(NUMBER_PATTERN.sub(" ", residual))
+        if numbers and statistic_type not in NUMERIC_ARGUMENT_STATISTICS:
+            raise UnsupportedExpressionError(
+                f"{statistic_type} icin beklenmeyen sayi: {numbers}"
+            )
+
+        handler = getattr(self, f"_{statistic_type.replace('-', '_')}")
+        try:
+            result, steps, extra = handler(
+                datasets, numbers, parameters, population
+            )
+        except ValueError as e:
+            return {"error": f"Hatalı işlem: {e}", "steps": []}
+
+        metadata: Dict[str, Any] = {"statistic_type": statistic_type}
+        if datasets:
+            metadata["sample_size"] = len(datasets[0])
+            metadata["data_points"] = sum(len(data) for data in datasets)
+        metadata.update(extra)
+
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": self.domain,
+            "confidence_score": 1.0,
+            "metadata": metadata,
+        }
+
+    def _split_datasets(
+        self,
+        expression: str
+    ) -> Tuple[List[np.ndarray], str]:
+        """Veri setlerini ve geriye kalan komut metnini ayirir"""
+        try:
+            spans = find_bracket_literals(expression)
+            datasets = [
+                parse_vector(expression[start:end]) for start, end in spans
+            ]
+        except ValueError as e:
+            raise UnsupportedExpressionError(f"Veri seti okunamadi: {e}")
+
+        residual_parts = []
+        cursor = 0
+        for start, end in spans:
+            residual_parts.append(expression[cursor:start])
+            cursor = end
+        residual_parts.append(expression[cursor:])
+        return datasets, " ".join(residual_parts).lower()
+
+    def _detect_statistic(self, residual: str) -> str:
+        """Komut metninden istatistik tipini bulur"""
+        for statistic_type, pattern in STATISTIC_PATTERNS:
+            if pattern.search(residual):
+                return statistic_type
+        raise UnsupportedExpressionError("Istatistik anahtar kelimesi yok")
+
+    def _check_residual(self, residual: str) -> None:
+        """Taninmayan kelime varsa ifadeyi reddeder"""
+        for word in re.findall(r"[^\W\d_]+", residual):
+            if word not in KNOWN_WORDS:
+                raise UnsupportedExpressionError(
+                    f"Taninmayan ifade parcasi: {word}"
+                )
+
+    def _single_dataset(
+        self,
+        datasets: List[np.ndarray],
+        minimum: int = 1
+    ) -> np.ndarray:
+        """Tek veri seti bekleyen islemler icin dogrulama"""
+        if len(datasets) != 1:
+            raise UnsupportedExpressionError(
+                f"Tek veri seti bekleniyordu, {len(datasets)} bulundu"
+            )
+        data = datasets[0]
+        if len(data) < minimum:
+            raise ValueError(f"En az {minimum} veri noktasi gerekli.")
+        return data
+
+    def _describe(self, data: np.ndarray) -> str:
+        """Veri setinin kisa gosterimi (buyuk setlerde kisaltilir)"""
+        preview = ", ".join(
+            f"{value:g}" for value in data[:PREVIEW_SIZE]
+        )
+        if len(data) > PREVIEW_SIZE:
+            preview += ", ..."
+        return f"[{preview}] (n={len(data)})"
+
+    def _mean(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Aritmetik ortalama"""
+        data = self._single_dataset(datasets)
+        total = float(np.sum(data))
+        mean = clean_array(np.mean(data))
+        steps = [
+            f"Veri seti: {self._describe(data)}",
+            f"Toplam = {total:g}",
+            f"Ortalama = {total:g} / {len(data)} = {mean:g}",
+        ]
+        return mean, steps, {}
+
+    def _median(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Medyan"""
+        data = self._single_dataset(datasets)
+        median = clean_array(np.median(data))
+        steps = [
+            f"Veri seti: {self._describe(data)}",
+            f"Siralanmis veri: {self._describe(np.sort(data))}",
+            f"Medyan = {median:g}",
+        ]
+        return median, steps, {}
+
+    def _mode(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Mod (birden fazla olabilir)"""
+        data = self._single_dataset(datasets)
+        values, counts = np.unique(data, return_counts=True)
+        modes = clean_array(values[counts == counts.max()])
+        frequency = int(counts.max())
+        steps = [
+            f"Veri seti: {self._describe(data)}",
+            f"En yuksek frekans: {frequency}",
+            f"Mod: {', '.join(f'{mode:g}' for mode in modes)}",
+        ]
+        result = modes[0] if len(modes) == 1 else modes
+        return result, steps, {"frequency": frequency}
+
+    def _variance(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Orneklem veya populasyon varyansi"""
+        ddof = 0 if population else 1
+        data = self._single_dataset(datasets, minimum=ddof + 1)
+        mean = float(np.mean(data))
+        squared = float(np.sum((data - mean) ** 2))
+        variance = clean_array(np.var(data, ddof=ddof))
+        divisor = len(data) - ddof
+        kind = "Populasyon" if population else "Orneklem"
+        steps = [
+            f"Veri seti: {self._describe(data)}",
+            f"Ortalama = {mean:g}",
+            f"Kareler toplami Σ(x - x̄)^2 = {squared:g}",
+            f"{kind} varyansi = {squared:g} / {divisor} = {variance:g}",
+        ]
+        return variance, steps, {"ddof": ddof}
+
+    def _std_dev(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Standart sapma (varyansin karekoku)"""
+        variance, steps, extra = self._variance(
+            datasets, numbers, parameters, population
+        )
+        std_dev = clean_array(np.sqrt(variance))
+        steps.append(f"Standart sapma = sqrt({variance:g}) = {std_dev:g}")
+        return std_dev, steps, extra
+
+    def _correlation(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Pearson korelasyon katsayisi"""
+        x, y = self._paired_datasets(datasets)
+        if np.ptp(y) == 0:
+            raise ValueError("Sabit veri setinde korelasyon tanimsiz.")
+        correlation = clean_array(np.corrcoef(x, y)[0, 1])
+        steps = [
+            f"X veri seti: {self._describe(x)}",
+            f"Y veri seti: {self._describe(y)}",
+            "Pearson korelasyon katsayisi: r = cov(X, Y) / (σx σy)",
+            f"r = {correlation:g}",
+        ]
+        return correlation, steps, {}
+
+    def _regression(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Basit lineer regresyon (en kucuk kareler)"""
+        x, y = self._paired_datasets(datasets)
+        slope, intercept = np.polyfit(x, y, 1)
+        predicted = slope * x + intercept
+        residual_sum = float(np.sum((y - predicted) ** 2))
+        total_sum = float(np.sum((y - np.mean(y)) ** 2))
+        r_squared = 1.0 - residual_sum / total_sum if total_sum else 1.0
+        result = {
+            "slope": clean_array(slope),
+            "intercept": clean_array(intercept),
+            "r_squared": clean_array(np.float64(r_squared)),
+        }
+        steps = [
+            f"X veri seti: {self._describe(x)}",
+            f"Y veri seti: {self._describe(y)}",
+            "En kucuk kareler ile y = a x + b",
+            f"a (egim) = {result['slope']:g}, "
+            f"b (kesisim) = {result['intercept']:g}",
+            f"R^2 = {result['r_squared']:g}",
+        ]
+        return result, steps, {}
+
+    def _z_score(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Z-skor (parametrelerden veya veri setinden)"""
+        if len(numbers) != 1:
+            raise UnsupportedExpressionError(
+                "Z-skor icin tek x degeri gerekli"
+            )
+        x = numbers[0]
+        mean: Optional[float] = parameters.get(
+            "mean", parameters.get("mu")
+        )
+        std: Optional[float] = parameters.get(
+            "std", parameters.get("sigma")
+        )
+        steps = []
+        if datasets:
+            data = self._single_dataset(datasets, minimum=2)
+            ddof = 0 if population else 1
+            mean = float(np.mean(data)) if mean is None else mean
+            std = float(np.std(data, ddof=ddof)) if std is None else std
+            steps.append(f"Veri seti: {self._describe(data)}")
+        if mean is None or std is None:
+            raise UnsupportedExpressionError(
+                "Z-skor icin mean ve std (veya veri seti) gerekli"
+            )
+        if std == 0:
+            raise ValueError("Standart sapma sifir olamaz.")
+
+        z_score = clean_array(np.float64((x - mean) / std))
+        steps.extend([
+            "Z-score formulu: z = (x - μ) / σ",
+            f"z = ({x:g} - {mean:g}) / {std:g}",
+            f"z = {z_score:g}",
+        ])
+        return z_score, steps, {"mean": mean, "std_dev": std}
+
+    def _percentile(
+        self,
+        datasets: List[np.ndarray],
+        numbers: List[float],
+        parameters: Dict[str, float],
+        population: bool
+    ) -> StatisticOutput:
+        """Dogrusal interpolasyonlu yuzdelik"""
+        data = self._single_dataset(datasets)
+        if len(numbers) != 1:
+            raise UnsupportedExpressionError(
+                "Percentile icin tek yuzdelik degeri gerekli"
+            )
+        rank = numbers[0]
+        if not 0 <= rank <= 100:
+            raise ValueError("Yuzdelik 0 ile 100 arasinda olmali.")
+        value = clean_array(np.percentile(data, rank))
+        steps = [
+            f"Veri seti: {self._describe(data)}",
+            "Dogrusal interpolasyon ile yuzdelik hesaplaniyor",
+            f"{rank:g}. yuzdelik = {value:g}",
+        ]
+        return value, steps, {"percentile": rank}
+
+    def _paired_datasets(
+        self,
+        datasets: List[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Iki esit uzunluklu veri seti bekleyen islemler icin dogrulama"""
+        if len(datasets) != 2:
+            raise UnsupportedExpressionError(
+                f"Iki veri seti bekleniyordu, {len(datasets)} bulundu"
+            )
+        x, y = datasets
+        if len(x) != len(y):
+            raise ValueError("Veri setleri ayni uzunlukta olmali.")
+        if len(x) < 2:
+            raise ValueError("En az 2 veri noktasi gerekli.")
+        if np.ptp(x) == 0:
+            raise ValueError("X veri seti sabit olamaz.")
+        return x, y
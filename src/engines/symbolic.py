@@ -0,0 +1,322 @@
+"""Safe SymPy expression parsing shared by the symbolic engines"""
+
+import math
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.engines.arithmetic import MAX_POWER_RESULT_DIGITS
+from src.engines.base_engine import BaseEngine
+from src.utils.cache import LRUCache
+from src.utils.exceptions import UnsupportedExpressionError
+
+ALLOWED_CHARACTERS = re.compile(r"^[0-9A-Za-z_+\-*/^().,\s]+$")
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+# Nokta sadece ondalik sayilarda kabul edilir ("2.5", ".5"); "pi.n(...)"
+# gibi attribute erisimi SymPy metotlarini cagirabilir
+ATTRIBUTE_ACCESS_PATTERN = re.compile(r"(?<=[A-Za-z_)\]])\.|\.(?!\d)")
+# Sayisal us siniri; "9^9^9" gibi us kuleleri parse sirasinda tam sayi
+# olarak hesaplanip worker thread'i dakikalarca mesgul eder
+MAX_SYMBOLIC_EXPONENT = 10_000
+
+FUNCTION_ALIASES: Dict[str, str] = {
+    "sin": "sin",
+    "cos": "cos",
+    "tan": "tan",
+    "cot": "cot",
+    "sec": "sec",
+    "csc": "csc",
+    "asin": "asin",
+    "acos": "acos",
+    "atan": "atan",
+    "arcsin": "asin",
+    "arccos": "acos",
+    "arctan": "atan",
+    "sinh": "sinh",
+    "cosh": "cosh",
+    "tanh": "tanh",
+    "exp": "exp",
+    "log": "log",
+    "ln": "log",
+    "sqrt": "sqrt",
+    "abs": "Abs",
+}
+CONSTANT_ALIASES: Dict[str, str] = {
+    "pi": "pi",
+    "e": "E",
+    "oo": "oo",
+    "inf": "oo",
+    "infinity": "oo",
+}
+UNICODE_REPLACEMENTS: Dict[str, str] = {
+    "π": "pi",
+    "∞": "oo",
+    "−": "-",
+    "×": "*",
+    "·": "*",
+    "÷": "/",
+}
+
+
+def load_sympy() -> Any:
+    """SymPy modulunu ilk kullanimda import eder
+
+    Moduller motorlara ``sympy_loader`` olarak verir; SymPy'nin yavas
+    importu yerel motor ilk kez kullanilana kadar ertelenir.
+    """
+    import sympy
+
+    return sympy
+
+
+class SymbolicParser:
+    """Kullanici ifadelerini whitelist kontrolu ile SymPy'ye cevirir
+
+    ``parse_expr`` ifadeyi Python olarak degerlendirdigi icin ifade
+    once karakter ve tanimlayici whitelist'inden gecirilir: sadece
+    bilinen fonksiyonlar, sabitler ve tek harfli degiskenler kabul
+    edilir; nokta sadece ondalik sayilarda kullanilabilir (attribute
+    erisimi yok). Ifade once degerlendirilmeden parse edilip us
+    buyuklukleri kontrol edilir; sinir asan uslu sayilar hesaplanmadan
+    reddedilir. Parse edilen ifadeler normalize edilmis metin anahtariyla
+    LRU cache'te tutulur.
+    """
+
+    def __init__(
+        self,
+        sympy_loader: Callable[[], Any],
+        cache_size: int = 256
+    ):
+        """Parser'i baslatir
+
+        Args:
+            sympy_loader: SymPy modulunu donduren (lazy) fonksiyon
+            cache_size: Parse cache'inin maksimum eleman sayisi
+        """
+        self._sympy_loader = sympy_loader
+        self.cache = LRUCache(cache_size)
+
+    @property
+    def sympy(self) -> Any:
+        """SymPy modulunu ilk kullanimda yukler"""
+        return self._sympy_loader()
+
+    @staticmethod
+    def canonical_text(text: str) -> str:
+        """Unicode operatorleri ve bosluklari normalize eder"""
+        for source, target in UNICODE_REPLACEMENTS.items():
+            text = text.replace(source, target)
+        return " ".join(text.split())
+
+    def parse(self, text: str) -> Any:
+        """Ifadeyi SymPy nesnesine cevirir (cache'li)
+
+        Args:
+            text: Matematiksel ifade (ornek: "x^2 sin(x)")
+
+        Returns:
+            SymPy ifadesi
+
+        Raises:
+            UnsupportedExpressionError: Ifade guvenli sekilde parse edilemez
+        """
+        canonical = self.canonical_text(text)
+        cached = self.cache.get(canonical)
+        if cached is not None:
+            return cached
+
+        expression = self._parse_uncached(canonical)
+        self.cache.put(canonical, expression)
+        return expression
+
+    def _parse_uncached(self, text: str) -> Any:
+        """Whitelist kontrolunden sonra parse_expr cagirir"""
+        if not text or not ALLOWED_CHARACTERS.match(text):
+            raise UnsupportedExpressionError(
+                f"Sembolik ifade desteklenmeyen karakter iceriyor: {text}"
+            )
+        if ATTRIBUTE_ACCESS_PATTERN.search(text):
+            raise UnsupportedExpressionError(
+                f"Sembolik ifadede attribute erisimi desteklenmiyor: {text}"
+            )
+
+        sympy = self.sympy
+        local_dict: Dict[str, Any] = {}
+        for name in set(IDENTIFIER_PATTERN.findall(text)):
+            if name in FUNCTION_ALIASES:
+                local_dict[name] = getattr(sympy, FUNCTION_ALIASES[name])
+            elif name in CONSTANT_ALIASES:
+                local_dict[name] = getattr(sympy, CONSTANT_ALIASES[name])
+            elif len(name) == 1:
+                local_dict[name] = sympy.Symbol(name)
+            else:
+                raise UnsupportedExpressionError(
+                    f"Taninmayan sembol: {name}"
+                )
+
+        from sympy.parsing.sympy_parser import (
+            convert_xor,
+            implicit_multiplication_application,
+            parse_expr,
+            standard_transformations,
+        )
+
+        transformations = standard_transformations + (
+            implicit_multiplication_application,
+            convert_xor,
+        )
+        try:
+            self._check_powers(parse_expr(
+                text,
+                local_dict=local_dict,
+                transformations=transformations,
+                evaluate=False,
+            ))
+            expression = parse_expr(
+                text,
+                local_dict=local_dict,
+                transformations=transformations,
+            )
+        except UnsupportedExpressionError:
+            raise
+        except Exception as e:
+            raise UnsupportedExpressionError(
+                f"Sembolik ifade parse edilemedi: {e}"
+            )
+
+        if not isinstance(expression, sympy.Basic):
+            raise UnsupportedExpressionError(
+                f"Beklenmeyen ifade tipi: {type(expression).__name__}"
+            )
+        return expression
+
+    def _check_powers(self, expression: Any) -> None:
+        """Degerlendirilmemis ifadedeki uslerin buyuklugunu sinirlar
+
+        Alt ifadeler once ziyaret edildigi icin bir usun sayisal degeri
+        hesaplanirken icindeki uslu sayilar zaten sinir icindedir.
+
+        Raises:
+            UnsupportedExpressionError: Us veya sonuc cok buyuk
+        """
+        sympy = self.sympy
+        for node in sympy.postorder_traversal(expression):
+            if not isinstance(node, sympy.Pow) or node.exp.free_symbols:
+                continue
+            exponent = self.to_number(node.exp)
+            if exponent is None:
+                continue
+            if abs(exponent) > MAX_SYMBOLIC_EXPONENT:
+                raise UnsupportedExpressionError(
+                    f"Us cok buyuk: {self.format(node.exp)}"
+                )
+            if node.base.free_symbols:
+                continue
+            base = self.to_number(node.base)
+            if (
+                base
+                and abs(base) != 1
+                and exponent * math.log10(abs(base))
+                > MAX_POWER_RESULT_DIGITS
+            ):
+                raise UnsupportedExpressionError(
+                    f"Uslu sayi cok buyuk: {self.format(node)}"
+                )
+
+    def to_number(self, expression: Any) -> Optional[float]:
+        """Serbest sembol icermeyen gercel ifadeyi float'a cevirir
+
+        Args:
+            expression: SymPy ifadesi
+
+        Returns:
+            Float deger veya ifade sayisal/gercel degilse None
+        """
+        sympy = self.sympy
+        if expression.free_symbols:
+            return None
+        if expression in (sympy.oo, -sympy.oo):
+            return float(expression)
+        try:
+            value = complex(sympy.N(expression))
+        except (TypeError, ValueError):
+            return None
+        if math.isnan(value.real) or math.isnan(value.imag):
+            return None
+        if abs(value.imag) > 1e-12 * max(1.0, abs(value.real)):
+            return None
+        return value.real
+
+    @staticmethod
+    def format(expression: Any) -> str:
+        """SymPy ifadesini kullaniciya gosterilecek metne cevirir"""
+        return str(expression).replace("**", "^")
+
+
+class SymbolicEngine(BaseEngine):
+    """SymPy kullanan yerel motorlar icin ortak parser, cache ve degisken
+
+    Parse edilen ifadeler ``SymbolicParser`` cache'inde, hesaplanan
+    sonuclar ise SymPy'nin kanonik ifade agaci uzerinden anahtarlanan
+    ayri bir LRU cache'te tutulur.
+    """
+
+    # Degiskeni belirtme sozdizimi (hata mesajinda gosterilir)
+    VARIABLE_KEYWORD = "wrt"
+    # Ifadede serbest degisken yoksa kullanilan degisken; None ise hata
+    DEFAULT_VARIABLE: Optional[str] = "x"
+
+    def __init__(
+        self,
+        sympy_loader: Callable[[], Any],
+        cache_size: int = 256
+    ):
+        """Motoru baslatir
+
+        Args:
+            sympy_loader: SymPy modulunu donduren (lazy) fonksiyon
+            cache_size: Parse ve sonuc cache'lerinin boyutu
+        """
+        self.parser = SymbolicParser(sympy_loader, cache_size)
+        self.cache = LRUCache(cache_size)
+
+    @property
+    def _sympy(self) -> Any:
+        return self.parser.sympy
+
+    def _cached(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Sonucu kanonik SymPy anahtariyla LRU cache'ten getirir"""
+        value = self.cache.get(key)
+        if value is None:
+            value = compute()
+            self.cache.put(key, value)
+        return value
+
+    def _resolve_variable(
+        self,
+        function: Any,
+        variable_name: Optional[str]
+    ) -> Any:
+        """Islem degiskenini belirler
+
+        Raises:
+            UnsupportedExpressionError: Degisken yok (ve varsayilan yok) ya
+                da birden fazla aday var
+        """
+        sympy = self._sympy
+        if variable_name:
+            return sympy.Symbol(variable_name)
+
+        free_symbols = sorted(function.free_symbols, key=str)
+        if not free_symbols:
+            if self.DEFAULT_VARIABLE is None:
+                raise UnsupportedExpressionError("Ifade degisken icermiyor")
+            return sympy.Symbol(self.DEFAULT_VARIABLE)
+        if len(free_symbols) == 1:
+            return free_symbols[0]
+        for symbol in free_symbols:
+            if symbol.name == "x":
+                return symbol
+        raise UnsupportedExpressionError(
+            f"Birden fazla degisken var, degisken belirtilmeli "
+            f"({self.VARIABLE_KEYWORD} ...)"
+        )
@@ -0,0 +1,142 @@
+"""Compile whitelisted expressions into vectorized NumPy pipelines"""
+
+import re
+from functools import reduce
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from src.engines.symbolic import SymbolicParser
+from src.utils.cache import LRUCache
+from src.utils.exceptions import UnsupportedExpressionError
+
+ArrayFunction = Callable[[np.ndarray], np.ndarray]
+
+FUNCTION_PREFIX_PATTERN = re.compile(
+    r"^\s*(?:(?:plot|graph|draw|ciz)\s+)?"
+    r"(?:(?:[A-Za-z]\s*\(\s*[A-Za-z]\s*\)|y)\s*=\s*)?",
+    re.IGNORECASE,
+)
+UFUNCS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "cot": lambda values: 1.0 / np.tan(values),
+    "sec": lambda values: 1.0 / np.cos(values),
+    "csc": lambda values: 1.0 / np.sin(values),
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "exp": np.exp,
+    "log": np.log,
+    "Abs": np.abs,
+}
+
+
+class FunctionCompiler:
+    """Fonksiyon metnini tek gecisli numpy ufunc zincirine derler
+
+    Metin ``SymbolicParser`` whitelist'inden gecirilir, olusan SymPy
+    agaci ``eval``/``lambdify`` kullanilmadan ufunc kapanislarina
+    (closure) cevrilir. Derlenen fonksiyon tum ``linspace`` dizisini
+    tek seferde degerlendirir; tanimsiz noktalar NaN/inf dondurur.
+    """
+
+    def __init__(
+        self,
+        sympy_loader: Callable[[], Any],
+        cache_size: int = 256
+    ):
+        """Derleyiciyi baslatir
+
+        Args:
+            sympy_loader: SymPy modulunu donduren (lazy) fonksiyon
+            cache_size: Derlenmis fonksiyon cache'inin boyutu
+        """
+        self.parser = SymbolicParser(sympy_loader, cache_size)
+        self.cache = LRUCache(cache_size)
+
+    def compile(self, text: str) -> Tuple[ArrayFunction, str]:
+        """Fonksiyon metnini vektorel fonksiyona derler
+
+        Args:
+            text: Fonksiyon ifadesi (ornek: "y = sin(x)/x")
+
+        Returns:
+            (vektorel fonksiyon, degisken adi) tuple'i
+
+        Raises:
+            UnsupportedExpressionError: Ifade derlenemedi
+        """
+        text = self.parser.canonical_text(text)
+        text = FUNCTION_PREFIX_PATTERN.sub("", text)
+        cached = self.cache.get(text)
+        if cached is not None:
+            return cached
+
+        expression = self.parser.parse(text)
+        symbols = sorted(expression.free_symbols, key=str)
+        if len(symbols) > 1:
+            raise UnsupportedExpressionError(
+                "2D grafik icin tek degiskenli fonksiyon gerekli"
+            )
+        variable = symbols[0] if symbols else self.parser.sympy.Symbol("x")
+
+        pipeline = self._compile_node(expression, variable)
+
+        def evaluate(values: np.ndarray) -> np.ndarray:
+            with np.errstate(all="ignore"):
+                result = pipeline(values)
+            return np.broadcast_to(
+                np.asarray(result, dtype=float), np.shape(values)
+            )
+
+        compiled = (evaluate, str(variable))
+        self.cache.put(text, compiled)
+        return compiled
+
+    def _compile_node(self, node: Any, variable: Any) -> ArrayFunction:
+        """SymPy dugumunu ufunc kapanisina cevirir"""
+        if node == variable:
+            return lambda values: values
+
+        if node.is_number:
+            value = complex(node.evalf())
+            if value.imag:
+                raise UnsupportedExpressionError(
+                    f"Karmasik sabit cizilemez: {node}"
+                )
+            return lambda values: value.real
+
+        children = [self._compile_node(arg, variable) for arg in node.args]
+        if node.is_Add:
+            return lambda values: reduce(
+                np.add, (child(values) for child in children)
+            )
+        if node.is_Mul:
+            return lambda values: reduce(
+                np.multiply, (child(values) for child in children)
+            )
+        if node.is_Pow:
+            base, exponent = children
+            if node.exp == -1:
+                return lambda values: np.reciprocal(
+                    np.asarray(base(values), dtype=float)
+                )
+            if node.exp.is_Rational and node.exp.q == 3:
+                # Negatif tabanlarda gercel kup kok (np.power NaN verir)
+                power = float(node.exp.p)
+                return lambda values: np.power(np.cbrt(base(values)), power)
+            return lambda values: np.power(base(values), exponent(values))
+
+        ufunc = UFUNCS.get(type(node).__name__)
+        if ufunc is not None and len(children) == 1:
+            (argument,) = children
+            return lambda values: ufunc(argument(values))
+
+        raise UnsupportedExpressionError(
+            f"Vektorel derlenemeyen ifade: {type(node).__name__}"
+        )
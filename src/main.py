@@ -3,7 +3,7 @@
 import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional
 
 # Proje root'unu Python path'ine ekle (src klasöründen çalıştırılabilmesi için)
 project_root = Path(__file__).parent.parent
@@ -11,7 +11,23 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 from pydantic import ValidationError  # noqa: E402
 from src.core.agent import GeminiAgent  # noqa: E402
+from src.core.deadline import (  # noqa: E402
+    Deadline,
+    check_deadline,
+    current_deadline,
+    remaining_time,
+)
+from src.core.explain import (  # noqa: E402
+    explain_requested,
+    explain_steps,
+)
 from src.core.parser import CommandParser  # noqa: E402
+from src.core.router import HybridRouter  # noqa: E402
+from src.core.streaming import STEPS_RESET, step_listener  # noqa: E402
+from src.core.tiering import (  # noqa: E402
+    ModelTierSelector,
+    TieredAgentPool,
+)
 from src.core.validator import InputValidator  # noqa: E402
 from src.modules.basic_math import BasicMathModule  # noqa: E402
 from src.modules.calculus import CalculusModule  # noqa: E402
@@ -21,18 +37,25 @@ from src.modules.equation_solver import EquationSolverModule  # noqa: E402
 from src.modules.graph_plotter import GraphPlotterModule  # noqa: E402
 from src.modules.statistics import StatisticsModule  # noqa: E402
 from src.config.settings import settings  # noqa: E402
+from src.schemas.models import (  # noqa: E402
+    CalculationRequest,
+    CalculationResult,
+)
 from src.utils.exceptions import (  # noqa: E402
     CalculationError,
+    DeadlineExceededError,
     InvalidInputError,
     SecurityViolationError,
     CalculatorModuleNotFoundError,
 )
+from src.utils.cache import PersistentCache  # noqa: E402
 from src.utils.logger import setup_logger  # noqa: E402
 from src.utils.helpers import format_result_for_display  # noqa: E402
 
 logger = setup_logger()
 APP_NAME = "Calculator Agent"
 APP_VERSION = "1.0.0"
+ANSWER_ONLY_FLAG = "--answer-only"
 
 
 class CalculatorAgent:
@@ -47,8 +70,31 @@ class CalculatorAgent:
             raise
 
         self.gemini_agent = GeminiAgent()
+        tier_selector = None
+        if settings.GEMINI_FAST_MODEL:
+            # Basit istekler hizli modele, zor olanlar GEMINI_MODEL'e
+            self.gemini_agent = TieredAgentPool(
+                GeminiAgent(
+                    model_name=settings.GEMINI_FAST_MODEL,
+                    calls_per_minute=settings.RATE_LIMIT_CALLS_PER_MINUTE_FAST,
+                ),
+                self.gemini_agent,
+                min_confidence=settings.TIER_ESCALATION_MIN_CONFIDENCE,
+            )
+            tier_selector = ModelTierSelector(
+                settings.TIER_COMPLEXITY_THRESHOLD
+            )
         self.parser = CommandParser()
         self.validator = InputValidator()
+        result_cache = None
+        if settings.RESULT_CACHE_PATH:
+            result_cache = PersistentCache(
+                settings.RESULT_CACHE_PATH,
+                max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+            )
+        self.router = HybridRouter(
+            result_cache=result_cache, tier_selector=tier_selector
+        )
 
         self.modules = {
             "basic_math": BasicMathModule(self.gemini_agent),
@@ -62,21 +108,44 @@ class CalculatorAgent:
 
         logger.info("Calculator Agent baslatildi")
 
-    async def process_command(self, user_input: str) -> Optional[str]:
-        """Kullanici komutunu isler
+    async def calculate(
+        self,
+        request: CalculationRequest
+    ) -> CalculationResult:
+        """Hesaplama istegini isler
+
+        ``request.parameters`` icindeki ``explain`` False ise Gemini'den
+        adim istenmez (cevap modu); diger parametreler module iletilir.
+        ``request.module`` verilirse parser'in tespit ettigi modul yerine
+        kullanilir. Cagiran bir deadline kurduysa (ornegin HTTP sunucusu
+        kuyrukta beklemeden once) o deadline kullanilir.
 
         Args:
-            user_input: Kullanici girdisi
+            request: Hesaplama istegi
 
         Returns:
-            Sonuc string'i veya None
-        """
-        if not user_input or not user_input.strip():
-            return "Boş komut girdiniz."
+            Motor etiketli CalculationResult objesi
 
+        Raises:
+            CalculatorModuleNotFoundError: Modul bulunamadi
+            DeadlineExceededError: Istek ``REQUEST_TIMEOUT`` icinde
+                tamamlanamadi
+        """
+        explain_token = explain_steps.set(
+            explain_requested(request.parameters)
+        )
+        parameters = dict(request.parameters or {})
+        parameters.pop("explain", None)
+        # Istek icin toplam sure; alt asamalar kalan sureyi kontrol eder
+        deadline_token = current_deadline.set(
+            current_deadline.get() or (
+                Deadline(settings.REQUEST_TIMEOUT)
+                if settings.REQUEST_TIMEOUT > 0 else None
+            )
+        )
         try:
-
-            module_name, expression = self.parser.parse(user_input)
+            module_name, expression = self.parser.parse(request.expression)
+            module_name = request.module or module_name
             self.validator.sanitize_expression(expression)
 
             if module_name not in self.modules:
@@ -86,10 +155,65 @@ class CalculatorAgent:
 
             module = self.modules[module_name]
 
+            check_deadline("parse")
             logger.info(f"Processing: {module_name} - {expression}")
-            result = await module.calculate(expression)
+            # Asili kalan bir cagri istegi deadline'dan uzun tutamaz
+            try:
+                return await asyncio.wait_for(
+                    self.router.route(
+                        module_name, module, expression, **parameters
+                    ),
+                    timeout=remaining_time(),
+                )
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(
+                    f"Istek {settings.REQUEST_TIMEOUT:g} saniyede "
+                    f"tamamlanamadi"
+                )
+
+        finally:
+            current_deadline.reset(deadline_token)
+            explain_steps.reset(explain_token)
+
+    async def process_command(
+        self,
+        user_input: str,
+        stream: bool = False,
+        explain: bool = True
+    ) -> Optional[str]:
+        """Kullanici komutunu isler
+
+        Args:
+            user_input: Kullanici girdisi
+            stream: True ise Gemini'den gelen adimlar tamamlandikca
+                ekrana yazilir; donen metinde tekrar edilmez
+            explain: False ise sadece sonuc hesaplanir ve gosterilir
+
+        Returns:
+            Sonuc string'i veya None
+        """
+        if not user_input or not user_input.strip():
+            return "Boş komut girdiniz."
+
+        streamed_steps: List[str] = []
+        token = step_listener.set(
+            self._step_printer(streamed_steps) if stream else None
+        )
+        try:
+            result = await self.calculate(
+                CalculationRequest(
+                    expression=user_input,
+                    parameters={"explain": explain},
+                )
+            )
+
+            return self._format_output(
+                result, streamed_steps=len(streamed_steps), explain=explain
+            )
 
-            return self._format_output(result)
+        except DeadlineExceededError as e:
+            logger.warning(f"Deadline exceeded: {e}")
+            return f"⏱️ Zaman asimi: {e}"
 
         except SecurityViolationError as e:
             logger.warning(f"Security violation: {e}")
@@ -115,11 +239,40 @@ class CalculatorAgent:
             logger.error(f"Unexpected error: {e}", exc_info=True)
             return f"❌ Beklenmeyen hata: {e}"
 
-    def _format_output(self, result) -> str:
+        finally:
+            step_listener.reset(token)
+
+    @staticmethod
+    def _step_printer(streamed_steps: List[str]) -> Callable[[str], None]:
+        """Akan adimlari numaralandirarak yazan callback olusturur"""
+        def print_step(step: str) -> None:
+            if step == STEPS_RESET:
+                if streamed_steps:
+                    print(
+                        "\n🔄 Yanit yeniden hesaplaniyor, "
+                        "onceki adimlar gecersiz.",
+                        flush=True,
+                    )
+                streamed_steps.clear()
+                return
+            if not streamed_steps:
+                print("\n📝 Adimlar:")
+            streamed_steps.append(step)
+            print(f"  {len(streamed_steps)}. {step}", flush=True)
+        return print_step
+
+    def _format_output(
+        self,
+        result,
+        streamed_steps: int = 0,
+        explain: bool = True
+    ) -> str:
         """Sonucu kullanici dostu formatta gosterir
 
         Args:
             result: CalculationResult objesi
+            streamed_steps: Akis sirasinda zaten yazilmis adim sayisi
+            explain: False ise adimlar gosterilmez
 
         Returns:
             Formatlanmis string
@@ -134,9 +287,11 @@ class CalculatorAgent:
             f"✅ Sonuc: {format_result_for_display(result.result)}"
         )
 
-        if result.steps:
-            output_lines.append("\n📝 Adimlar:")
-            for i, step in enumerate(result.steps, 1):
+        remaining_steps = result.steps[streamed_steps:] if explain else []
+        if remaining_steps:
+            if not streamed_steps:
+                output_lines.append("\n📝 Adimlar:")
+            for i, step in enumerate(remaining_steps, streamed_steps + 1):
                 output_lines.append(f"  {i}. {step}")
 
         if result.confidence_score < 1.0:
@@ -182,7 +337,7 @@ async def interactive_mode():
             if not user_input:
                 continue
 
-            result = await agent.process_command(user_input)
+            result = await agent.process_command(user_input, stream=True)
             if result:
                 print(result)
                 print()
@@ -195,19 +350,25 @@ async def interactive_mode():
             break
 
 
-async def single_command_mode(expression: str):
+async def single_command_mode(expression: str, explain: bool = True):
     """Tek komut modu"""
     agent = CalculatorAgent()
-    result = await agent.process_command(expression)
+    result = await agent.process_command(
+        expression, stream=explain, explain=explain
+    )
     if result:
         print(result)
 
 
 def main():
     """Ana entry point"""
-    if len(sys.argv) > 1:
-        expression = " ".join(sys.argv[1:])
-        asyncio.run(single_command_mode(expression))
+    args = sys.argv[1:]
+    # --answer-only: adimlar uretilmez, sadece sonuc yazilir
+    explain = ANSWER_ONLY_FLAG not in args
+    args = [arg for arg in args if arg != ANSWER_ONLY_FLAG]
+    if args:
+        expression = " ".join(args)
+        asyncio.run(single_command_mode(expression, explain=explain))
     else:
         asyncio.run(interactive_mode())
 
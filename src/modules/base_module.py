@@ -1,10 +1,18 @@
 """Abstract base class for all calculation modules"""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict
-from src.schemas.models import CalculationResult
+from typing import Any, Dict, Optional
+from src.config.prompts import answer_only_prompt
+from src.config.settings import settings
+from src.schemas.models import ENGINE_LOCAL, CalculationResult
+from src.schemas.response_schema import build_response_schema
 from src.core.agent import GeminiAgent
+from src.core.batcher import GeminiBatcher
+from src.core.explain import explain_steps
 from src.core.validator import InputValidator
+from src.engines.base_engine import BaseEngine
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -13,6 +21,13 @@ logger = setup_logger()
 class BaseModule(ABC):
     """Tum hesaplama modulleri icin abstract base class"""
 
+    # Gemini sonucunun tipi; biliniyorsa yanit schema'si bu tiple
+    # daraltilir, None ise yalnizca JSON modu kullanilir
+    RESULT_TYPE: Optional[type] = None
+    # Cevap modunda (explain=False) cikti token siniri; None ise
+    # ANSWER_ONLY_MAX_OUTPUT_TOKENS ayari kullanilir
+    ANSWER_ONLY_MAX_OUTPUT_TOKENS: Optional[int] = None
+
     def __init__(self, gemini_agent: GeminiAgent):
         """Modul baslatir
 
@@ -22,6 +37,28 @@ class BaseModule(ABC):
         self.gemini_agent = gemini_agent
         self.validator = InputValidator()
         self.domain_prompt = self._get_domain_prompt()
+        self.response_schema = build_response_schema(self.RESULT_TYPE)
+        self.batcher = GeminiBatcher(
+            gemini_agent,
+            self.domain_prompt,
+            max_size=settings.BATCH_MAX_SIZE,
+            max_wait=settings.BATCH_MAX_WAIT_MS / 1000,
+            response_schema=self.response_schema,
+        )
+        # Adim istenmeyen istekler kisa prompt ve dusuk token siniriyla
+        # ayri gruplanir
+        self.answer_batcher = GeminiBatcher(
+            gemini_agent,
+            answer_only_prompt(self.domain_prompt),
+            max_size=settings.BATCH_MAX_SIZE,
+            max_wait=settings.BATCH_MAX_WAIT_MS / 1000,
+            response_schema=self.response_schema,
+            max_output_tokens=(
+                self.ANSWER_ONLY_MAX_OUTPUT_TOKENS
+                or settings.ANSWER_ONLY_MAX_OUTPUT_TOKENS
+            ),
+        )
+        self.engine = self._create_engine()
 
     @abstractmethod
     async def calculate(
@@ -29,7 +66,10 @@ class BaseModule(ABC):
         expression: str,
         **kwargs
     ) -> CalculationResult:
-        """Ana hesaplama metodu - her modul implemente etmeli
+        """Ana hesaplama metodu (Gemini yolu) - her modul implemente etmeli
+
+        Yerel motor denemesi ``HybridRouter`` tarafindan bu metoddan
+        once ``calculate_locally`` ile yapilir.
 
         Args:
             expression: Hesaplanacak ifade
@@ -49,6 +89,14 @@ class BaseModule(ABC):
         """
         pass
 
+    def _create_engine(self) -> Optional[BaseEngine]:
+        """Modulun yerel hesaplama motorunu olusturur (opsiyonel override)
+
+        Returns:
+            BaseEngine instance'i veya yerel motor yoksa None
+        """
+        return None
+
     def validate_input(self, expression: str) -> bool:
         """Giris dogrulama (opsiyonel override)
 
@@ -65,6 +113,60 @@ class BaseModule(ABC):
         self.validator.validate_length(expression)
         return True
 
+    async def calculate_locally(
+        self,
+        expression: str,
+        **kwargs
+    ) -> Optional[CalculationResult]:
+        """Yerel hizli yol: ifadeyi motorla worker thread'de hesaplar
+
+        Motor CPU'da calistigi icin event loop bloklanmaz ve cagiran
+        taraf ``asyncio.wait_for`` ile zaman butcesi uygulayabilir.
+
+        Args:
+            expression: Hesaplanacak ifade
+            **kwargs: Ek parametreler
+
+        Returns:
+            CalculationResult objesi veya yerel motor yoksa/ifadeyi
+            yorumlayamazsa None
+        """
+        if self.engine is None:
+            return None
+
+        self.validate_input(expression)
+        return await asyncio.to_thread(
+            self._calculate_locally, expression, **kwargs
+        )
+
+    def _calculate_locally(
+        self,
+        expression: str,
+        **kwargs
+    ) -> Optional[CalculationResult]:
+        """Yerel motor ile hesaplama (opsiyonel override)
+
+        Args:
+            expression: Hesaplanacak ifade
+            **kwargs: Ek parametreler
+
+        Returns:
+            CalculationResult objesi veya yerel motor ifadeyi
+            yorumlayamazsa None (Gemini'ye devredilir)
+        """
+        if self.engine is None:
+            return None
+
+        try:
+            response = self.engine.evaluate(expression, **kwargs)
+        except UnsupportedExpressionError as e:
+            logger.info(f"Local {self.engine.domain} engine declined: {e}")
+            return None
+
+        result = self._create_result(response, self.engine.domain)
+        result.engine = ENGINE_LOCAL
+        return result
+
     async def _call_gemini(
         self,
         expression: str,
@@ -79,12 +181,10 @@ class BaseModule(ABC):
         Returns:
             Parse edilmis JSON response
         """
-        prompt = self.domain_prompt.format(
-            expression=expression,
-            **prompt_kwargs
-        )
-
-        return await self.gemini_agent.generate_json_response(prompt)
+        # Eszamanli istekler batcher'da tek prompt'ta birlestirilir;
+        # cevap modunda adimsiz kisa prompt kullanilir
+        batcher = self.batcher if explain_steps.get() else self.answer_batcher
+        return await batcher.submit(expression, **prompt_kwargs)
 
     def _create_result(
         self,
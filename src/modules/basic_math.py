@@ -1,10 +1,12 @@
 """Basic math module for Calculator Agent"""
 
 import re
+from typing import Optional
 
 from src.modules.base_module import BaseModule
-from src.schemas.models import CalculationResult
+from src.schemas.models import ENGINE_LOCAL, CalculationResult
 from src.config.prompts import BASIC_MATH_PROMPT
+from src.engines.arithmetic import ArithmeticEngine
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -13,6 +15,8 @@ logger = setup_logger()
 class BasicMathModule(BaseModule):
     """Temel matematik modulu"""
 
+    RESULT_TYPE = float
+
     INVALID_EXPRESSION_MESSAGE = "Geçersiz veya yasaklı ifade girdiniz."
     MISSING_OPERAND_MESSAGE = (
         "Hatalı işlem: Eksik operand. Örnek kullanım: !basic 5 + 3"
@@ -24,6 +28,10 @@ class BasicMathModule(BaseModule):
         """Basic math prompt'unu dondurur"""
         return BASIC_MATH_PROMPT
 
+    def _create_engine(self) -> ArithmeticEngine:
+        """AST tabanli aritmetik motorunu dondurur"""
+        return ArithmeticEngine()
+
     async def calculate(
         self,
         expression: str,
@@ -53,6 +61,27 @@ class BasicMathModule(BaseModule):
             logger.error(f"Basic math calculation error: {e}")
             raise
 
+    def _calculate_locally(
+        self,
+        expression: str,
+        **kwargs
+    ) -> Optional[CalculationResult]:
+        """Yerel motoru Gemini yolu ile ayni ifade dogrulamasindan gecirir
+
+        ``0x10``, ``1e3``, ``1_000`` veya parantezli ifadeler Python
+        AST'inde gecerli olsa da modulun kurallarina gore reddedilir.
+        """
+        expression = expression.strip()
+        validation_error = self._validate_expression(expression)
+        if validation_error:
+            logger.warning(f"Basic math validation failed: {validation_error}")
+            result = self._create_result(
+                {"error": validation_error}, "basic_math"
+            )
+            result.engine = ENGINE_LOCAL
+            return result
+        return super()._calculate_locally(expression, **kwargs)
+
     def _validate_expression(self, expression: str):
         """Expression-level validation for basic arithmetic."""
         if not expression:
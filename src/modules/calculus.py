@@ -3,20 +3,14 @@
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import CALCULUS_PROMPT
+from src.config.settings import settings
+from src.engines.calculus import CalculusEngine
+from src.engines.symbolic import load_sympy
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
-def _get_symp():
-    """Sympy modülünü dinamik olarak import eder"""
-    if 'sympy' in globals():
-        return globals()['sympy']
-    import sympy
-    globals()['sympy'] = sympy
-    return sympy
-
-
 class CalculusModule(BaseModule):
     """Kalkulus modulu (limit, turev, integral, seri)"""
 
@@ -24,6 +18,10 @@ class CalculusModule(BaseModule):
         """Calculus prompt'unu dondurur"""
         return CALCULUS_PROMPT
 
+    def _create_engine(self) -> CalculusEngine:
+        """SymPy tabanli kalkulus motorunu dondurur (lazy import)"""
+        return CalculusEngine(load_sympy, settings.SYMBOLIC_CACHE_SIZE)
+
     async def calculate(
         self,
         expression: str,
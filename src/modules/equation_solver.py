@@ -3,6 +3,9 @@
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import EQUATION_SOLVER_PROMPT
+from src.config.settings import settings
+from src.engines.equation import EquationEngine
+from src.engines.symbolic import load_sympy
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -15,6 +18,10 @@ class EquationSolverModule(BaseModule):
         """Equation solver prompt'unu dondurur"""
         return EQUATION_SOLVER_PROMPT
 
+    def _create_engine(self) -> EquationEngine:
+        """Polinom/sembolik/sayisal denklem motorunu dondurur"""
+        return EquationEngine(load_sympy, settings.SYMBOLIC_CACHE_SIZE)
+
     async def calculate(
         self,
         expression: str,
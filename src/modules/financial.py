@@ -1,10 +1,13 @@
 """Financial module for Calculator Agent"""
 
 from decimal import Decimal, getcontext
+from typing import Optional
+
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import FINANCIAL_PROMPT
 from src.config.settings import settings
+from src.engines.financial import FinancialEngine
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -16,10 +19,16 @@ getcontext().prec = 28
 class FinancialModule(BaseModule):
     """Finansal modul (NPV, IRR, faiz, kredi)"""
 
+    RESULT_TYPE = float
+
     def _get_domain_prompt(self) -> str:
         """Financial prompt'unu dondurur"""
         return FINANCIAL_PROMPT
 
+    def _create_engine(self) -> FinancialEngine:
+        """Decimal tabanli finansal motoru dondurur"""
+        return FinancialEngine()
+
     async def calculate(
         self,
         expression: str,
@@ -59,3 +68,12 @@ class FinancialModule(BaseModule):
         except Exception as e:
             logger.error(f"Financial calculation error: {e}")
             raise
+
+    def _calculate_locally(
+        self,
+        expression: str,
+        **kwargs
+    ) -> Optional[CalculationResult]:
+        """Yerel motoru varsayilan para birimiyle cagirir"""
+        kwargs.setdefault("currency", settings.DEFAULT_CURRENCY)
+        return super()._calculate_locally(expression, **kwargs)
@@ -1,7 +1,8 @@
 """Graph plotter module for Calculator Agent"""
 
+import asyncio
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend - must be before pyplot
@@ -11,21 +12,40 @@ import numpy as np  # noqa: E402
 from src.modules.base_module import BaseModule  # noqa: E402
 from src.schemas.models import CalculationResult  # noqa: E402
 from src.config.prompts import GRAPH_PLOTTER_PROMPT  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.core.canonical import canonicalizer  # noqa: E402
+from src.core.deadline import check_deadline  # noqa: E402
+from src.engines.symbolic import load_sympy  # noqa: E402
+from src.engines.vectorized import FunctionCompiler  # noqa: E402
 from src.utils.logger import setup_logger  # noqa: E402
-from src.utils.exceptions import CalculationError  # noqa: E402
+from src.utils.exceptions import (  # noqa: E402
+    CalculationError,
+    UnsupportedExpressionError,
+)
 
 logger = setup_logger()
 
+PLOT_POINTS = 1000
+# Otomatik eksende aykiri (kutup) degerleri ayiklamak icin yuzdelikler
+AUTO_RANGE_PERCENTILES = (5, 95)
+AUTO_RANGE_SPREAD = 20
+
 
 class GraphPlotterModule(BaseModule):
     """Grafik cizim modulu (2D/3D plotlar)"""
 
+    # visual_data alani cevap modunda da gerekir
+    ANSWER_ONLY_MAX_OUTPUT_TOKENS = 512
+
     def __init__(self, gemini_agent):
         """Graph plotter baslatir"""
         super().__init__(gemini_agent)
         self.cache_dir = Path("cache/plots")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.plot_cache: Dict[str, str] = {}
+        self.compiler = FunctionCompiler(
+            load_sympy, settings.SYMBOLIC_CACHE_SIZE
+        )
 
     def _get_domain_prompt(self) -> str:
         """Graph plotter prompt'unu dondurur"""
@@ -49,7 +69,7 @@ class GraphPlotterModule(BaseModule):
 
         logger.info(f"Graph plotting: {expression}")
 
-        cache_key = expression.lower().strip()
+        cache_key = canonicalizer.canonicalize(expression, "graph_plotter")
         if cache_key in self.plot_cache:
             logger.info("Using cached plot")
             cached_path = self.plot_cache[cache_key]
@@ -59,8 +79,9 @@ class GraphPlotterModule(BaseModule):
             response = await self._call_gemini(expression)
             result = self._create_result(response, "graph_plotter")
 
-            # Grafik olustur
+            # Grafik olustur (istegin suresi dolduysa cizime baslanmaz)
             if result.visual_data:
+                check_deadline("plot")
                 plot_paths = await self._create_plot(
                     result.visual_data, expression
                 )
@@ -108,20 +129,32 @@ class GraphPlotterModule(BaseModule):
         expression: str,
         x_range: list
     ) -> Dict[str, str]:
-        """2D grafik cizer"""
+        """2D grafik cizer
+
+        Fonksiyon (``visual_data["function"]``, yoksa ifadenin kendisi)
+        numpy ufunc zincirine derlenir ve tum ornek noktalarda tek
+        vektorel geciste degerlendirilir.
+        """
         try:
-            x = np.linspace(x_range[0], x_range[1], 1000)
+            # SymPy parse'i event loop'u bloklamamasi icin thread'de
+            evaluate, variable, function_text = await asyncio.to_thread(
+                self._compile_function,
+                visual_data.get("function") or expression, expression
+            )
 
-            # Basit eval (guvenli) - production'da daha guvenli parser gerekli
-            # Bu ornek icin basit yaklasim
-            y = x ** 2  # Placeholder - gercek implementasyon daha karmasik
+            x = np.linspace(x_range[0], x_range[1], PLOT_POINTS)
+            y, y_limits = self._mask_discontinuities(
+                evaluate(x), visual_data.get("y_range")
+            )
 
             plt.figure(figsize=(10, 6))
             plt.plot(x, y, 'b-', linewidth=2)
+            if y_limits is not None:
+                plt.ylim(*y_limits)
             plt.grid(True, alpha=0.3)
-            plt.xlabel('x')
+            plt.xlabel(variable)
             plt.ylabel('y')
-            plt.title(f'f(x) = {expression}')
+            plt.title(f'f({variable}) = {function_text}')
 
             png_path = self.cache_dir / f"{hash(expression)}.png"
             plt.savefig(png_path, dpi=150, bbox_inches='tight')
@@ -133,6 +166,70 @@ class GraphPlotterModule(BaseModule):
             logger.error(f"2D plot error: {e}")
             raise CalculationError(f"Grafik olusturulamadi: {e}")
 
+    def _compile_function(
+        self,
+        function_text: str,
+        expression: str
+    ) -> Tuple[Callable[[np.ndarray], np.ndarray], str, str]:
+        """Fonksiyonu derler, derlenemezse ham ifadeyi dener
+
+        Returns:
+            (vektorel fonksiyon, degisken adi, cizilen metin) tuple'i
+        """
+        try:
+            return (*self.compiler.compile(function_text), function_text)
+        except UnsupportedExpressionError:
+            if function_text == expression:
+                raise
+            logger.warning(
+                f"Plot function could not be compiled: {function_text}"
+            )
+            return (*self.compiler.compile(expression), expression)
+
+    def _mask_discontinuities(
+        self,
+        y: np.ndarray,
+        y_range: Optional[List[float]]
+    ) -> Tuple[np.ndarray, Optional[Tuple[float, float]]]:
+        """Tanimsiz noktalari ve kutuplardaki dikey sicramalari gizler
+
+        NaN/inf degerler NaN yapilir (matplotlib cizgiyi orada keser).
+        Y araligi verilmisse, verilmemisse ve kutup varsa yuzdeliklerden
+        bulunur; aralik disina tasan ve isaret degistiren sicramalar
+        maskelenir.
+
+        Args:
+            y: Fonksiyon degerleri
+            y_range: Opsiyonel [min, max] y araligi
+
+        Returns:
+            (maskelenmis degerler, eksen siniri veya None) tuple'i
+        """
+        y = np.where(np.isfinite(y), y, np.nan)
+        finite = y[np.isfinite(y)]
+        if finite.size == 0:
+            raise CalculationError("Fonksiyon aralikta tanimsiz")
+
+        limits: Optional[Tuple[float, float]] = None
+        if y_range is not None and len(y_range) == 2:
+            limits = (float(y_range[0]), float(y_range[1]))
+        else:
+            low, high = np.percentile(finite, AUTO_RANGE_PERCENTILES)
+            spread = max(high - low, 1e-12)
+            if finite.max() - finite.min() > AUTO_RANGE_SPREAD * spread:
+                limits = (low - spread, high + spread)
+        if limits is None:
+            return y, None
+
+        span = limits[1] - limits[0]
+        outside = (y < limits[0] - span) | (y > limits[1] + span)
+        jump = np.zeros_like(outside)
+        with np.errstate(invalid="ignore"):
+            jump[1:] = (np.abs(np.diff(y)) > span) & (
+                np.sign(y[1:]) != np.sign(y[:-1])
+            )
+        return np.where(outside | jump, np.nan, y), limits
+
     async def _plot_3d(
         self,
         visual_data: Dict[str, Any],
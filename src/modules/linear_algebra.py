@@ -3,6 +3,7 @@
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import LINEAR_ALGEBRA_PROMPT
+from src.engines.linear_algebra import LinearAlgebraEngine
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -11,10 +12,17 @@ logger = setup_logger()
 class LinearAlgebraModule(BaseModule):
     """Lineer cebir modulu (matris, vektor, determinant)"""
 
+    # Matris sonuclari skaler sonuclardan uzundur
+    ANSWER_ONLY_MAX_OUTPUT_TOKENS = 1024
+
     def _get_domain_prompt(self) -> str:
         """Linear algebra prompt'unu dondurur"""
         return LINEAR_ALGEBRA_PROMPT
 
+    def _create_engine(self) -> LinearAlgebraEngine:
+        """NumPy tabanli lineer cebir motorunu dondurur"""
+        return LinearAlgebraEngine()
+
     async def calculate(
         self,
         expression: str,
@@ -3,6 +3,7 @@
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import STATISTICS_PROMPT
+from src.engines.statistics import StatisticsEngine
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -15,6 +16,10 @@ class StatisticsModule(BaseModule):
         """Statistics prompt'unu dondurur"""
         return STATISTICS_PROMPT
 
+    def _create_engine(self) -> StatisticsEngine:
+        """NumPy tabanli istatistik motorunu dondurur"""
+        return StatisticsEngine()
+
     async def calculate(
         self,
         expression: str,
@@ -1,18 +1,31 @@
 """Pydantic models for input/output validation"""
 
+from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 
 Matrix = List[List[float]]
 
+# Sonucu ureten hesaplama yolu (CalculationResult.engine)
+ENGINE_LOCAL = "local"
+ENGINE_GEMINI = "gemini"
+ENGINE_CACHE = "cache"
+ENGINE_DEGRADED = "degraded"
+
+# CalculationRequest.parameters icinde kabul edilen anahtarlar; parametreler
+# modullerin calculate metotlarina keyword argument olarak iletilir
+REQUEST_PARAMETERS = frozenset({"explain", "currency"})
+
 
 class CalculationResult(BaseModel):
     """Hesaplama sonucu modeli"""
 
-    result: Union[float, List[float], Matrix, Dict[str, Any], str] = Field(
-        ..., description="Hesaplama sonucu"
-    )
+    # Decimal en sonda: float/int girdiler float kalir, finansal modulun
+    # Decimal sonucu donusturulmeden saklanir
+    result: Union[
+        float, List[float], Matrix, Dict[str, Any], str, Decimal
+    ] = Field(..., description="Hesaplama sonucu")
     steps: List[str] = Field(
         default_factory=list, description="Adim adim cozum adimlari"
     )
@@ -34,6 +47,17 @@ class CalculationResult(BaseModel):
     module: Optional[str] = Field(
         None, description="Sonucu ureten modul"
     )
+    engine: Optional[str] = Field(
+        None,
+        description="Sonucu ureten motor (local, gemini, cache, degraded)"
+    )
+
+    @field_serializer("result", when_used="json")
+    def _serialize_result(self, value: Any) -> Any:
+        """Decimal sonucu JSON'da sayi olarak yazar (string degil)"""
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
 
 
 class CalculationRequest(BaseModel):
@@ -44,3 +68,17 @@ class CalculationRequest(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(
         default_factory=dict, description="Ek parametreler"
     )
+
+    @field_validator("parameters")
+    @classmethod
+    def _check_parameters(
+        cls,
+        value: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Bilinmeyen parametre anahtarlarini reddeder"""
+        unknown = sorted(set(value or {}) - REQUEST_PARAMETERS)
+        if unknown:
+            raise ValueError(
+                f"Desteklenmeyen parametre: {', '.join(unknown)}"
+            )
+        return value
@@ -0,0 +1,106 @@
+"""Gemini response schemas derived from CalculationResult"""
+
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+
+from src.schemas.models import CalculationResult
+
+# Gemini'nin doldurdugu CalculationResult alanlari
+GEMINI_RESULT_FIELDS = ("result", "steps", "confidence_score")
+
+_SCALAR_TYPES = {
+    str: "STRING",
+    float: "NUMBER",
+    int: "INTEGER",
+    bool: "BOOLEAN",
+}
+
+
+def field_schema(annotation: Any) -> Optional[Dict[str, Any]]:
+    """Python tip anotasyonunu Gemini schema'sina cevirir
+
+    Gemini schema'si (OpenAPI alt kumesi) ``anyOf`` ve serbest anahtarli
+    obje desteklemez; birden fazla tipli Union ve Dict icin None doner.
+
+    Args:
+        annotation: Tip anotasyonu (ornek: ``List[str]``)
+
+    Returns:
+        Schema dict'i veya ifade edilemiyorsa None
+    """
+    if annotation in _SCALAR_TYPES:
+        return {"type": _SCALAR_TYPES[annotation]}
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        schema = field_schema(members[0])
+        return None if schema is None else {**schema, "nullable": True}
+    if origin in (list, List) and args:
+        items = field_schema(args[0])
+        return None if items is None else {"type": "ARRAY", "items": items}
+    return None
+
+
+def build_response_schema(result_type: Any) -> Optional[Dict[str, Any]]:
+    """``result`` alani verilen tipe daraltilmis yanit schema'si uretir
+
+    ``CalculationResult.result`` birden fazla tipi kabul ettigi icin
+    Gemini schema'sina dogrudan cevrilemez; modul sonucunun tipini
+    bildiginde bu tip kullanilir. Diger alanlar modelden alinir.
+
+    Args:
+        result_type: Modulun sonuc tipi (ornek: float); None ise schema
+            uretilmez
+
+    Returns:
+        Schema dict'i veya tip ifade edilemiyorsa None
+    """
+    if result_type is None:
+        return None
+
+    fields = CalculationResult.model_fields
+    properties: Dict[str, Any] = {}
+    for name in GEMINI_RESULT_FIELDS:
+        annotation = (
+            result_type if name == "result" else fields[name].annotation
+        )
+        schema = field_schema(annotation)
+        if schema is None:
+            return None
+        properties[name] = schema
+
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": [
+            name for name in GEMINI_RESULT_FIELDS
+            if fields[name].is_required()
+        ],
+    }
+
+
+def build_batch_schema(item_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Tek sonuc schema'sini batch yanitinin ``results`` listesine sarar
+
+    Args:
+        item_schema: ``build_response_schema`` ciktisi
+
+    Returns:
+        ``{"results": [{"index": ..., ...}]}`` yanitinin schema'si
+    """
+    item = {
+        "type": "OBJECT",
+        "properties": {
+            "index": {"type": "INTEGER"},
+            **item_schema["properties"],
+        },
+        "required": ["index", *item_schema["required"]],
+    }
+    return {
+        "type": "OBJECT",
+        "properties": {"results": {"type": "ARRAY", "items": item}},
+        "required": ["results"],
+    }
@@ -0,0 +1,387 @@
+"""Asyncio HTTP service exposing CalculatorAgent"""
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.config.settings import settings
+from src.core.deadline import Deadline, current_deadline, remaining_time
+from src.main import CalculatorAgent
+from src.schemas.models import CalculationRequest, CalculationResult
+from src.utils.exceptions import (
+    CalculationError,
+    CalculatorModuleNotFoundError,
+    DeadlineExceededError,
+    GeminiAPIError,
+    InvalidInputError,
+    SecurityViolationError,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+HEADER_LIMIT = 64 * 1024
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+# Hesaplama hatalarinin HTTP durum kodlari (ilk eslesen kullanilir)
+ERROR_STATUSES: Tuple[Tuple[Tuple[type, ...], HTTPStatus], ...] = (
+    (
+        (
+            ValidationError,
+            InvalidInputError,
+            SecurityViolationError,
+            CalculatorModuleNotFoundError,
+        ),
+        HTTPStatus.BAD_REQUEST,
+    ),
+    ((DeadlineExceededError,), HTTPStatus.GATEWAY_TIMEOUT),
+    ((CalculationError,), HTTPStatus.UNPROCESSABLE_ENTITY),
+    ((GeminiAPIError,), HTTPStatus.BAD_GATEWAY),
+)
+
+
+class HTTPError(Exception):
+    """Istemciye dogrudan durum kodu ile donen hata"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        """Hatayi olusturur
+
+        Args:
+            status: Yanit durum kodu
+            message: Istemciye donen hata mesaji
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def error_status(error: BaseException) -> HTTPStatus:
+    """Hesaplama hatasinin HTTP durum kodunu dondurur"""
+    for error_types, status in ERROR_STATUSES:
+        if isinstance(error, error_types):
+            return status
+    return HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+class CalculatorServer:
+    """Tek ``CalculatorAgent`` paylasan asyncio HTTP sunucusu
+
+    Tum istekler ayni event loop'ta esli islenir; ayni anda calisan
+    hesaplama sayisi ``max_concurrency`` ile sinirlidir, fazlasi sirada
+    bekler. Batch istekleri de eleman basina ayni limiti kullanir.
+
+    Endpoint'ler:
+        POST /calculate: ``CalculationRequest`` -> ``CalculationResult``
+        POST /batch: ``CalculationRequest`` listesi -> sonuc listesi
+        GET /health: Sunucu durumu
+    """
+
+    def __init__(
+        self,
+        agent: CalculatorAgent,
+        max_concurrency: int = 64,
+        max_batch_size: int = 100,
+        max_body_bytes: int = 1024 * 1024
+    ):
+        """Sunucuyu baslatir
+
+        Args:
+            agent: Paylasilan calculator agent
+            max_concurrency: Ayni anda islenen hesaplama sayisi
+            max_batch_size: Tek batch istegindeki en fazla ifade
+            max_body_bytes: Istek govdesinin en fazla boyutu
+        """
+        self.agent = agent
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_body_bytes = max_body_bytes
+        self.in_flight = 0
+
+    async def start(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000
+    ) -> asyncio.AbstractServer:
+        """Dinlemeye baslar (port 0 ise bos port secilir)"""
+        server = await asyncio.start_server(
+            self.handle_connection, host, port, limit=HEADER_LIMIT
+        )
+        logger.info(
+            f"HTTP server listening on {host}:{port} "
+            f"(max concurrency {self.max_concurrency})"
+        )
+        return server
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Baglantidaki istekleri sirayla isler (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    await self._write_response(
+                        writer, e.status, {"error": str(e)}, keep_alive=False
+                    )
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, payload = await self.dispatch(method, path, body)
+                await self._write_response(
+                    writer, status, payload, keep_alive=keep_alive
+                )
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def dispatch(
+        self,
+        method: str,
+        path: str,
+        body: bytes
+    ) -> Tuple[HTTPStatus, Any]:
+        """Istegi endpoint'ine yonlendirir
+
+        Returns:
+            (durum kodu, JSON'a cevrilecek yanit) tuple'i
+        """
+        routes = {
+            ("POST", "/calculate"): self._handle_calculate,
+            ("POST", "/batch"): self._handle_batch,
+            ("GET", "/health"): self._handle_health,
+        }
+        handler = routes.get((method, path.split("?", 1)[0]))
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"Bulunamadi: {path}"}
+        try:
+            return await handler(body)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+
+    async def _handle_health(self, body: bytes) -> Tuple[HTTPStatus, Any]:
+        """Sunucu durumu ve anlik yuk"""
+        return HTTPStatus.OK, {
+            "status": "ok",
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    async def _handle_calculate(
+        self,
+        body: bytes
+    ) -> Tuple[HTTPStatus, Any]:
+        """Tek hesaplama istegi"""
+        request = self._parse_request(self._load_json(body))
+        try:
+            result = await self._calculate(request)
+        except Exception as e:
+            return self._error_response(e)
+        return HTTPStatus.OK, result.model_dump(mode="json")
+
+    async def _handle_batch(self, body: bytes) -> Tuple[HTTPStatus, Any]:
+        """Istek listesini esli isler, sonuclari ayni sirada dondurur
+
+        Hatali ifadeler tum batch'i dusurmez; ``error`` alani dolu bir
+        ``CalculationResult`` olarak doner.
+        """
+        items = self._load_json(body)
+        if not isinstance(items, list):
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST, "Batch govdesi bir liste olmali"
+            )
+        if len(items) > self.max_batch_size:
+            raise HTTPError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Batch en fazla {self.max_batch_size} ifade icerebilir",
+            )
+        requests = [self._parse_request(item) for item in items]
+        outcomes = await asyncio.gather(
+            *(self._calculate(request) for request in requests),
+            return_exceptions=True,
+        )
+        results: List[Dict[str, Any]] = []
+        for request, outcome in zip(requests, outcomes):
+            if isinstance(outcome, BaseException):
+                self._log_error(outcome)
+                outcome = CalculationResult(
+                    result=str(outcome),
+                    confidence_score=0.0,
+                    domain=request.module or "unknown",
+                    error=str(outcome),
+                    module=request.module,
+                )
+            results.append(outcome.model_dump(mode="json"))
+        return HTTPStatus.OK, results
+
+    async def _calculate(
+        self,
+        request: CalculationRequest
+    ) -> CalculationResult:
+        """Esli islem limiti altinda ``CalculatorAgent.calculate`` cagirir
+
+        Deadline istek kuyruga girerken baslar; limit nedeniyle beklenen
+        sure de istegin ``REQUEST_TIMEOUT`` butcesinden duser.
+
+        Raises:
+            DeadlineExceededError: Istegin suresi kuyrukta doldu
+        """
+        token = current_deadline.set(
+            Deadline(settings.REQUEST_TIMEOUT)
+            if settings.REQUEST_TIMEOUT > 0 else None
+        )
+        try:
+            try:
+                async with asyncio.timeout(remaining_time()):
+                    await self.semaphore.acquire()
+            except TimeoutError:
+                raise DeadlineExceededError(
+                    f"Istek {settings.REQUEST_TIMEOUT:g} saniyede "
+                    f"tamamlanamadi (kuyrukta)"
+                )
+            self.in_flight += 1
+            try:
+                return await self.agent.calculate(request)
+            finally:
+                self.in_flight -= 1
+                self.semaphore.release()
+        finally:
+            current_deadline.reset(token)
+
+    def _error_response(self, error: Exception) -> Tuple[HTTPStatus, Any]:
+        """Hesaplama hatasini durum kodu ve hata mesajina cevirir"""
+        self._log_error(error)
+        return error_status(error), {"error": str(error)}
+
+    @staticmethod
+    def _log_error(error: BaseException) -> None:
+        """Hatayi sunucu hatasi ise stack trace ile loglar"""
+        if error_status(error) == HTTPStatus.INTERNAL_SERVER_ERROR:
+            logger.error(f"Unexpected error: {error}", exc_info=error)
+        else:
+            logger.warning(f"Request failed: {error}")
+
+    @staticmethod
+    def _load_json(body: bytes) -> Any:
+        """Istek govdesini JSON olarak okur"""
+        try:
+            return json.loads(body or b"null")
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Gecersiz JSON: {e}")
+
+    @staticmethod
+    def _parse_request(data: Any) -> CalculationRequest:
+        """JSON objesini ``CalculationRequest`` olarak dogrular"""
+        try:
+            return CalculationRequest.model_validate(data)
+        except ValidationError as e:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST, f"Gecersiz istek: {e.errors()}"
+            )
+
+    async def _read_request(
+        self,
+        reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, str, bytes, bool]]:
+        """Bir HTTP istegini okur
+
+        Returns:
+            (method, path, govde, keep-alive) veya baglanti kapandiysa None
+
+        Raises:
+            HTTPError: Istek bozuk veya govde cok buyuk
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                "Istek basligi cok buyuk",
+            )
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Gecersiz istek satiri")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Gecersiz Content-Length")
+        if length > self.max_body_bytes:
+            raise HTTPError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Istek govdesi cok buyuk"
+            )
+        body = await reader.readexactly(length) if length > 0 else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = (
+            connection != "close" if version == "HTTP/1.1"
+            else connection == "keep-alive"
+        )
+        return method.upper(), path, body, keep_alive
+
+    @staticmethod
+    async def _write_response(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Any,
+        keep_alive: bool
+    ) -> None:
+        """JSON yaniti yazar"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {JSON_CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve() -> None:
+    """Ayarlardaki adreste sunucuyu baslatir ve kapanana kadar calisir"""
+    server = CalculatorServer(
+        CalculatorAgent(),
+        max_concurrency=settings.SERVER_MAX_CONCURRENCY,
+        max_batch_size=settings.SERVER_MAX_BATCH_SIZE,
+        max_body_bytes=settings.SERVER_MAX_BODY_BYTES,
+    )
+    listener = await server.start(settings.SERVER_HOST, settings.SERVER_PORT)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    """HTTP servisi entry point"""
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        logger.info("HTTP server stopped")
+
+
+if __name__ == "__main__":
+    main()
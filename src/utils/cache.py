@@ -0,0 +1,404 @@
+"""Cache helpers for Calculator Agent"""
+
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: Optional[float]
+    size: int
+
+
+class LRUCache:
+    """Boyutu sinirli, en az kullanilan elemani atan cache
+
+    Opsiyonel olarak elemanlara yasam suresi (TTL) ve toplam bayt
+    siniri uygulanabilir. Yerel motorlar worker thread'lerinde calistigi
+    icin islemler bir kilit altinda yapilir.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof
+    ):
+        """Cache'i baslatir
+
+        Args:
+            max_size: Tutulacak maksimum eleman sayisi
+            ttl: Elemanlarin saniye cinsinden yasam suresi (None: sinirsiz)
+            max_bytes: Degerlerin toplam bayt siniri (None: sinirsiz)
+            sizeof: Bir degerin bayt boyutunu hesaplayan fonksiyon
+        """
+        if max_size <= 0:
+            raise ValueError("max_size pozitif olmali")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl pozitif olmali")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes pozitif olmali")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Anahtarin degerini dondurur, yoksa veya suresi dolmussa None
+
+        Args:
+            key: Cache anahtari
+
+        Returns:
+            Cache'lenmis deger veya None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Degeri cache'e yazar, gerekirse en eski elemanlari atar
+
+        Tek basina bayt sinirini asan degerler cache'lenmez.
+
+        Args:
+            key: Cache anahtari
+            value: Saklanacak deger
+        """
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else None
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Tum elemanlari ve sayaclari temizler"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache istatistiklerini dondurur"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _expired(self, entry: _Entry) -> bool:
+        """Elemanin TTL suresi dolmus mu"""
+        return (
+            entry.expires_at is not None
+            and time.monotonic() >= entry.expires_at
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        """Elemani siler ve bayt sayacini gunceller (kilit altinda)"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+
+class PersistentCache:
+    """SQLite uzerinde tutulan, process'ler arasi paylasilan metin cache'i
+
+    Degerler ``(namespace, key)`` ciftiyle saklanir. Veritabani WAL
+    modunda acildigi icin ayni dosyayi kullanan worker process'ler
+    birbirini bloklamadan okuyabilir; yazmalar ``BEGIN IMMEDIATE``
+    transaction'lari ile siralanir. Toplam deger boyutu ``max_bytes``
+    sinirini astiginda en uzun suredir okunmayan kayitlar silinir.
+
+    Okumalar veritabanina yazmaz: son erisim zamanlari bellekte
+    biriktirilir ve sonraki ``put`` ile ya da ``TOUCH_BATCH_SIZE`` okumada
+    bir kez yazilir. Toplam boyut ``totals`` tablosunda tutulur, her
+    yazmada tablo taranmaz. Kilit bekleme suresi kisadir; cache hatalari
+    (kilit zaman asimi dahil) hesaplamayi durdurmaz: okuma hatasi miss,
+    yazma hatasi ise atlanan kayit olarak loglanir.
+    """
+
+    # Bu kadar okuma birikince erisim zamanlari veritabanina yazilir
+    TOUCH_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        timeout: float = 0.25
+    ):
+        """Veritabanini acar ve gerekirse tabloyu olusturur
+
+        Args:
+            path: SQLite dosya yolu (ornek: "cache/results.sqlite3")
+            max_bytes: Degerlerin toplam bayt siniri
+            timeout: Kilitli veritabaninda bekleme suresi (saniye); asilirsa
+                okuma miss, yazma atlanan kayit sayilir
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes pozitif olmali")
+        self.path = path
+        self.max_bytes = max_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "namespace TEXT NOT NULL, "
+            "key TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "accessed_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at "
+            "ON entries (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS totals ("
+            "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        # Onceki surumlerde olusturulmus dosya icin tek seferlik toplam
+        self._conn.execute(
+            "INSERT OR IGNORE INTO totals (name, value) "
+            "SELECT 'bytes', COALESCE(SUM(size), 0) FROM entries"
+        )
+        self._touches: Dict[Tuple[str, str], float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Kaydi dondurur; son erisim zamani bellekte biriktirilir
+
+        Args:
+            namespace: Kayit grubu (ornek: modul adi)
+            key: Kayit anahtari
+
+        Returns:
+            Saklanan metin veya None (kayit yok ya da veritabani kilitli)
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM entries "
+                    "WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+                if row is not None:
+                    self._touches[(namespace, key)] = time.time()
+                    if len(self._touches) >= self.TOUCH_BATCH_SIZE:
+                        self._write(lambda: None)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent cache read failed: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        """Kaydi yazar, gerekirse en eski kayitlari siler
+
+        Tek basina bayt sinirini asan degerler cache'lenmez.
+
+        Args:
+            namespace: Kayit grubu (ornek: modul adi)
+            key: Kayit anahtari
+            value: Saklanacak metin
+        """
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        def insert() -> None:
+            previous = self._conn.execute(
+                "SELECT size FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(namespace, key, value, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, value, size, time.time()),
+            )
+            self._add_bytes(size - (previous[0] if previous else 0))
+            self.evictions += self._evict()
+
+        try:
+            with self._lock:
+                self._write(insert)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent cache write failed: {e}")
+
+    def _write(self, operation: Callable[[], None]) -> None:
+        """Biriken erisim zamanlarini ve islemi tek transaction'da yazar
+
+        Kilit altinda cagrilir. Transaction basarisiz olursa erisim
+        zamanlari atilir; LRU sirasi icin yaklasik bilgi yeterlidir.
+        """
+        touches = [
+            (accessed_at, namespace, key)
+            for (namespace, key), accessed_at in self._touches.items()
+        ]
+        self._touches.clear()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "UPDATE entries SET accessed_at = ? "
+                "WHERE namespace = ? AND key = ?",
+                touches,
+            )
+            operation()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _add_bytes(self, delta: int) -> None:
+        """Toplam boyut sayacini gunceller (transaction ici)"""
+        if delta:
+            self._conn.execute(
+                "UPDATE totals SET value = value + ? WHERE name = 'bytes'",
+                (delta,),
+            )
+
+    def _total_bytes(self) -> int:
+        """Kayitli degerlerin toplam boyutu"""
+        return self._conn.execute(
+            "SELECT value FROM totals WHERE name = 'bytes'"
+        ).fetchone()[0]
+
+    def _evict(self) -> int:
+        """Bayt siniri asildiysa en eski kayitlari siler (transaction ici)
+
+        Returns:
+            Silinen kayit sayisi
+        """
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        rows = self._conn.execute(
+            "SELECT rowid, size FROM entries ORDER BY accessed_at"
+        )
+        stale_rowids = []
+        freed = 0
+        for rowid, size in rows:
+            if total - freed <= self.max_bytes:
+                break
+            stale_rowids.append((rowid,))
+            freed += size
+        self._conn.executemany(
+            "DELETE FROM entries WHERE rowid = ?", stale_rowids
+        )
+        self._add_bytes(-freed)
+        return len(stale_rowids)
+
+    def clear(self) -> None:
+        """Tum kayitlari ve sayaclari temizler"""
+        with self._lock:
+            self._touches.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute(
+                "UPDATE totals SET value = 0 WHERE name = 'bytes'"
+            )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache istatistiklerini dondurur"""
+        with self._lock:
+            size = self._conn.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
+            total = self._total_bytes()
+        return {
+            "size": size,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """Bekleyen erisim zamanlarini yazar ve baglantiyi kapatir"""
+        with self._lock:
+            if self._touches:
+                try:
+                    self._write(lambda: None)
+                except sqlite3.Error as e:
+                    logger.warning(f"Persistent cache write failed: {e}")
+            self._conn.close()
+
+    def __len__(self) -> int:
+        return self.stats()["size"]
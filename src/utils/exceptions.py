@@ -16,6 +16,11 @@ class GeminiAPIError(Exception):
     pass
 
 
+class CircuitOpenError(GeminiAPIError):
+    """Gemini devre kesici acik, cagri yapilmadan reddedildi"""
+    pass
+
+
 class SecurityViolationError(Exception):
     """Guvenlik ihlali tespit edildi"""
     pass
@@ -24,3 +29,13 @@ class SecurityViolationError(Exception):
 class CalculatorModuleNotFoundError(Exception):
     """Modul bulunamadi"""
     pass
+
+
+class UnsupportedExpressionError(CalculationError):
+    """Yerel motor ifadeyi yorumlayamadi (Gemini'ye devredilmeli)"""
+    pass
+
+
+class DeadlineExceededError(Exception):
+    """Istek suresi doldu, kalan asamalar baslatilmadi"""
+    pass
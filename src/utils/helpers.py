@@ -3,7 +3,7 @@
 import json
 import re
 import ast
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def parse_matrix_string(matrix_str: str) -> List[List[float]]:
@@ -35,6 +35,86 @@ def parse_matrix_string(matrix_str: str) -> List[List[float]]:
         raise ValueError(f"Matris parse hatasi: {e}")
 
 
+def find_bracket_literals(expression: str) -> List[Tuple[int, int]]:
+    """Ifadedeki en dis seviye koseli parantez bloklarini bulur
+
+    Args:
+        expression: Aranacak ifade
+
+    Returns:
+        (baslangic, bitis) indeks tuple'lari listesi
+
+    Raises:
+        ValueError: Parantezler dengesiz
+    """
+    spans: List[Tuple[int, int]] = []
+    depth = 0
+    start = 0
+    # Sadece parantezler uzerinde dolasilir; uzun veri setlerinde
+    # karakter karakter Python dongusunden kacinilir
+    for match in re.finditer(r"[\[\]]", expression):
+        index, char = match.start(), match.group()
+        if char == "[":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Dengesiz koseli parantez")
+            if depth == 0:
+                spans.append((start, index + 1))
+    if depth != 0:
+        raise ValueError("Dengesiz koseli parantez")
+    return spans
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Metindeki ilk gecerli JSON objesini bulur
+
+    Metin tek geciste taranir: en dis seviye suslu parantez bloklari
+    string ve kacis karakterleri dikkate alinarak eslestirilir ve her
+    blok bir kez parse edilir. Aciklama metni veya sondaki fazla
+    parantezler sonucu etkilemez.
+
+    Args:
+        text: JSON iceren metin
+
+    Returns:
+        Ilk parse edilebilen JSON objesi, yoksa None
+    """
+    depth = 0
+    start = 0
+    in_string = False
+    skip_index = -1
+    for match in re.finditer(r'[{}"\\]', text):
+        index, char = match.start(), match.group()
+        if index == skip_index:
+            continue
+        if in_string:
+            if char == "\\":
+                skip_index = index + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            # Obje disindaki tirnaklar aciklama metnine aittir
+            in_string = depth > 0
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                try:
+                    parsed = json.loads(text[start:index + 1])
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(parsed, dict):
+                    return parsed
+    return None
+
+
 def extract_expression_from_command(command: str) -> Optional[str]:
     """Komut string'inden ifadeyi cikarir
 
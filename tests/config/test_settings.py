@@ -14,11 +14,30 @@ def test_settings_default_values():
         settings = settings_module.Settings()
         assert settings.GEMINI_MODEL == "gemini-2.5-flash"
         assert settings.RATE_LIMIT_CALLS_PER_MINUTE == 60
+        assert settings.RATE_LIMIT_BURST == 10
         assert settings.TEMPERATURE == 0.1
         assert settings.TOP_P == 0.95
         assert settings.MAX_OUTPUT_TOKENS == 2048
         assert settings.MAX_RETRIES == 3
         assert settings.DEFAULT_CURRENCY == "TRY"
+        assert settings.SYMBOLIC_CACHE_SIZE == 256
+        assert settings.RESPONSE_CACHE_SIZE == 512
+        assert settings.RESPONSE_CACHE_TTL == 3600.0
+        assert settings.BATCH_MAX_SIZE == 8
+        assert settings.BATCH_MAX_OUTPUT_TOKENS == 8192
+        assert settings.HEDGE_ENABLED is False
+        assert settings.CIRCUIT_OPEN_SECONDS == 30.0
+        assert settings.REQUEST_TIMEOUT == 60.0
+        assert settings.GEMINI_JSON_MODE is True
+        assert settings.ANSWER_ONLY_MAX_OUTPUT_TOKENS == 256
+        assert settings.GEMINI_FAST_MODEL == ""
+        assert settings.TIER_COMPLEXITY_THRESHOLD == 0.5
+        assert settings.LLM_BACKEND == "gemini"
+        assert settings.FAKE_LATENCY_DISTRIBUTION == "lognormal"
+        assert settings.SERVER_PORT == 8000
+        assert settings.SERVER_MAX_CONCURRENCY == 64
+        assert settings.ROUTING_MODES["calculus"] == "local"
+        assert settings.LOCAL_TIME_BUDGETS["calculus"] == 2.0
 
 
 def test_settings_validate_success():
@@ -85,3 +104,46 @@ def test_settings_environment_variables():
         assert settings.MAX_OUTPUT_TOKENS == 1024
         assert settings.MAX_RETRIES == 5
         assert settings.DEFAULT_CURRENCY == 'USD'
+
+
+def test_settings_routing_per_module_override():
+    """Settings - modul bazli yonlendirme ayarlari"""
+    env = {
+        'ROUTING_MODE': 'gemini',
+        'ROUTING_MODE_CALCULUS': 'race',
+        'LOCAL_TIME_BUDGET_STATISTICS': '0.5',
+    }
+    with patch.dict(os.environ, env, clear=True):
+        with patch('src.config.settings.load_dotenv'):
+            settings_module = reload_settings()
+        settings = settings_module.Settings()
+        assert settings.ROUTING_MODES["calculus"] == "race"
+        assert settings.ROUTING_MODES["basic_math"] == "gemini"
+        assert settings.LOCAL_TIME_BUDGETS["statistics"] == 0.5
+        assert settings.LOCAL_TIME_BUDGETS["calculus"] == 2.0
+
+
+def test_settings_validate_invalid_routing_mode():
+    """Settings - validation: gecersiz yonlendirme modu"""
+    env = {'GEMINI_API_KEY': 'valid_api_key', 'ROUTING_MODE': 'fastest'}
+    with patch.dict(os.environ, env, clear=True):
+        with patch('src.config.settings.load_dotenv'):
+            settings_module = reload_settings()
+        settings = settings_module.Settings()
+        with pytest.raises(ValueError, match="Gecersiz ROUTING_MODE"):
+            settings.validate()
+
+
+def test_settings_validate_fake_backend_without_api_key():
+    """Settings - validation: fake backend API key istemez"""
+    with patch.dict(os.environ, {'LLM_BACKEND': 'fake'}, clear=True):
+        with patch('src.config.settings.load_dotenv'):
+            settings_module = reload_settings()
+        settings = settings_module.Settings()
+        assert settings.validate() is True
+
+        settings.FAKE_LATENCY_DISTRIBUTION = "gamma"
+        with pytest.raises(
+            ValueError, match="Gecersiz FAKE_LATENCY_DISTRIBUTION"
+        ):
+            settings.validate()
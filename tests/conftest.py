@@ -1,10 +1,18 @@
 """Pytest configuration and fixtures"""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.config.settings import settings
 from src.core.agent import GeminiAgent
 
 
+@pytest.fixture(autouse=True)
+def disable_result_cache():
+    """Testler arasi sonuc sizmamasi icin kalici cache'i kapatir"""
+    with patch.object(settings, "RESULT_CACHE_PATH", ""):
+        yield
+
+
 @pytest.fixture
 def mock_gemini_agent():
     """Mock Gemini agent fixture
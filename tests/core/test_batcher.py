@@ -0,0 +1,167 @@
+"""Tests for Gemini micro-batching"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.config.settings import settings
+from src.core.batcher import GeminiBatcher
+from src.core.streaming import step_listener
+
+PROMPT = "Para birimi: {currency}\nIfade: {expression}"
+
+
+@pytest.mark.asyncio
+async def test_batcher_fans_out_one_prompt(mock_gemini_agent):
+    """Batcher - eszamanli istekler tek prompt ile cozulur"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "results": [
+            {"index": 1, "result": 4, "steps": ["2+2"]},
+            {"index": 0, "result": 2.0, "steps": ["1+1"]},
+            {"index": 2, "result": 6.0, "steps": ["3+3"]},
+        ]
+    }
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_size=3)
+
+    results = await asyncio.gather(
+        batcher.submit("1+1", currency="TRY"),
+        batcher.submit("2+2", currency="TRY"),
+        batcher.submit("3+3", currency="TRY"),
+    )
+
+    assert [result["result"] for result in results] == [2.0, 4.0, 6.0]
+    assert results[1] == {"result": 4.0, "steps": ["2+2"]}
+    mock_gemini_agent.generate_json_response.assert_called_once()
+    prompt = mock_gemini_agent.generate_json_response.call_args[0][0]
+    assert "Para birimi: TRY" in prompt
+    assert "0: 1+1\n1: 2+2\n2: 3+3" in prompt
+    assert batcher.stats() == {"pending": 0, "batches": 1, "fallbacks": 0}
+
+
+@pytest.mark.asyncio
+async def test_batcher_falls_back_for_missing_results(mock_gemini_agent):
+    """Batcher - bozuk/eksik sonuclar tek tek gonderilir"""
+    async def respond(prompt, **kwargs):
+        if "Ifadeler:" in prompt:
+            return {"results": [{"index": 0, "result": 2.0}, "bozuk"]}
+        return {"result": 4.0, "steps": []}
+
+    mock_gemini_agent.generate_json_response.side_effect = respond
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_wait=0.01)
+
+    results = await asyncio.gather(
+        batcher.submit("1+1", currency="TRY"),
+        batcher.submit("2+2", currency="TRY"),
+    )
+
+    assert results == [{"result": 2.0}, {"result": 4.0, "steps": []}]
+    assert mock_gemini_agent.generate_json_response.call_count == 2
+    last_prompt = mock_gemini_agent.generate_json_response.call_args[0][0]
+    assert last_prompt == PROMPT.format(currency="TRY", expression="2+2")
+    assert batcher.stats()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_groups_by_prompt_parameters(mock_gemini_agent):
+    """Batcher - farkli prompt parametreleri ayni prompt'a girmez"""
+    mock_gemini_agent.generate_json_response = AsyncMock(
+        return_value={"result": 1.0}
+    )
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_wait=0.01)
+
+    await asyncio.gather(
+        batcher.submit("1+1", currency="TRY"),
+        batcher.submit("1+1", currency="USD"),
+    )
+
+    prompts = [
+        call.args[0]
+        for call in mock_gemini_agent.generate_json_response.call_args_list
+    ]
+    assert sorted(prompts) == sorted([
+        PROMPT.format(currency="TRY", expression="1+1"),
+        PROMPT.format(currency="USD", expression="1+1"),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_api_errors(mock_gemini_agent):
+    """Batcher - API hatasi tum caller'lara iletilir"""
+    mock_gemini_agent.generate_json_response.side_effect = RuntimeError(
+        "down"
+    )
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit("1+1", currency="TRY"),
+        batcher.submit("2+2", currency="TRY"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batcher_cancelled_before_flush_sends_nothing(
+    mock_gemini_agent
+):
+    """Batcher - pencere dolmadan iptal edilen istek gonderilmez"""
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_wait=0.05)
+
+    task = asyncio.create_task(batcher.submit("1+1", currency="TRY"))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0.1)
+
+    assert batcher.stats()["pending"] == 0
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batcher_scales_output_tokens_with_group(mock_gemini_agent):
+    """Batcher - token siniri ifade sayisiyla olceklenir, grup kuculur"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "results": [{"index": 0, "result": 1.0}, {"index": 1, "result": 2.0}]
+    }
+    with (
+        patch.object(settings, "MAX_OUTPUT_TOKENS", 2048),
+        patch.object(settings, "BATCH_MAX_OUTPUT_TOKENS", 4096)
+    ):
+        batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_size=8)
+
+    await asyncio.gather(
+        batcher.submit("1", currency="TRY"),
+        batcher.submit("2", currency="TRY"),
+    )
+
+    assert batcher.max_size == 2
+    call = mock_gemini_agent.generate_json_response.call_args
+    assert call.kwargs["max_output_tokens"] == 4096
+
+
+@pytest.mark.asyncio
+async def test_batcher_single_request_uses_own_listener(mock_gemini_agent):
+    """Batcher - tek gonderilen istek kendi step listener'ini kullanir"""
+    listeners = []
+
+    async def generate(prompt, **kwargs):
+        listeners.append(step_listener.get())
+        if "0: 1" in prompt:
+            return {"results": []}
+        return {"result": 1.0}
+
+    mock_gemini_agent.generate_json_response.side_effect = generate
+    batcher = GeminiBatcher(mock_gemini_agent, PROMPT, max_wait=0.01)
+    own = [[].append, [].append]
+
+    async def submit(listener, expression):
+        step_listener.set(listener)
+        return await batcher.submit(expression, currency="TRY")
+
+    await asyncio.gather(submit(own[0], "1"), submit(own[1], "2"))
+
+    # Batch cagrisi listener'siz, geri dusen tekil cagrilar kendi
+    # listener'lari ile yapilir
+    assert listeners[0] is None
+    assert sorted(map(id, listeners[1:])) == sorted(map(id, own))
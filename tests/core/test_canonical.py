@@ -0,0 +1,91 @@
+"""Tests for expression canonicalization"""
+
+import json
+
+from src.core.canonical import (
+    ExpressionCanonicalizer,
+    _read_commands,
+    replay_cache_hits,
+)
+
+
+def test_canonicalize_equivalent_spellings():
+    """Canonicalizer - ayni anlamdaki yazimlar tek anahtara iner"""
+    canonicalizer = ExpressionCanonicalizer()
+
+    keys = {
+        canonicalizer.canonicalize(text)
+        for text in ["2+3", " 2 + 3 ", "2 + 3", "3 + 2.0", "2.00+03"]
+    }
+
+    assert keys == {"2+3"}
+
+
+def test_canonicalize_unicode_and_case():
+    """Canonicalizer - Unicode operatorler ve kelime harf buyuklugu"""
+    canonicalizer = ExpressionCanonicalizer()
+
+    assert canonicalizer.canonicalize("6 ÷ 2 − 1") == "6/2-1"
+    assert canonicalizer.canonicalize("2π × r²") == (
+        "2*pi*r^2"
+    )
+    assert canonicalizer.canonicalize("Derivative X**2 AT x = 2.0") == (
+        "derivative X^2 at x=2"
+    )
+
+
+def test_canonicalize_keeps_non_commutative_order():
+    """Canonicalizer - sadece guvenli zincirler siralanir"""
+    canonicalizer = ExpressionCanonicalizer()
+
+    assert canonicalizer.canonicalize("y * x * 2") == "2*x*y"
+    assert canonicalizer.canonicalize("3 - 2") == "3-2"
+    assert canonicalizer.canonicalize("x + 2 * y") == "x+2*y"
+    assert canonicalizer.canonicalize("[[1.0, 2], [3, 4]]") == (
+        "[[1,2],[3,4]]"
+    )
+
+
+def test_canonicalize_respects_module_semantics():
+    """Canonicalizer - matris carpimi ve basic_math operatorleri korunur"""
+    canonicalizer = ExpressionCanonicalizer()
+
+    assert canonicalizer.key("linear_algebra", "B * A") == (
+        "linear_algebra:B*A"
+    )
+    assert canonicalizer.key("linear_algebra", "B + A") == (
+        "linear_algebra:A+B"
+    )
+    assert canonicalizer.key("basic_math", "2 ** 3") != (
+        canonicalizer.key("basic_math", "2 ^ 3")
+    )
+    assert canonicalizer.key("calculus", "derivative x**2") == (
+        canonicalizer.key("calculus", "derivative x^2")
+    )
+
+
+def test_normalize_preserves_spacing_semantics():
+    """Canonicalizer - normalize sadece bosluklari sadelestirir"""
+    canonicalizer = ExpressionCanonicalizer()
+
+    assert canonicalizer.normalize("  2 ×  3.0 ") == "2 * 3.0"
+
+
+def test_replay_cache_hits_counts_canonical_duplicates(tmp_path):
+    """Replay - kanonik anahtarlar ham metinden fazla hit uretir"""
+    path = tmp_path / "requests.jsonl"
+    lines = [
+        json.dumps({"command": "2+3"}),
+        json.dumps({"command": " 2 + 3 "}),
+        json.dumps({"command": "!basic 2+3"}),
+        json.dumps({"command": "2+3"}),
+        json.dumps({"request_id": "no-command"}),
+        "!calculus derivative x^2",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    stats = replay_cache_hits(_read_commands(str(path)))
+
+    assert stats["requests"] == 5
+    assert stats["raw_hits"] == 1
+    assert stats["canonical_hits"] == 3
@@ -0,0 +1,59 @@
+"""Tests for the Gemini circuit breaker"""
+
+from unittest.mock import patch
+from src.core.circuit_breaker import CircuitBreaker
+
+
+def test_circuit_opens_on_error_rate():
+    """CircuitBreaker - hata orani esigi asilinca devre acilir"""
+    breaker = CircuitBreaker(failure_threshold=0.5, window=4, min_calls=4)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_circuit_half_open_probe_closes_on_success():
+    """CircuitBreaker - sure dolunca tek deneme, basariyla kapanir"""
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=0.0):
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10)
+        breaker.record_failure()
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=5.0):
+        assert breaker.allow_request() is False
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=10.0):
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.allow_request() is True
+
+
+def test_circuit_half_open_probe_failure_reopens():
+    """CircuitBreaker - basarisiz deneme devreyi yeniden acar"""
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=0.0):
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10)
+        breaker.record_failure()
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=10.0):
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == "open"
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=15.0):
+        assert breaker.allow_request() is False
+
+
+def test_circuit_release_returns_probe():
+    """CircuitBreaker - sonucsuz deneme hakki iade edilir"""
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=0.0):
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10)
+        breaker.record_failure()
+    with patch('src.core.circuit_breaker.time.monotonic', return_value=10.0):
+        assert breaker.allow_request() is True
+        breaker.release()
+        assert breaker.allow_request() is True
@@ -0,0 +1,45 @@
+"""Tests for per-request deadlines"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.deadline import (
+    Deadline,
+    check_deadline,
+    current_deadline,
+    remaining_time,
+)
+from src.utils.exceptions import DeadlineExceededError
+
+
+def test_deadline_remaining_and_expiry():
+    """Deadline - kalan sure azalir, dolunca check hata verir"""
+    with patch('src.core.deadline.time.monotonic', return_value=100.0):
+        deadline = Deadline(5)
+    with patch('src.core.deadline.time.monotonic', return_value=103.0):
+        assert deadline.remaining() == pytest.approx(2.0)
+        assert deadline.expired is False
+        deadline.check("parse")
+    with patch('src.core.deadline.time.monotonic', return_value=106.0):
+        assert deadline.remaining() == 0.0
+        assert deadline.expired is True
+        with pytest.raises(DeadlineExceededError, match="plot"):
+            deadline.check("plot")
+
+
+def test_deadline_helpers_without_active_deadline():
+    """remaining_time/check_deadline - deadline yoksa sinir yoktur"""
+    assert remaining_time() is None
+    check_deadline("gemini")
+
+
+def test_deadline_helpers_use_context_deadline():
+    """remaining_time/check_deadline - context'teki deadline kullanilir"""
+    token = current_deadline.set(Deadline(0))
+    try:
+        assert remaining_time() == 0.0
+        with pytest.raises(DeadlineExceededError):
+            check_deadline("gemini")
+    finally:
+        current_deadline.reset(token)
@@ -0,0 +1,109 @@
+"""Tests for the fake LLM backend"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config.prompts import BASIC_MATH_PROMPT, BATCH_PROMPT
+from src.config.settings import settings
+from src.core.agent import GeminiAgent
+from src.core.fake_backend import (
+    FakeBackend,
+    benchmark_throughput,
+    latency_percentile,
+)
+from src.utils.exceptions import GeminiAPIError
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_answers_single_and_batch_prompts():
+    """FakeBackend - tek ve batch prompt icin hazir cevap"""
+    backend = FakeBackend(latency_ms=0, answers={"2 + 2": 4.0})
+
+    single = json.loads(await backend.generate(
+        BASIC_MATH_PROMPT.format(expression="2 + 2"), {}
+    ))
+    batch = json.loads(await backend.generate(
+        BATCH_PROMPT.format(
+            domain_prompt="gorev", count=2, expressions="0: 2 + 2\n1: 3 * 3"
+        ),
+        {},
+    ))
+
+    assert single["result"] == 4.0
+    assert [item["index"] for item in batch["results"]] == [0, 1]
+    assert batch["results"][0]["result"] == 4.0
+    assert batch["results"][1]["result"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_stream_reassembles_response():
+    """FakeBackend - akis parcalari birlesince tam yanit olusur"""
+    backend = FakeBackend(latency_ms=0, default_result=7)
+    prompt = BASIC_MATH_PROMPT.format(expression="3 + 4")
+
+    chunks = [chunk async for chunk in backend.stream(prompt, {})]
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == backend.respond(prompt)
+
+
+def test_fake_backend_latency_distributions():
+    """FakeBackend - dagilimlarin ortalamasi latency_ms civarinda"""
+    for distribution in ("fixed", "uniform", "exponential", "lognormal"):
+        backend = FakeBackend(
+            latency_ms=100, distribution=distribution, seed=1
+        )
+        samples = [backend.sample_latency() for _ in range(2000)]
+        assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.1)
+
+    with pytest.raises(ValueError):
+        FakeBackend(distribution="gamma")
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_errors_are_classified_like_gemini():
+    """FakeBackend - 429 hatasi limiter'i yavaslatir, retry'lar tukenir"""
+    backend = FakeBackend(latency_ms=0, throttle_rate=1.0)
+    agent = GeminiAgent(api_key="unused", backend=backend)
+    rate = agent.rate_limiter.calls_per_minute
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(GeminiAPIError, match="429"):
+            await agent.generate_with_retry("Ifade: 1", max_retries=2)
+
+    assert backend.calls == 2
+    assert agent.rate_limiter.calls_per_minute < rate
+
+
+@pytest.mark.asyncio
+async def test_gemini_agent_uses_fake_backend_from_settings():
+    """GeminiAgent - LLM_BACKEND=fake ile API key gerekmez"""
+    with patch.object(settings, "LLM_BACKEND", "fake"), \
+            patch.object(settings, "GEMINI_API_KEY", ""), \
+            patch.object(settings, "FAKE_LATENCY_MS", 0):
+        agent = GeminiAgent()
+
+    response = await agent.generate_json_response(
+        BASIC_MATH_PROMPT.format(expression="1 + 1")
+    )
+
+    assert isinstance(agent.backend, FakeBackend)
+    assert response["result"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_benchmark_throughput_reports_latency_and_errors():
+    """benchmark_throughput - RPS, yuzdelikler ve hata sayisi"""
+    agent = MagicMock()
+    agent.process_command = AsyncMock(
+        side_effect=["✅ Sonuc: 1", "❌ Hesaplama hatasi: x", "✅ Sonuc: 3"]
+    )
+
+    stats = await benchmark_throughput(agent, ["a", "b", "c"], 2)
+
+    assert stats["requests"] == 3
+    assert stats["errors"] == 1
+    assert stats["rps"] > 0
+    assert latency_percentile([0.001, 0.002, 0.003], 50) == 2.0
@@ -0,0 +1,88 @@
+"""Tests for request hedging"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from src.core.hedging import RequestHedger
+
+
+def _warmed_hedger(latency: float = 0.01, **kwargs) -> RequestHedger:
+    hedger = RequestHedger(min_samples=5, **kwargs)
+    for _ in range(5):
+        hedger.record(latency)
+    hedger.calls = 20
+    return hedger
+
+
+def _fake_backend(delays):
+    """Her cagrida siradaki gecikme ile cevap veren sahte backend"""
+    calls = []
+
+    async def call():
+        index = len(calls)
+        calls.append(index)
+        try:
+            await asyncio.sleep(delays[index])
+        except asyncio.CancelledError:
+            calls[index] = "cancelled"
+            raise
+        return f"response-{index}"
+
+    return call, calls
+
+
+@pytest.mark.asyncio
+async def test_hedger_no_hedge_without_samples():
+    """Hedger - olcum yokken hedge yapilmaz"""
+    hedger = RequestHedger(min_samples=5)
+    call, calls = _fake_backend([0.02])
+
+    assert await hedger.run(call) == "response-0"
+    assert hedger.stats()["hedges"] == 0
+    assert len(hedger._latencies) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedger_slow_call_is_hedged_and_loser_cancelled():
+    """Hedger - yavas cagri kopyalanir, kaybeden iptal edilir"""
+    hedger = _warmed_hedger()
+    call, calls = _fake_backend([1.0, 0.01])
+    permit = AsyncMock()
+
+    result = await hedger.run(call, permit)
+    await asyncio.sleep(0)
+
+    assert result == "response-1"
+    assert calls == ["cancelled", 1]
+    permit.assert_awaited_once()
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedger_respects_traffic_fraction():
+    """Hedger - hedge butcesi dolunca kopya gonderilmez"""
+    hedger = _warmed_hedger(max_fraction=0.05)
+    hedger.hedges = 1
+    call, calls = _fake_backend([0.05, 0.01])
+
+    assert await hedger.run(call) == "response-0"
+    assert calls == [0]
+
+
+@pytest.mark.asyncio
+async def test_hedger_falls_back_when_hedge_fails():
+    """Hedger - hedge hata verirse ilk cagri beklenir"""
+    hedger = _warmed_hedger()
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) == 2:
+            raise RuntimeError("hedge failed")
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    assert await hedger.run(call) == "primary"
+    assert hedger.stats()["hedges"] == 1
+    assert hedger.stats()["hedge_wins"] == 0
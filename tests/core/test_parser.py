@@ -247,3 +247,11 @@ def test_parser_turkish_keywords():
 
     module, expression = parser.parse("ortalama hesapla")
     assert module == "statistics"
+
+
+def test_parser_normalizes_expression():
+    """Parser - Unicode operatorler ve fazla bosluklar normalize edilir"""
+    parser = CommandParser()
+    module, expression = parser.parse("  !basic   6 ÷ 2 ×  3 ")
+    assert module == "basic_math"
+    assert expression == "6 / 2 * 3"
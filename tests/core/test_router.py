@@ -0,0 +1,387 @@
+"""Tests for hybrid local/Gemini router"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.core.deadline import Deadline, current_deadline
+from src.core.router import HybridRouter
+from src.modules.basic_math import BasicMathModule
+from src.modules.calculus import CalculusModule
+from src.utils.cache import PersistentCache
+from src.utils.exceptions import DeadlineExceededError, InvalidInputError
+
+
+@pytest.mark.asyncio
+async def test_router_local_engine_first(mock_gemini_agent):
+    """Router - yerel motor sonucu Gemini cagrilmadan doner"""
+    router = HybridRouter({"basic_math": "local"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await router.route("basic_math", module, "2 + 3 * 4")
+
+    assert result.result == 14.0
+    assert result.engine == "local"
+    assert router.stats() == {"basic_math": {"local": 1}}
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_router_declined_falls_back_to_gemini(mock_gemini_agent):
+    """Router - yerel motor reddederse Gemini'ye gider"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 3.0,
+        "steps": ["7 // 2 = 3"],
+        "confidence_score": 1.0,
+    }
+    router = HybridRouter({"basic_math": "local"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await router.route("basic_math", module, "7 // 2")
+
+    assert result.result == 3.0
+    assert result.engine == "gemini"
+    assert router.stats()["basic_math"] == {"declined": 1, "gemini": 1}
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_router_time_budget_exceeded(mock_gemini_agent):
+    """Router - zaman butcesi asilirsa Gemini'ye gider"""
+    router = HybridRouter({"calculus": "local"}, {"calculus": 0.01})
+    module = CalculusModule(mock_gemini_agent)
+
+    async def slow_local(expression, **kwargs):
+        await asyncio.sleep(1)
+
+    with patch.object(module, "calculate_locally", side_effect=slow_local):
+        result = await router.route("calculus", module, "derivative x^2")
+
+    assert result.engine == "gemini"
+    assert router.stats()["calculus"]["timeout"] == 1
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_router_local_failure_falls_back(mock_gemini_agent):
+    """Router - yerel motor hatasi Gemini'ye devredilir"""
+    router = HybridRouter({"calculus": "local"}, {"calculus": 1.0})
+    module = CalculusModule(mock_gemini_agent)
+
+    with patch.object(
+        module, "calculate_locally",
+        new_callable=AsyncMock, side_effect=RuntimeError("boom")
+    ):
+        result = await router.route("calculus", module, "derivative x^2")
+
+    assert result.engine == "gemini"
+    assert router.stats()["calculus"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_gemini_mode_skips_local(mock_gemini_agent):
+    """Router - gemini modunda yerel motor denenmez"""
+    router = HybridRouter({"basic_math": "gemini"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    with patch.object(module, "calculate_locally") as mock_local:
+        result = await router.route("basic_math", module, "2 + 2")
+
+    mock_local.assert_not_called()
+    assert result.engine == "gemini"
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_router_invalid_input_propagates(mock_gemini_agent):
+    """Router - gecersiz giris Gemini'ye devredilmez"""
+    router = HybridRouter({"basic_math": "local"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    with pytest.raises(InvalidInputError):
+        await router.route("basic_math", module, "")
+
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_router_race_local_wins_and_cancels_gemini(mock_gemini_agent):
+    """Router - race: yerel motor kazanir, Gemini cagrisi iptal edilir"""
+    cancelled = asyncio.Event()
+
+    async def slow_gemini(prompt, **kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_gemini_agent.generate_json_response.side_effect = slow_gemini
+    router = HybridRouter({"calculus": "race"}, {"calculus": 5.0})
+    module = CalculusModule(mock_gemini_agent)
+
+    result = await router.route("calculus", module, "derivative x^3 at x=2")
+
+    assert result.result == 12.0
+    assert result.engine == "local"
+    assert cancelled.is_set()
+    assert router.stats()["calculus"] == {"race_local_wins": 1}
+
+
+@pytest.mark.asyncio
+async def test_router_race_gemini_wins_when_local_slow(mock_gemini_agent):
+    """Router - race: yerel motor yavassa Gemini kazanir"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 1.0,
+        "steps": ["Gemini"],
+        "confidence_score": 1.0,
+    }
+    router = HybridRouter({"calculus": "race"}, {"calculus": 5.0})
+    module = CalculusModule(mock_gemini_agent)
+
+    async def slow_local(expression, **kwargs):
+        await asyncio.sleep(5)
+
+    with patch.object(module, "calculate_locally", side_effect=slow_local):
+        result = await router.route("calculus", module, "integral x^x")
+
+    assert result.engine == "gemini"
+    assert router.stats()["calculus"] == {"race_gemini_wins": 1}
+
+
+@pytest.mark.asyncio
+async def test_router_race_declined_local_waits_for_gemini(
+    mock_gemini_agent
+):
+    """Router - race: yerel motor reddederse Gemini sonucu beklenir"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": [2.0, 1.0],
+        "steps": ["grad f = (2x, 1)"],
+        "confidence_score": 1.0,
+    }
+    router = HybridRouter({"calculus": "race"}, {"calculus": 5.0})
+    module = CalculusModule(mock_gemini_agent)
+
+    result = await router.route("calculus", module, "gradient of x^2 + y")
+
+    assert result.result == [2.0, 1.0]
+    assert router.stats()["calculus"]["race_gemini_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_race_gemini_error_uses_local(mock_gemini_agent):
+    """Router - race: Gemini hata verirse yerel sonuc kullanilir"""
+    mock_gemini_agent.generate_json_response.side_effect = RuntimeError(
+        "API Error"
+    )
+    router = HybridRouter({"basic_math": "race"}, {"basic_math": 5.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await router.route("basic_math", module, "6 / 4")
+
+    assert result.result == 1.5
+    assert result.engine == "local"
+
+
+@pytest.mark.asyncio
+async def test_router_result_cache_survives_restart(
+    mock_gemini_agent, tmp_path
+):
+    """Router - kalici cache yeni router instance'inda da kullanilir"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 3.0,
+        "steps": ["7 // 2 = 3"],
+        "confidence_score": 1.0,
+    }
+    path = str(tmp_path / "results.sqlite3")
+    module = BasicMathModule(mock_gemini_agent)
+
+    first = HybridRouter(
+        {"basic_math": "local"}, {"basic_math": 1.0},
+        result_cache=PersistentCache(path),
+    )
+    await first.route("basic_math", module, "7 // 2")
+
+    restarted = HybridRouter(
+        {"basic_math": "local"}, {"basic_math": 1.0},
+        result_cache=PersistentCache(path),
+    )
+    result = await restarted.route("basic_math", module, " 7  // 2 ")
+
+    assert result.result == 3.0
+    assert result.steps == ["7 // 2 = 3"]
+    assert result.engine == "cache"
+    assert restarted.stats()["basic_math"] == {"cache": 1}
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_router_result_cache_skips_errors(mock_gemini_agent, tmp_path):
+    """Router - hatali sonuclar kalici cache'e yazilmaz"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": "hata",
+        "error": "Hesaplanamadi",
+    }
+    cache = PersistentCache(str(tmp_path / "results.sqlite3"))
+    router = HybridRouter(
+        {"basic_math": "gemini"}, {}, result_cache=cache
+    )
+    module = BasicMathModule(mock_gemini_agent)
+
+    await router.route("basic_math", module, "7 // 2")
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_router_answer_only_results_cached_separately(
+    mock_gemini_agent, tmp_path
+):
+    """Router - adimsiz sonuc adim isteyen istege cache'ten verilmez"""
+    from src.core.explain import explain_steps
+
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 8.0,
+        "confidence_score": 1.0,
+    }
+    router = HybridRouter(
+        {"basic_math": "gemini"}, {},
+        result_cache=PersistentCache(str(tmp_path / "results.sqlite3")),
+    )
+    module = BasicMathModule(mock_gemini_agent)
+
+    token = explain_steps.set(False)
+    try:
+        await router.route("basic_math", module, "7 // 2")
+        cached = await router.route("basic_math", module, "7 // 2")
+    finally:
+        explain_steps.reset(token)
+    assert cached.engine == "cache"
+
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 8.0,
+        "steps": ["7 // 2 = 3"],
+        "confidence_score": 1.0,
+    }
+    explained = await router.route("basic_math", module, "7 // 2")
+    assert explained.engine == "gemini"
+    assert explained.steps == ["7 // 2 = 3"]
+    assert mock_gemini_agent.generate_json_response.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_router_selects_model_tier(mock_gemini_agent):
+    """Router - yerel motorun cozemedigi ifade guclu katmana gider"""
+    from src.core.tiering import ModelTierSelector, model_tier
+
+    tiers = []
+
+    async def respond(prompt, **kwargs):
+        tiers.append(model_tier.get())
+        return {"result": 1.0, "steps": [], "confidence_score": 1.0}
+
+    mock_gemini_agent.generate_json_response.side_effect = respond
+    router = HybridRouter(
+        {"basic_math": "local"}, {"basic_math": 1.0},
+        tier_selector=ModelTierSelector(threshold=0.3),
+    )
+    module = BasicMathModule(mock_gemini_agent)
+
+    with patch.object(
+        module, 'calculate_locally', new_callable=AsyncMock,
+        return_value=None
+    ):
+        await router.route("basic_math", module, "2 + 2")
+    router.modes["basic_math"] = "gemini"
+    await router.route("basic_math", module, "3 + 3")
+
+    assert tiers == ["strong", "fast"]
+    assert router.stats()["basic_math"]["tier_strong"] == 1
+    assert router.stats()["basic_math"]["tier_fast"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_deduplicates_concurrent_requests(mock_gemini_agent):
+    """Router - eszamanli ayni istekler tek Gemini cagrisi paylasir"""
+    async def slow_response(prompt, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"result": 8.0, "steps": [], "confidence_score": 1.0}
+
+    mock_gemini_agent.generate_json_response.side_effect = slow_response
+    router = HybridRouter({"basic_math": "gemini"}, {})
+    module = BasicMathModule(mock_gemini_agent)
+
+    results = await asyncio.gather(
+        router.route("basic_math", module, "2 ** 3"),
+        router.route("basic_math", module, " 2**3 "),
+        router.route("basic_math", module, "2 ** 3.0"),
+    )
+
+    assert [result.result for result in results] == [8.0, 8.0, 8.0]
+    assert router.in_flight.stats()["shared"] == 2
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_router_shared_call_uses_latest_deadline(mock_gemini_agent):
+    """Router - paylasilan cagri bekleyenlerin en gec deadline'i ile yurur"""
+    seen = []
+
+    async def slow_response(prompt, **kwargs):
+        seen.append(current_deadline.get())
+        await asyncio.sleep(0.05)
+        return {"result": 8.0, "steps": [], "confidence_score": 1.0}
+
+    mock_gemini_agent.generate_json_response.side_effect = slow_response
+    router = HybridRouter({"basic_math": "gemini"}, {})
+    module = BasicMathModule(mock_gemini_agent)
+
+    async def route(timeout):
+        current_deadline.set(Deadline(timeout))
+        return await router.route("basic_math", module, "7 // 2")
+
+    results = await asyncio.gather(
+        route(0.01), route(1.0), return_exceptions=True
+    )
+
+    assert isinstance(results[0], DeadlineExceededError)
+    assert results[1].result == 8.0
+    assert len(seen) == 1
+    assert seen[0].timeout == 1.0
+
+
+@pytest.mark.asyncio
+async def test_router_circuit_open_uses_local_engine(mock_gemini_agent):
+    """Router - devre acikken gemini modu yerel motora duser"""
+    from src.utils.exceptions import CircuitOpenError
+
+    mock_gemini_agent.generate_json_response.side_effect = (
+        CircuitOpenError("open")
+    )
+    router = HybridRouter({"basic_math": "gemini"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await router.route("basic_math", module, "2 + 3")
+
+    assert result.result == 5.0
+    assert result.engine == "local"
+    assert router.stats()["basic_math"] == {"circuit_open": 1, "local": 1}
+
+
+@pytest.mark.asyncio
+async def test_router_circuit_open_returns_degraded(mock_gemini_agent):
+    """Router - yerel sonuc yoksa degraded etiketli sonuc doner"""
+    from src.utils.exceptions import CircuitOpenError
+
+    mock_gemini_agent.generate_json_response.side_effect = (
+        CircuitOpenError("open")
+    )
+    router = HybridRouter({"basic_math": "local"}, {"basic_math": 1.0})
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await router.route("basic_math", module, "7 // 2")
+
+    assert result.engine == "degraded"
+    assert "Degraded mod" in result.error
+    assert result.confidence_score == 0.0
+    assert router.stats()["basic_math"]["degraded"] == 1
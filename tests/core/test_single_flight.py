@@ -0,0 +1,138 @@
+"""Tests for single-flight de-duplication"""
+
+import asyncio
+
+import pytest
+from src.core.deadline import Deadline, current_deadline
+from src.core.single_flight import SingleFlight
+from src.utils.exceptions import DeadlineExceededError
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    """SingleFlight - eszamanli ayni anahtarlar tek cagri yapar"""
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"result": [1, 2]}
+
+    results = await asyncio.gather(
+        *(flight.do("key", work) for _ in range(5))
+    )
+    results[0]["result"].append(3)
+
+    assert len(calls) == 1
+    assert results[1] == {"result": [1, 2]}
+    assert flight.stats() == {"in_flight": 0, "calls": 5, "shared": 4}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    """SingleFlight - hata tum bekleyenlere iletilir"""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", work), flight.do("key", work),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancel_keeps_other_waiters():
+    """SingleFlight - tek caller'in iptali paylasilan isi durdurmaz"""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return 42
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+    first.cancel()
+
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_work_without_waiters():
+    """SingleFlight - bekleyen kalmazsa is iptal edilir"""
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert await flight.do("key", _answer) == 7
+
+
+@pytest.mark.asyncio
+async def test_single_flight_deadline_is_per_caller():
+    """SingleFlight - caller'in suresi dolsa da digerleri sonucu alir"""
+    flight = SingleFlight()
+    seen = []
+
+    async def work():
+        seen.append(current_deadline.get())
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def call(timeout):
+        current_deadline.set(Deadline(timeout))
+        return await flight.do("key", work)
+
+    results = await asyncio.gather(
+        call(0.01), call(1.0), return_exceptions=True
+    )
+
+    assert isinstance(results[0], DeadlineExceededError)
+    assert results[1] == 42
+    # Paylasilan cagri en gec bitecek caller'in deadline'i ile calisir
+    assert seen[0].remaining() > 0.5
+
+
+@pytest.mark.asyncio
+async def test_single_flight_deadline_applies_to_abandoned_work():
+    """SingleFlight - tek caller'in deadline'i paylasilan isi sinirlar"""
+    flight = SingleFlight()
+    seen = []
+
+    async def work():
+        seen.append(current_deadline.get())
+        await asyncio.sleep(0.01)
+        return 42
+
+    token = current_deadline.set(Deadline(5))
+    try:
+        assert await flight.do("key", work) == 42
+        assert seen[0] is not current_deadline.get()
+        assert seen[0].expires_at == current_deadline.get().expires_at
+    finally:
+        current_deadline.reset(token)
+
+
+async def _answer():
+    return 7
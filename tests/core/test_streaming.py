@@ -0,0 +1,22 @@
+"""Tests for streamed JSON step parsing"""
+
+from src.core.streaming import StepStreamParser
+
+
+def test_step_stream_parser_yields_completed_steps():
+    """StepStreamParser - adimlar tamamlandikca doner"""
+    parser = StepStreamParser()
+
+    assert parser.feed('{"result": 12, "ste') == []
+    assert parser.feed('ps": ["f\'(x) = 3x') == []
+    assert parser.feed('^2", "f\'(2) = ') == ["f'(x) = 3x^2"]
+    assert parser.feed('12 \\"son\\""') == ['f\'(2) = 12 "son"']
+    assert parser.feed('], "confidence_score": 1.0}') == []
+
+
+def test_step_stream_parser_stops_on_non_string_steps():
+    """StepStreamParser - string olmayan adimda akis durur"""
+    parser = StepStreamParser()
+
+    assert parser.feed('{"steps": ["a", {"b": 1}, "c"]}') == ["a"]
+    assert parser.feed('"steps": ["d"]') == []
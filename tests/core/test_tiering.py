@@ -0,0 +1,172 @@
+"""Tests for model tiering"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.agent import GeminiAgent
+from src.core.streaming import STEPS_RESET, step_listener
+from src.core.tiering import (
+    ModelTierSelector,
+    TieredAgentPool,
+    complexity_score,
+    model_tier,
+    nesting_depth,
+)
+from src.utils.exceptions import CircuitOpenError
+
+
+def _agent(response):
+    """Sabit yanit donduren mock agent"""
+    agent = MagicMock(spec=GeminiAgent)
+    agent.model_name = "model"
+    agent.generate_json_response = AsyncMock(return_value=response)
+    return agent
+
+
+def test_complexity_score_components():
+    """complexity_score - modul, uzunluk, derinlik ve yerel red etkisi"""
+    assert nesting_depth("sin(cos((x)))") == 3
+    assert nesting_depth("mean [1,2,3]") == 1
+
+    simple = complexity_score("basic_math", "2 + 2")
+    nested = complexity_score("basic_math", "((2 + (3 * (4 - 1))))")
+    declined = complexity_score("basic_math", "2 + 2", local_declined=True)
+
+    assert simple < nested
+    assert simple < declined
+    assert complexity_score("calculus", "x") > simple
+
+
+def test_selector_routes_by_threshold():
+    """ModelTierSelector - esik alti hizli, ustu guclu model"""
+    selector = ModelTierSelector(threshold=0.5)
+
+    assert selector.select("basic_math", "2 + 2") == "fast"
+    assert selector.select("statistics", "mean [1,2,3]") == "fast"
+    assert selector.select("calculus", "integrate x^2") == "strong"
+    assert selector.select(
+        "financial", "npv 0.1 [100, 200]", local_declined=True
+    ) == "strong"
+
+
+@pytest.mark.asyncio
+async def test_pool_uses_selected_tier():
+    """TieredAgentPool - katman context degiskeninden okunur"""
+    fast = _agent({"result": 4.0, "confidence_score": 1.0})
+    strong = _agent({"result": 4.0, "confidence_score": 1.0})
+    pool = TieredAgentPool(fast, strong)
+
+    token = model_tier.set("fast")
+    try:
+        await pool.generate_json_response("p", max_output_tokens=64)
+    finally:
+        model_tier.reset(token)
+    await pool.generate_json_response("p")
+
+    fast.generate_json_response.assert_awaited_once_with(
+        "p", max_output_tokens=64
+    )
+    strong.generate_json_response.assert_awaited_once_with("p")
+    assert pool.stats()["escalations"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [
+    {"result": 4.0, "confidence_score": 0.3},
+    {"result": None},
+    {"result": "x", "error": "Hesaplanamadi"},
+    {"results": [{"index": 0, "result": 1.0}, {"index": 1}]},
+])
+async def test_pool_escalates_invalid_fast_results(response):
+    """TieredAgentPool - dogrulanamayan hizli sonuc guclu modele gider"""
+    fast = _agent(response)
+    strong = _agent({"result": 4.0, "confidence_score": 1.0})
+    pool = TieredAgentPool(fast, strong, min_confidence=0.7)
+
+    token = model_tier.set("fast")
+    try:
+        result = await pool.generate_json_response("p")
+    finally:
+        model_tier.reset(token)
+
+    assert result == {"result": 4.0, "confidence_score": 1.0}
+    assert pool.stats()["escalations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_escalates_when_fast_circuit_open():
+    """TieredAgentPool - hizli modelin devresi aciksa guclu model denenir"""
+    fast = _agent(None)
+    fast.generate_json_response.side_effect = CircuitOpenError("open")
+    strong = _agent({"result": 4.0})
+    pool = TieredAgentPool(fast, strong)
+
+    token = model_tier.set("fast")
+    try:
+        result = await pool.generate_json_response("p")
+    finally:
+        model_tier.reset(token)
+
+    assert result == {"result": 4.0}
+
+
+def _streaming_agent(response, steps):
+    """Adimlari step_listener'a ileten mock agent"""
+    agent = _agent(response)
+
+    async def generate(prompt, **kwargs):
+        for step in steps:
+            step_listener.get()(step)
+        return response
+
+    agent.generate_json_response.side_effect = generate
+    return agent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fast_confidence, expected", [
+    (1.0, ["hizli 1", "hizli 2"]),
+    (0.3, ["hizli 1", "hizli 2", STEPS_RESET, "guclu 1"]),
+])
+async def test_pool_streams_fast_tier_live_and_resets_on_escalation(
+    fast_confidence, expected
+):
+    """TieredAgentPool - hizli katman canli akar, yukseltmede sifirlanir"""
+    fast = _streaming_agent(
+        {"result": 4.0, "confidence_score": fast_confidence},
+        ["hizli 1", "hizli 2"],
+    )
+    strong = _streaming_agent({"result": 4.0}, ["guclu 1"])
+    pool = TieredAgentPool(fast, strong, min_confidence=0.7)
+    streamed = []
+
+    tier_token = model_tier.set("fast")
+    listener_token = step_listener.set(streamed.append)
+    try:
+        await pool.generate_json_response("p")
+    finally:
+        step_listener.reset(listener_token)
+        model_tier.reset(tier_token)
+
+    assert streamed == expected
+
+
+@pytest.mark.asyncio
+async def test_pool_escalation_without_streamed_steps_sends_no_reset():
+    """TieredAgentPool - adim akmadiysa yukseltmede reset gonderilmez"""
+    fast = _agent(None)
+    fast.generate_json_response.side_effect = CircuitOpenError("acik")
+    strong = _streaming_agent({"result": 4.0}, ["guclu 1"])
+    pool = TieredAgentPool(fast, strong)
+    streamed = []
+
+    tier_token = model_tier.set("fast")
+    listener_token = step_listener.set(streamed.append)
+    try:
+        await pool.generate_json_response("p")
+    finally:
+        step_listener.reset(listener_token)
+        model_tier.reset(tier_token)
+
+    assert streamed == ["guclu 1"]
@@ -0,0 +1 @@
+"""Engine tests package"""
@@ -0,0 +1,53 @@
+"""Tests for arithmetic engine"""
+
+import pytest
+from src.engines.arithmetic import (
+    ArithmeticEngine,
+    DIVISION_BY_ZERO_MESSAGE,
+)
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+def test_arithmetic_operator_precedence():
+    """Arithmetic engine - islem onceligi"""
+    response = ArithmeticEngine().evaluate("2 + 3 * 4")
+
+    assert response["result"] == 14.0
+    assert "3 * 4 = 12" in response["steps"]
+    assert "2 + 12 = 14" in response["steps"]
+    assert response["confidence_score"] == 1.0
+
+
+def test_arithmetic_unary_minus_and_decimals():
+    """Arithmetic engine - tekli eksi ve ondalik sayilar"""
+    response = ArithmeticEngine().evaluate("-1.5 * (2 - .5)")
+
+    assert response["result"] == -2.25
+
+
+def test_arithmetic_division_by_zero():
+    """Arithmetic engine - sifira bolme hata sonucu dondurur"""
+    response = ArithmeticEngine().evaluate("5 / 0")
+
+    assert response["error"] == DIVISION_BY_ZERO_MESSAGE
+    assert "result" not in response
+
+
+def test_arithmetic_bounded_power():
+    """Arithmetic engine - sinirli us alma yerelde hesaplanir"""
+    engine = ArithmeticEngine()
+
+    assert engine.evaluate("2 ** 3")["result"] == 8.0
+    assert engine.evaluate("(-2) ** 3")["result"] == -8.0
+    assert engine.evaluate("4 ** -0.5")["result"] == 0.5
+    assert engine.evaluate("0 ** -1")["error"] == DIVISION_BY_ZERO_MESSAGE
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["2 ** 5000", "10 ** 400", "(-8) ** 0.5", "7 // 2", "1.2.3", "2 3"],
+)
+def test_arithmetic_unsupported_expression(expression):
+    """Arithmetic engine - desteklenmeyen ifadeler reddedilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        ArithmeticEngine().evaluate(expression)
@@ -0,0 +1,117 @@
+"""Tests for SymPy calculus engine"""
+
+import math
+
+import pytest
+from src.engines.calculus import (
+    INFINITE_RESULT_MESSAGE,
+    NON_FINITE_MESSAGE,
+    UNDEFINED_RESULT_MESSAGE,
+    CalculusEngine,
+)
+from src.engines.symbolic import load_sympy
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+@pytest.fixture
+def engine():
+    """Calculus engine fixture"""
+    return CalculusEngine(load_sympy, cache_size=16)
+
+
+def test_calculus_derivative_at_point(engine):
+    """Calculus engine - noktada turev (kesin ve sayisal sonuc)"""
+    response = engine.evaluate("derivative x^2 sin(x) at x=pi")
+
+    assert response["result"] == pytest.approx(-math.pi ** 2)
+    assert response["metadata"]["exact"] == "-pi^2"
+    assert response["metadata"]["derivative"] == (
+        "x^2*cos(x) + 2*x*sin(x)"
+    )
+
+
+def test_calculus_symbolic_derivative(engine):
+    """Calculus engine - sembolik turev string dondurur"""
+    response = engine.evaluate("d/dx e^x")
+
+    assert response["result"] == "exp(x)"
+
+
+def test_calculus_definite_integral(engine):
+    """Calculus engine - belirli integral"""
+    response = engine.evaluate("integral x^2 dx from 0 to 1")
+
+    assert response["result"] == pytest.approx(1 / 3)
+    assert response["metadata"]["exact"] == "1/3"
+
+
+def test_calculus_indefinite_integral(engine):
+    """Calculus engine - belirsiz integral + C"""
+    response = engine.evaluate("integrate cos(x)")
+
+    assert response["result"] == "sin(x) + C"
+
+
+def test_calculus_numeric_integral_fallback(engine):
+    """Calculus engine - kapali formu olmayan integral sayisal hesaplanir"""
+    response = engine.evaluate("integral x^x from 0 to 1")
+
+    assert response["result"] == pytest.approx(0.7834305107)
+
+
+def test_calculus_one_sided_limit(engine):
+    """Calculus engine - tek yonlu limit"""
+    assert engine.evaluate("limit sin(x)/x as x->0")["result"] == 1.0
+    assert engine.evaluate("limit sin(x)/x as x->0+")["result"] == 1.0
+
+
+@pytest.mark.parametrize("expression, message", [
+    ("integral 1/x from -1 to 1", UNDEFINED_RESULT_MESSAGE),
+    ("limit 1/x as x->0", UNDEFINED_RESULT_MESSAGE),
+    ("derivative log(x) at x=0", UNDEFINED_RESULT_MESSAGE),
+    ("limit 1/x as x->0-", INFINITE_RESULT_MESSAGE),
+    ("derivative (x+1)^5000 at x=1", NON_FINITE_MESSAGE),
+])
+def test_calculus_non_finite_results_return_error(
+    engine, expression, message
+):
+    """Calculus engine - tanimsiz/sonsuz sonuc cevap olarak donmez"""
+    response = engine.evaluate(expression)
+
+    assert response["error"].startswith(message)
+    assert "result" not in response
+
+
+def test_calculus_taylor_series(engine):
+    """Calculus engine - Taylor polinomu"""
+    response = engine.evaluate("taylor sin(x) at x=0 order 6")
+
+    assert response["result"] == "x^5/120 - x^3/6 + x"
+    assert response["metadata"]["order"] == 6
+
+
+def test_calculus_results_are_cached(engine):
+    """Calculus engine - ayni kanonik ifade cache'ten gelir"""
+    engine.evaluate("derivative x^3 at x=2")
+    engine.evaluate("derivative   x^3   at x=2")
+
+    assert engine.parser.cache.hits >= 1
+    assert engine.cache.hits >= 1
+
+
+@pytest.mark.parametrize("expression", [
+    "x^2 + 1",
+    "derivative __class__",
+    "derivative foo(x)",
+    "limit sin(x)/x",
+    "derivative pi.n(4*10^5)",
+    "derivative (x).diff(x)",
+    "derivative 2.5.n()",
+    "derivative 9^9^9",
+    "integral x^(10^10^10)",
+    "limit 10^400 x as x->1",
+])
+def test_calculus_unsupported_expression(engine, expression):
+    """Calculus engine - yorumlanamayan/guvensiz ifadeler reddedilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        engine.evaluate(expression)
@@ -0,0 +1,116 @@
+"""Tests for equation engine"""
+
+import pytest
+import sympy
+from src.engines.equation import EquationEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+@pytest.fixture
+def engine():
+    """SymPy ile calisan denklem motoru"""
+    return EquationEngine(lambda: sympy)
+
+
+def test_equation_quadratic_roots(engine):
+    """Equation engine - ikinci derece polinom"""
+    response = engine.evaluate("2x^2 - 5x + 3 = 0")
+
+    assert response["result"] == [1.0, 1.5]
+    assert response["metadata"]["degree"] == 2
+
+
+def test_equation_multiplicities(engine):
+    """Equation engine - katli kokler karesiz carpanlardan gelir"""
+    response = engine.evaluate("x^4 - 2x^2 + 1 = 0")
+
+    assert response["result"] == [-1.0, 1.0]
+    assert response["metadata"]["real_roots"] == [
+        {"value": -1.0, "multiplicity": 2},
+        {"value": 1.0, "multiplicity": 2},
+    ]
+    assert "x = 1 (katlilik 2)" in response["steps"]
+
+
+def test_equation_purely_complex_roots(engine):
+    """Equation engine - gercel kok yoksa bos gercel liste"""
+    response = engine.evaluate("x^2 + 1 = 0")
+
+    assert response["result"]["real"] == []
+    assert len(response["result"]["complex"]) == 2
+
+
+def test_equation_rational_excludes_poles(engine):
+    """Equation engine - paydayi sifirlayan kok atilir"""
+    response = engine.evaluate("(x^2 - 1)/(x - 1) = 0")
+
+    assert response["result"] == [-1.0]
+
+
+def test_equation_symbolic_parameters(engine):
+    """Equation engine - parametreli denklem SymPy solve ile"""
+    response = engine.evaluate("solve a x + b = 0 for x")
+
+    assert response["result"] == {"x": ["-b/a"]}
+    assert response["metadata"]["method"] == "symbolic"
+
+
+def test_equation_algebraic_radical(engine):
+    """Equation engine - koklu denklem"""
+    response = engine.evaluate("sqrt(x) = 3")
+
+    assert response["result"] == [9.0]
+    assert response["metadata"]["exact"] == ["9"]
+
+
+def test_equation_transcendental_scan(engine):
+    """Equation engine - transandant denklem aralik taramasi"""
+    response = engine.evaluate("cos(x) = x")
+
+    assert response["result"] == pytest.approx([0.7390851332])
+    assert response["metadata"]["method"] == "numeric"
+    assert response["metadata"]["interval"] == [-10.0, 10.0]
+
+
+def test_equation_tangent_roots_and_interval(engine):
+    """Equation engine - isaret degistirmeyen kokler ve ozel aralik"""
+    response = engine.evaluate("sin(x)^2 = 0 between -4 and 4")
+
+    assert response["result"] == pytest.approx(
+        [-3.1415926536, 0.0, 3.1415926536]
+    )
+
+
+def test_equation_poles_are_not_roots(engine):
+    """Equation engine - tan(x) kutuplari kok sayilmaz"""
+    response = engine.evaluate("tan(x) = 0 in [-2, 2]")
+
+    assert response["result"] == [0.0]
+
+
+def test_equation_polynomial_roots_respect_interval(engine):
+    """Equation engine - polinom kokleri verilen araliga gore suzulur"""
+    response = engine.evaluate("x^3 - 2x = 0 in [0, 5]")
+
+    assert response["result"] == [0.0, 1.4142135624]
+    assert response["metadata"]["interval"] == [0.0, 5.0]
+    assert engine.evaluate("x^2 + 1 = 0 in [0, 5]")["result"] == []
+
+
+def test_equation_high_degree_rejected_before_expanding(engine):
+    """Equation engine - derece siniri ifade acilmadan kontrol edilir"""
+    with pytest.raises(UnsupportedExpressionError, match="derecesi"):
+        engine.evaluate("(x+1)^3000 = 0")
+
+    assert engine._degree_bound(sympy.sympify("(x+1)**3000")) == 3000
+    assert engine._degree_bound(sympy.sympify("x*(x+1)**2 + 1")) == 3
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["dy/dx = y", "x + y = 3, x - y = -1", "invalid equation", "2 = 2"],
+)
+def test_equation_unsupported_declined(engine, expression):
+    """Equation engine - sistemler ve ODE'ler Gemini'ye birakilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        engine.evaluate(expression)
@@ -0,0 +1,114 @@
+"""Tests for financial engine"""
+
+from decimal import Decimal
+
+import pytest
+from src.engines.financial import FinancialEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+def test_financial_npv_decimal():
+    """Financial engine - NPV Decimal olarak kuruşa yuvarlanir"""
+    response = FinancialEngine().evaluate(
+        "npv rate=10% [-1000, 300, 400, 500]"
+    )
+
+    assert response["result"] == Decimal("-21.04")
+    assert response["metadata"]["operation"] == "npv"
+    assert response["metadata"]["periods"] == 3
+
+
+def test_financial_irr_bracketed_newton():
+    """Financial engine - IRR NPV'yi sifirlar"""
+    engine = FinancialEngine()
+    cash_flows = [Decimal(cf) for cf in ("-1000", "300", "400", "500")]
+
+    response = engine.evaluate("irr [-1000, 300, 400, 500]")
+    irr = response["result"]
+
+    assert irr == Decimal("0.0889633947")
+    assert abs(engine._net_present_value(irr, cash_flows)) < Decimal("1e-6")
+
+
+def test_financial_irr_multiple_roots_prefers_smallest():
+    """Financial engine - birden fazla IRR varsa sifira en yakini secilir"""
+    response = FinancialEngine().evaluate("irr [-100, 230, -132]")
+
+    assert response["result"] == Decimal("0.1")
+    assert any("Uyari" in step for step in response["steps"])
+
+
+def test_financial_irr_without_sign_change_is_error():
+    """Financial engine - isaret degisimi yoksa hata dondurur"""
+    response = FinancialEngine().evaluate("irr [100, 200]")
+
+    assert "işaret değişimi" in response["error"]
+
+
+def test_financial_irr_outside_scan_range_declined():
+    """Financial engine - tarama araligi disindaki IRR Gemini'ye birakilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        FinancialEngine().evaluate("irr [-1, 0, 0, 0, 1000000]")
+
+
+def test_financial_loan_payment_and_currency():
+    """Financial engine - aylik anuite taksiti ve para birimi"""
+    response = FinancialEngine().evaluate(
+        "loan principal=10000 rate=5% years=3 currency=eur"
+    )
+
+    assert response["result"] == Decimal("299.71")
+    assert response["currency"] == "EUR"
+    assert response["metadata"]["total_interest"] == "789.52"
+    assert any("EUR" in step for step in response["steps"])
+
+
+def test_financial_compound_interest_and_present_value():
+    """Financial engine - bilesik faiz ve bugunku deger"""
+    engine = FinancialEngine()
+
+    compound = engine.evaluate(
+        "compound interest principal=1000 rate=5% years=10 n=12"
+    )
+    present = engine.evaluate("pv fv=1628.89 rate=5 years=10")
+
+    assert compound["result"] == Decimal("647.01")
+    assert compound["metadata"]["future_value"] == "1647.01"
+    assert present["result"] == Decimal("1000.00")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "NPV 1000 0.1 5",
+        "loan payment 10000 0.05 12",
+        "interest 10000 0.075",
+        "loan principal=10000 years=3",
+        "pv fv=1000 rate=1 years=2",
+    ],
+)
+def test_financial_ambiguous_expressions_declined(expression):
+    """Financial engine - belirsiz ifadeler Gemini'ye birakilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        FinancialEngine().evaluate(expression)
+
+
+@pytest.mark.parametrize(
+    "expression, message",
+    [
+        ("pv fv=1000 rate=5% years=1000000", "Dönem sayısı"),
+        ("npv rate=-100% [-1000, 300, 400, 500]", "Faiz oranı"),
+        ("fv principal=1000 rate=2000% years=2", "Faiz oranı"),
+        ("fv principal=1000 rate=5% years=2 m=1000", "Bileşik sıklığı"),
+        ("loan principal=10000 rate=5% periods=7.5", "tam sayı dönem"),
+        ("loan principal=10000 rate=5% months=7.5", "tam sayı dönem"),
+        ("fv principal=1000 rate=1000% years=36500", "sayısal sınırlar"),
+    ],
+)
+def test_financial_out_of_range_inputs_are_errors(expression, message):
+    """Financial engine - aralik disi girdiler Turkce hata dondurur"""
+    response = FinancialEngine().evaluate(expression)
+
+    assert message in response["error"]
+    assert response["error"].startswith("Hatalı işlem: ")
+    assert "<class" not in response["error"]
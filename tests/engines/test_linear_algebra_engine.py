@@ -0,0 +1,78 @@
+"""Tests for linear algebra engine"""
+
+import pytest
+from src.engines.linear_algebra import (
+    NON_FINITE_MESSAGE,
+    LinearAlgebraEngine,
+)
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+def test_linear_algebra_multiply():
+    """Linear algebra engine - matris carpimi"""
+    response = LinearAlgebraEngine().evaluate("[[1,2],[3,4]] * [[5],[6]]")
+
+    assert response["result"] == [[17.0], [39.0]]
+    assert response["metadata"]["operation"] == "multiply"
+
+
+def test_linear_algebra_determinant_is_cleaned():
+    """Linear algebra engine - determinant float gurultusu temizlenir"""
+    response = LinearAlgebraEngine().evaluate("determinant [[1,2],[3,4]]")
+
+    assert response["result"] == -2.0
+
+
+def test_linear_algebra_solve_system():
+    """Linear algebra engine - Ax = b cozumu"""
+    response = LinearAlgebraEngine().evaluate("solve [[3,1],[1,2]] [9,8]")
+
+    assert response["result"] == [2.0, 3.0]
+
+
+def test_linear_algebra_complex_eigenvalues():
+    """Linear algebra engine - kompleks ozdegerler real/imag dondurur"""
+    response = LinearAlgebraEngine().evaluate("eigenvalues [[0,-1],[1,0]]")
+
+    assert response["result"] == {"real": [0.0, 0.0], "imag": [1.0, -1.0]}
+
+
+def test_linear_algebra_singular_inverse_returns_error():
+    """Linear algebra engine - tekil matrisin tersi hata dondurur"""
+    response = LinearAlgebraEngine().evaluate("inverse [[1,2],[2,4]]")
+
+    assert "tekil" in response["error"]
+    assert "result" not in response
+
+
+@pytest.mark.parametrize("expression", [
+    "[[1,2]] + [[1],[2]]",
+    "[1,2,3] - [[1,2,3],[4,5,6]]",
+])
+def test_linear_algebra_mismatched_shapes_return_error(expression):
+    """Linear algebra engine - toplama/cikarma broadcasting yapmaz"""
+    response = LinearAlgebraEngine().evaluate(expression)
+
+    assert "uyumsuz" in response["error"]
+    assert "result" not in response
+
+
+def test_linear_algebra_overflow_returns_error():
+    """Linear algebra engine - sonsuz sonuc hata dondurur"""
+    response = LinearAlgebraEngine().evaluate(
+        "[[1e308,1e308]] + [[1e308,1e308]]"
+    )
+
+    assert response["error"] == NON_FINITE_MESSAGE
+    assert "result" not in response
+
+
+@pytest.mark.parametrize("expression", [
+    "[[1,2],[3,4]]",
+    "rotate [[1,2],[3,4]] by 90 degrees",
+    "determinant [[1,2],[3,4]] [[1,0],[0,1]]",
+])
+def test_linear_algebra_unsupported_expression(expression):
+    """Linear algebra engine - yorumlanamayan ifadeler reddedilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        LinearAlgebraEngine().evaluate(expression)
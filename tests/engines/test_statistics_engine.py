@@ -0,0 +1,94 @@
+"""Tests for statistics engine"""
+
+import numpy as np
+import pytest
+from src.engines.numeric import parse_vector
+from src.engines.statistics import StatisticsEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+def test_parse_vector_contiguous_float64():
+    """parse_vector - contiguous float64 dizi"""
+    values = parse_vector("[1, 2.5, -3]")
+
+    assert values.dtype == np.float64
+    assert values.flags["C_CONTIGUOUS"]
+    assert values.tolist() == [1.0, 2.5, -3.0]
+
+
+def test_statistics_mean_metadata():
+    """Statistics engine - ortalama ve metadata"""
+    response = StatisticsEngine().evaluate("mean [1,2,3,4,5]")
+
+    assert response["result"] == 3.0
+    assert response["metadata"] == {
+        "statistic_type": "mean", "sample_size": 5, "data_points": 5
+    }
+
+
+def test_statistics_sample_and_population_std_dev():
+    """Statistics engine - orneklem (varsayilan) ve populasyon std"""
+    engine = StatisticsEngine()
+
+    sample = engine.evaluate("std dev [10,20,30,40,50]")
+    population = engine.evaluate("population std dev [10,20,30,40,50]")
+
+    assert sample["result"] == pytest.approx(15.8113883008)
+    assert population["result"] == pytest.approx(14.1421356237)
+    assert population["metadata"]["ddof"] == 0
+
+
+def test_statistics_multimodal():
+    """Statistics engine - birden fazla mod liste dondurur"""
+    response = StatisticsEngine().evaluate("mode [1,2,2,3,3]")
+
+    assert response["result"] == [2.0, 3.0]
+
+
+def test_statistics_z_score_from_parameters():
+    """Statistics engine - parametrelerden z-skor"""
+    response = StatisticsEngine().evaluate("z-score 75 mean=70 std=5")
+
+    assert response["result"] == 1.0
+    assert response["metadata"]["statistic_type"] == "z-score"
+
+
+def test_statistics_percentile_and_regression():
+    """Statistics engine - yuzdelik ve regresyon"""
+    engine = StatisticsEngine()
+
+    percentile = engine.evaluate("percentile 50 [10,20,30,40]")
+    regression = engine.evaluate("regression [1,2,3,4] [3,5,7,9]")
+
+    assert percentile["result"] == 25.0
+    assert regression["result"] == {
+        "slope": 2.0, "intercept": 1.0, "r_squared": 1.0
+    }
+
+
+def test_statistics_large_dataset():
+    """Statistics engine - binlerce veri noktasi"""
+    data = ",".join(str(i) for i in range(10000))
+    response = StatisticsEngine().evaluate(f"median [{data}]")
+
+    assert response["result"] == 4999.5
+    assert response["metadata"]["sample_size"] == 10000
+
+
+def test_statistics_mismatched_lengths_returns_error():
+    """Statistics engine - farkli uzunlukta veri setleri hata dondurur"""
+    response = StatisticsEngine().evaluate("correlation [1,2,3] [1,2]")
+
+    assert "ayni uzunlukta" in response["error"]
+
+
+@pytest.mark.parametrize("expression", [
+    "mean of heights in class",
+    "average salary [1,2,3]",
+    "mean 5 [1,2,3]",
+    "[1,2,3]",
+])
+def test_statistics_unsupported_expression(expression):
+    """Statistics engine - yorumlanamayan ifadeler reddedilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        StatisticsEngine().evaluate(expression)
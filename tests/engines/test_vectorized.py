@@ -0,0 +1,61 @@
+"""Tests for vectorized function compiler"""
+
+import numpy as np
+import pytest
+import sympy
+from src.engines.vectorized import FunctionCompiler
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+@pytest.fixture
+def compiler():
+    """SymPy ile calisan fonksiyon derleyicisi"""
+    return FunctionCompiler(lambda: sympy)
+
+
+def test_compile_matches_numpy(compiler):
+    """Function compiler - tum dizi tek geciste degerlendirilir"""
+    evaluate, variable = compiler.compile("y = exp(-x^2) cos(3x) + 2x")
+    x = np.linspace(-3, 3, 101)
+
+    assert variable == "x"
+    np.testing.assert_allclose(
+        evaluate(x), np.exp(-x ** 2) * np.cos(3 * x) + 2 * x
+    )
+
+
+def test_compile_poles_and_domain_give_non_finite(compiler):
+    """Function compiler - kutup ve tanim disi noktalar NaN/inf"""
+    reciprocal, _ = compiler.compile("1/x")
+    root, _ = compiler.compile("sqrt(x)")
+    x = np.array([-1.0, 0.0, 4.0])
+
+    assert np.isinf(reciprocal(x)[1])
+    assert np.isnan(root(x)[0])
+    assert root(x)[2] == 2.0
+
+
+def test_compile_real_cube_root_and_constant(compiler):
+    """Function compiler - negatif tabanda kup kok ve sabit fonksiyon"""
+    cube_root, _ = compiler.compile("x^(1/3)")
+    constant, _ = compiler.compile("f(x) = 5")
+    x = np.array([-8.0, 8.0])
+
+    np.testing.assert_allclose(cube_root(x), [-2.0, 2.0])
+    assert constant(x).tolist() == [5.0, 5.0]
+
+
+def test_compile_uses_single_free_variable(compiler):
+    """Function compiler - x disindaki tek degisken eksen olur"""
+    _, variable = compiler.compile("plot t^2")
+
+    assert variable == "t"
+
+
+@pytest.mark.parametrize(
+    "text", ["x y", "__import__('os')", "x^2 + I", "plot x.evalf(5)"]
+)
+def test_compile_rejects_unsupported(compiler, text):
+    """Function compiler - guvensiz ve cok degiskenli ifadeler reddedilir"""
+    with pytest.raises(UnsupportedExpressionError):
+        compiler.compile(text)
@@ -69,3 +69,82 @@ async def test_basic_math_missing_operand(mock_gemini_agent):
     )
     assert result.result == ""
     mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_basic_math_local_engine_skips_gemini(mock_gemini_agent):
+    """Dort islem yerel motorda hesaplanir, Gemini cagrilmaz"""
+    module = BasicMathModule(mock_gemini_agent)
+
+    result = await module.calculate_locally("10 - 4 / 2")
+
+    assert result.result == 8.0
+    assert result.domain == "basic_math"
+    assert len(result.steps) > 0
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression", ["0x10 + 1", "1e3+1", "1_000 + 1", "(2+3)*4"]
+)
+async def test_basic_math_local_path_applies_module_validation(
+    mock_gemini_agent, expression
+):
+    """Yerel yol Gemini yolunun reddettigi ifadeleri hesaplamaz"""
+    module = BasicMathModule(mock_gemini_agent)
+
+    local = await module.calculate_locally(expression)
+    remote = await module.calculate(expression)
+
+    assert local.error == remote.error == module.INVALID_EXPRESSION_MESSAGE
+    assert local.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_basic_math_unsupported_falls_back_to_gemini(
+    mock_gemini_agent
+):
+    """Yerel motorun desteklemedigi ifade Gemini'ye gider"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 3.0,
+        "steps": ["7 // 2 = 3"],
+        "confidence_score": 1.0,
+    }
+
+    module = BasicMathModule(mock_gemini_agent)
+    assert await module.calculate_locally("7 // 2") is None
+    result = await module.calculate("7 // 2")
+
+    assert result.result == 3.0
+    mock_gemini_agent.generate_json_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_basic_math_answer_only_prompt(mock_gemini_agent):
+    """Cevap modunda adimsiz prompt ve dusuk token siniri kullanilir"""
+    from src.config.settings import settings
+    from src.core.explain import explain_steps
+
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 4.0,
+        "confidence_score": 1.0,
+    }
+    module = BasicMathModule(mock_gemini_agent)
+
+    token = explain_steps.set(False)
+    try:
+        result = await module.calculate("2 + 2")
+    finally:
+        explain_steps.reset(token)
+
+    call = mock_gemini_agent.generate_json_response.call_args
+    assert '"steps"' in call.args[0]
+    assert "adim1" not in call.args[0]
+    assert call.kwargs["max_output_tokens"] == (
+        settings.ANSWER_ONLY_MAX_OUTPUT_TOKENS
+    )
+    assert result.result == 4.0
+    assert result.steps == []
@@ -55,3 +55,35 @@ async def test_calculus_integral(mock_gemini_agent):
     assert abs(result.result - 1/3) < 0.0001
     assert len(result.steps) > 0
     assert result.confidence_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_calculus_local_engine_skips_gemini(mock_gemini_agent):
+    """Kalkulus ifadeleri yerel SymPy motorunda hesaplanir"""
+    module = CalculusModule(mock_gemini_agent)
+
+    result = await module.calculate_locally("derivative x^2 at x=3")
+
+    assert result.result == 6.0
+    assert result.domain == "calculus"
+    assert result.metadata["exact"] == "6"
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_calculus_unparsed_falls_back_to_gemini(mock_gemini_agent):
+    """Yerel motorun yorumlayamadigi ifade Gemini'ye gider"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": [2.0, 1.0],
+        "steps": ["grad f = (2x, 1)"],
+        "confidence_score": 1.0,
+    }
+
+    module = CalculusModule(mock_gemini_agent)
+    expression = "gradient of x^2 + y at (1, 0)"
+    assert await module.calculate_locally(expression) is None
+    result = await module.calculate(expression)
+
+    assert result.result == [2.0, 1.0]
+    mock_gemini_agent.generate_json_response.assert_called_once()
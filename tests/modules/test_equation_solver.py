@@ -94,3 +94,19 @@ async def test_equation_solver_invalid_input(mock_gemini_agent):
 
     with pytest.raises(InvalidInputError):
         await module.calculate("")  # Boş ifade
+
+
+@pytest.mark.asyncio
+async def test_equation_solver_complex_roots_separated(mock_gemini_agent):
+    """Equation solver - gercel ve karmasik kokler ayrilir"""
+    module = EquationSolverModule(mock_gemini_agent)
+    result = await module.calculate_locally("x^3 = 8")
+
+    assert result.result["real"] == [2.0]
+    assert result.result["complex"] == [
+        {"real": -1.0, "imag": -1.7320508076},
+        {"real": -1.0, "imag": 1.7320508076},
+    ]
+    assert result.metadata["method"] == "polynomial"
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
@@ -134,3 +134,41 @@ async def test_financial_calculate_no_result_key(mock_gemini_agent):
     result = await module.calculate("test")
 
     assert result.result == Decimal("0")  # Default değer
+
+
+@pytest.mark.asyncio
+async def test_financial_local_engine_skips_gemini(mock_gemini_agent):
+    """Isimli parametreli ifadeler yerel Decimal motorunda hesaplanir"""
+    module = FinancialModule(mock_gemini_agent)
+
+    result = await module.calculate_locally(
+        "loan principal=10000 rate=5% years=3", currency="USD"
+    )
+
+    assert result.result == Decimal("299.71")
+    assert isinstance(result.result, Decimal)
+    assert result.metadata["currency"] == "USD"
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_financial_decimal_result_serializes_as_number(
+    mock_gemini_agent
+):
+    """Decimal sonuc JSON'a uyarisiz ve sayi olarak yazilir"""
+    import json
+    import warnings
+
+    module = FinancialModule(mock_gemini_agent)
+    result = await module.calculate_locally(
+        "loan principal=10000 rate=5% years=3"
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        payload = json.loads(result.model_dump_json())
+        dumped = result.model_dump(mode="json")
+
+    assert payload["result"] == dumped["result"] == 299.71
+    assert isinstance(result.result, Decimal)
@@ -1,5 +1,8 @@
 """Tests for graph plotter module"""
 
+import asyncio
+
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -204,3 +207,74 @@ async def test_graph_plotter_calculate_exception(
 
         with pytest.raises(Exception, match="API Error"):
             await module.calculate("x^2")
+
+
+@pytest.mark.asyncio
+async def test_graph_plotter_plot_2d_uses_visual_function(
+    mock_gemini_agent, tmp_path
+):
+    """Graph plotter - visual_data fonksiyonu vektorel cizilir"""
+    module = GraphPlotterModule(mock_gemini_agent)
+    module.cache_dir = tmp_path
+
+    visual_data = {"function": "y = sin(x) + x^2", "x_range": [-2, 2]}
+
+    with patch('matplotlib.pyplot.savefig'), \
+         patch('matplotlib.pyplot.plot') as mock_plot:
+        await module._plot_2d(visual_data, "plot sin", [-2, 2])
+
+    x, y = mock_plot.call_args.args[:2]
+    assert len(x) == 1000
+    np.testing.assert_allclose(y, np.sin(x) + x ** 2)
+
+
+@pytest.mark.asyncio
+async def test_graph_plotter_plot_2d_masks_poles(mock_gemini_agent, tmp_path):
+    """Graph plotter - kutuplar ve y_range disi degerler maskelenir"""
+    module = GraphPlotterModule(mock_gemini_agent)
+    module.cache_dir = tmp_path
+
+    visual_data = {"function": "tan(x)", "y_range": [-5, 5]}
+
+    with patch('matplotlib.pyplot.savefig'), \
+         patch('matplotlib.pyplot.ylim') as mock_ylim, \
+         patch('matplotlib.pyplot.plot') as mock_plot:
+        await module._plot_2d(visual_data, "tan(x)", [-3, 3])
+
+    x, y = mock_plot.call_args.args[:2]
+    near_pole = np.abs(np.abs(x) - np.pi / 2) < 0.01
+    assert np.isnan(y[near_pole]).all()
+    assert np.nanmax(np.abs(y)) <= 15
+    mock_ylim.assert_called_once_with(-5.0, 5.0)
+
+
+@pytest.mark.asyncio
+async def test_graph_plotter_plot_2d_invalid_function(
+    mock_gemini_agent, tmp_path
+):
+    """Graph plotter - derlenemeyen fonksiyon hata verir"""
+    module = GraphPlotterModule(mock_gemini_agent)
+    module.cache_dir = tmp_path
+
+    with pytest.raises(CalculationError, match="Grafik olusturulamadi"):
+        await module._plot_2d({}, "__import__('os')", [-1, 1])
+
+
+@pytest.mark.asyncio
+async def test_graph_plotter_plot_2d_compiles_off_event_loop(
+    mock_gemini_agent, tmp_path
+):
+    """Graph plotter - fonksiyon thread'de derlenir, us kulesi reddedilir"""
+    module = GraphPlotterModule(mock_gemini_agent)
+    module.cache_dir = tmp_path
+
+    with (
+        patch(
+            'src.modules.graph_plotter.asyncio.to_thread',
+            wraps=asyncio.to_thread
+        ) as mock_to_thread,
+        pytest.raises(CalculationError, match="Grafik olusturulamadi")
+    ):
+        await module._plot_2d({}, "x^(9^9^9)", [-1, 1])
+
+    assert mock_to_thread.call_args.args[0] == module._compile_function
@@ -52,3 +52,36 @@ async def test_determinant(mock_gemini_agent):
     assert result.result == -2.0
     assert len(result.steps) > 0
     assert result.confidence_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_linear_algebra_local_engine_skips_gemini(mock_gemini_agent):
+    """Matris literal'leri yerel numpy motorunda hesaplanir"""
+    module = LinearAlgebraModule(mock_gemini_agent)
+
+    result = await module.calculate_locally("transpose [[1,2,3]]")
+
+    assert result.result == [[1.0], [2.0], [3.0]]
+    assert result.domain == "linear_algebra"
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_linear_algebra_unparsed_falls_back_to_gemini(
+    mock_gemini_agent
+):
+    """Yorumlanamayan ifade Gemini'ye gider"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": [[0.0, -1.0], [1.0, 0.0]],
+        "steps": ["90 derece rotasyon matrisi"],
+        "confidence_score": 1.0,
+    }
+
+    module = LinearAlgebraModule(mock_gemini_agent)
+    expression = "rotation matrix for 90 degrees"
+    assert await module.calculate_locally(expression) is None
+    result = await module.calculate(expression)
+
+    assert result.result == [[0.0, -1.0], [1.0, 0.0]]
+    mock_gemini_agent.generate_json_response.assert_called_once()
@@ -167,3 +167,34 @@ async def test_statistics_median(mock_gemini_agent):
     assert len(result.steps) > 0
     assert result.metadata is not None
     assert result.metadata.get("statistic_type") == "median"
+
+
+@pytest.mark.asyncio
+async def test_statistics_local_engine_skips_gemini(mock_gemini_agent):
+    """Istatistik ifadeleri yerel numpy motorunda hesaplanir"""
+    module = StatisticsModule(mock_gemini_agent)
+
+    result = await module.calculate_locally("variance [2,4,6,8,10]")
+
+    assert result.result == 10.0
+    assert result.metadata["statistic_type"] == "variance"
+    assert result.metadata["sample_size"] == 5
+    assert result.engine == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_statistics_unparsed_falls_back_to_gemini(mock_gemini_agent):
+    """Yorumlanamayan ifade Gemini'ye gider"""
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": 0.05,
+        "steps": ["t-test uygulandi"],
+        "confidence_score": 0.9,
+    }
+
+    module = StatisticsModule(mock_gemini_agent)
+    assert await module.calculate_locally("t-test [1,2,3] [4,5,6]") is None
+    result = await module.calculate("t-test [1,2,3] [4,5,6]")
+
+    assert result.result == 0.05
+    mock_gemini_agent.generate_json_response.assert_called_once()
@@ -0,0 +1,55 @@
+"""Tests for Gemini response schemas"""
+
+from typing import Dict, List, Optional
+
+from src.schemas.response_schema import (
+    build_batch_schema,
+    build_response_schema,
+    field_schema,
+)
+
+
+def test_field_schema_maps_supported_types():
+    """field_schema - skaler, liste ve Optional tipler"""
+    assert field_schema(float) == {"type": "NUMBER"}
+    assert field_schema(List[List[float]]) == {
+        "type": "ARRAY",
+        "items": {"type": "ARRAY", "items": {"type": "NUMBER"}},
+    }
+    assert field_schema(Optional[str]) == {
+        "type": "STRING", "nullable": True
+    }
+
+
+def test_field_schema_rejects_unions_and_dicts():
+    """field_schema - Gemini'nin ifade edemedigi tipler None doner"""
+    assert field_schema(Dict[str, float]) is None
+    assert field_schema(Optional[Dict[str, float]]) is None
+    assert field_schema(List[Dict[str, float]]) is None
+
+
+def test_build_response_schema_from_calculation_result():
+    """build_response_schema - result tipi daraltilir, digerleri modelden"""
+    schema = build_response_schema(float)
+
+    assert schema == {
+        "type": "OBJECT",
+        "properties": {
+            "result": {"type": "NUMBER"},
+            "steps": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "confidence_score": {"type": "NUMBER"},
+        },
+        "required": ["result"],
+    }
+    assert build_response_schema(None) is None
+    assert build_response_schema(Dict[str, float]) is None
+
+
+def test_build_batch_schema_wraps_items():
+    """build_batch_schema - sonuclar index alanli listeye sarilir"""
+    schema = build_batch_schema(build_response_schema(float))
+
+    item = schema["properties"]["results"]["items"]
+    assert item["properties"]["index"] == {"type": "INTEGER"}
+    assert item["required"] == ["index", "result"]
+    assert schema["required"] == ["results"]
@@ -155,3 +155,16 @@ async def test_calculator_agent_full_flow(mock_gemini_agent):
         assert "✅ Sonuc:" in result
         assert "4" in result.splitlines()[0]
         assert "📝 Adimlar:" in result
+
+
+@pytest.mark.asyncio
+async def test_calculator_agent_routes_local_first(mock_gemini_agent):
+    """CalculatorAgent - yerel motor sonucu Gemini'siz gosterilir"""
+    with patch('src.main.settings.validate'), \
+         patch('src.main.GeminiAgent', return_value=mock_gemini_agent):
+        agent = CalculatorAgent()
+        output = await agent.process_command("!linalg det [[1, 2], [3, 4]]")
+
+    assert "-2" in output.splitlines()[0]
+    assert agent.router.stats()["linear_algebra"] == {"local": 1}
+    mock_gemini_agent.generate_json_response.assert_not_called()
@@ -1,7 +1,7 @@
 """Tests for main.py CLI and orchestrator"""
 
 import pytest
-import asyncio  # noqa: F401
+import asyncio
 import sys  # noqa: F401
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.main import (
@@ -82,6 +82,82 @@ async def test_process_command_success():
         assert "📝 Adimlar:" in result
 
 
+@pytest.mark.asyncio
+async def test_process_command_stream_prints_steps(capsys):
+    """process_command - akis modunda adimlar geldikce yazilir"""
+    from src.core.streaming import step_listener
+
+    with patch('src.main.settings.validate'), \
+         patch('src.main.GeminiAgent') as mock_gemini, \
+         patch('src.main.BasicMathModule') as mock_module_class:
+        mock_gemini.return_value = MagicMock()
+        mock_module = MagicMock()
+        mock_result = MagicMock(
+            result=4.0,
+            steps=["2 + 2", "= 4"],
+            confidence_score=1.0,
+            visual_data=None,
+            error=None,
+        )
+
+        async def calculate(expression, **kwargs):
+            step_listener.get()("2 + 2")
+            return mock_result
+
+        mock_module.calculate = AsyncMock(side_effect=calculate)
+        mock_module_class.return_value = mock_module
+
+        agent = CalculatorAgent()
+        result = await agent.process_command("2 + 2", stream=True)
+
+        printed = capsys.readouterr().out
+        assert "📝 Adimlar:" in printed
+        assert "  1. 2 + 2" in printed
+        assert "📝 Adimlar:" not in result
+        assert "  1. 2 + 2" not in result
+        assert "  2. = 4" in result
+        assert step_listener.get() is None
+
+
+@pytest.mark.asyncio
+async def test_process_command_stream_reset_restarts_steps(capsys):
+    """process_command - reset olayindan sonra adimlar bastan numaralanir"""
+    from src.core.streaming import STEPS_RESET, step_listener
+
+    with patch('src.main.settings.validate'), \
+         patch('src.main.GeminiAgent') as mock_gemini, \
+         patch('src.main.BasicMathModule') as mock_module_class:
+        mock_gemini.return_value = MagicMock()
+        mock_module = MagicMock()
+        mock_result = MagicMock(
+            result=4.0,
+            steps=["2 + 2 = 4", "Sonuc 4"],
+            confidence_score=1.0,
+            visual_data=None,
+            error=None,
+        )
+
+        async def calculate(expression, **kwargs):
+            listener = step_listener.get()
+            listener("hizli adim")
+            listener(STEPS_RESET)
+            listener("2 + 2 = 4")
+            return mock_result
+
+        mock_module.calculate = AsyncMock(side_effect=calculate)
+        mock_module_class.return_value = mock_module
+
+        agent = CalculatorAgent()
+        result = await agent.process_command("2 + 2", stream=True)
+
+        printed = capsys.readouterr().out
+        assert "onceki adimlar gecersiz" in printed
+        assert printed.count("📝 Adimlar:") == 2
+        assert "  1. 2 + 2 = 4" in printed
+        assert "  2. Sonuc 4" in result
+        assert "2 + 2 = 4" not in result
+
+
 @pytest.mark.asyncio
 async def test_process_command_security_violation():
     """process_command - güvenlik ihlali"""
@@ -168,6 +244,54 @@ async def test_process_command_calculation_error():
         assert "❌ Hesaplama hatasi" in result
 
 
+@pytest.mark.asyncio
+async def test_process_command_deadline_exceeded():
+    """process_command - istek suresi dolunca zaman asimi doner"""
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with (
+        patch('src.main.settings.validate'),
+        patch('src.main.settings.REQUEST_TIMEOUT', 0.05),
+        patch('src.main.GeminiAgent') as mock_gemini,
+        patch('src.main.BasicMathModule')
+    ):
+        mock_gemini.return_value = MagicMock()
+        agent = CalculatorAgent()
+
+        with patch.object(agent.router, 'route', side_effect=hang):
+            result = await agent.process_command("2 + 2")
+
+        assert "⏱️ Zaman asimi" in result
+
+
+@pytest.mark.asyncio
+async def test_process_command_answer_only_hides_steps():
+    """process_command - explain=False adimlari gostermez"""
+    from src.schemas.models import CalculationResult
+
+    with (
+        patch('src.main.settings.validate'),
+        patch('src.main.GeminiAgent') as mock_gemini,
+        patch('src.main.BasicMathModule')
+    ):
+        mock_gemini.return_value = MagicMock()
+        agent = CalculatorAgent()
+        result = CalculationResult(
+            result=4.0, steps=["2 + 2 = 4"], domain="basic_math"
+        )
+
+        with patch.object(
+            agent.router, 'route', new_callable=AsyncMock,
+            return_value=result
+        ) as mock_route:
+            output = await agent.process_command("2 + 2", explain=False)
+
+        assert output == "✅ Sonuc: 4"
+        # explain route parametresi olarak iletilmez
+        assert mock_route.call_args.kwargs == {}
+
+
 @pytest.mark.asyncio
 async def test_process_command_unexpected_error():
     """process_command - beklenmeyen hata"""
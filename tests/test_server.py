@@ -0,0 +1,189 @@
+"""Tests for the asyncio HTTP service"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config.settings import settings
+from src.core.deadline import current_deadline
+from src.main import CalculatorAgent
+from src.schemas.models import CalculationResult
+from src.server import CalculatorServer
+from src.utils.exceptions import (
+    DeadlineExceededError,
+    SecurityViolationError,
+)
+
+
+def _result(value: float) -> CalculationResult:
+    """basic_math sonucu"""
+    return CalculationResult(
+        result=value, domain="basic_math", module="basic_math"
+    )
+
+
+@pytest.fixture
+def mock_agent():
+    """calculate metodu mock'lanmis CalculatorAgent"""
+    agent = MagicMock(spec=CalculatorAgent)
+    agent.calculate = AsyncMock(return_value=_result(4.0))
+    return agent
+
+
+async def _request(port: int, method: str, path: str, payload=None):
+    """Sunucuya tek HTTP istegi gonderir, (durum, JSON govde) dondurur"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        .encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ")[1])
+    return status, json.loads(response_body)
+
+
+@pytest.mark.asyncio
+async def test_calculate_endpoint_returns_result(mock_agent):
+    """POST /calculate - CalculationResult JSON doner"""
+    server = CalculatorServer(mock_agent)
+    listener = await server.start("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        status, body = await _request(
+            port, "POST", "/calculate",
+            {"expression": "2 + 2", "parameters": {"explain": False}},
+        )
+
+    assert status == 200
+    assert body["result"] == 4.0
+    assert body["domain"] == "basic_math"
+    request = mock_agent.calculate.await_args.args[0]
+    assert request.expression == "2 + 2"
+    assert request.parameters == {"explain": False}
+
+
+@pytest.mark.asyncio
+async def test_calculate_endpoint_error_statuses(mock_agent):
+    """POST /calculate - bozuk istek ve hesaplama hatalari"""
+    server = CalculatorServer(mock_agent)
+
+    status, body = await server.dispatch("POST", "/calculate", b"{bad")
+    assert status == 400
+    assert "Gecersiz JSON" in body["error"]
+
+    status, _ = await server.dispatch("POST", "/calculate", b"{}")
+    assert status == 400
+
+    status, body = await server.dispatch(
+        "POST", "/calculate",
+        b'{"expression": "x", "parameters": {"expression": "y"}}',
+    )
+    assert status == 400
+    assert "Desteklenmeyen parametre: expression" in body["error"]
+    mock_agent.calculate.assert_not_called()
+
+    mock_agent.calculate.side_effect = SecurityViolationError("yasak")
+    status, body = await server.dispatch(
+        "POST", "/calculate", b'{"expression": "x"}'
+    )
+    assert (status, body) == (400, {"error": "yasak"})
+
+    mock_agent.calculate.side_effect = DeadlineExceededError("sure doldu")
+    status, _ = await server.dispatch(
+        "POST", "/calculate", b'{"expression": "x"}'
+    )
+    assert status == 504
+
+    status, _ = await server.dispatch("GET", "/missing", b"")
+    assert status == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_keeps_order_and_isolates_errors(mock_agent):
+    """POST /batch - sonuclar istek sirasinda, hata tek elemanda kalir"""
+    async def calculate(request):
+        if request.expression == "bad":
+            raise SecurityViolationError("yasak")
+        await asyncio.sleep(0.01 if request.expression == "1" else 0)
+        return _result(float(request.expression))
+
+    mock_agent.calculate.side_effect = calculate
+    server = CalculatorServer(mock_agent)
+    payload = [
+        {"expression": "1"},
+        {"expression": "bad", "module": "basic_math"},
+        {"expression": "3"},
+    ]
+
+    status, body = await server.dispatch(
+        "POST", "/batch", json.dumps(payload).encode()
+    )
+
+    assert status == 200
+    assert [item["result"] for item in body] == [1.0, "yasak", 3.0]
+    assert body[1]["error"] == "yasak"
+    assert body[1]["domain"] == "basic_math"
+
+    server.max_batch_size = 2
+    status, _ = await server.dispatch(
+        "POST", "/batch", json.dumps(payload).encode()
+    )
+    assert status == 413
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_bounds_in_flight_calculations(mock_agent):
+    """Esli hesaplama sayisi max_concurrency'yi asmaz"""
+    peak = 0
+    server = CalculatorServer(mock_agent, max_concurrency=3)
+
+    async def calculate(request):
+        nonlocal peak
+        peak = max(peak, server.in_flight)
+        await asyncio.sleep(0.01)
+        return _result(1.0)
+
+    mock_agent.calculate.side_effect = calculate
+    payload = json.dumps([{"expression": "1"}] * 10).encode()
+
+    status, body = await server.dispatch("POST", "/batch", payload)
+
+    assert status == 200
+    assert len(body) == 10
+    assert peak == 3
+    assert server.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_request_times_out_with_504(mock_agent):
+    """Kuyrukta suresi dolan istek 504 doner, deadline agent'a iletilir"""
+    deadlines = []
+    server = CalculatorServer(mock_agent, max_concurrency=1)
+
+    async def calculate(request):
+        deadlines.append(current_deadline.get())
+        await asyncio.sleep(0.1)
+        return _result(1.0)
+
+    mock_agent.calculate.side_effect = calculate
+    body = b'{"expression": "1"}'
+
+    with patch.object(settings, "REQUEST_TIMEOUT", 0.05):
+        first, second = await asyncio.gather(
+            server.dispatch("POST", "/calculate", body),
+            server.dispatch("POST", "/calculate", body),
+        )
+
+    assert first[0] == 200
+    assert second[0] == 504
+    assert "kuyrukta" in second[1]["error"]
+    assert len(deadlines) == 1
+    assert deadlines[0].timeout == 0.05
+    assert server.in_flight == 0
@@ -0,0 +1,154 @@
+"""Tests for cache helpers"""
+
+import sqlite3
+
+import pytest
+from unittest.mock import patch
+from src.utils.cache import LRUCache, PersistentCache
+
+
+def test_lru_cache_hit_and_miss_counters():
+    """LRUCache - hit/miss sayaclari"""
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "size": 1, "max_size": 2, "bytes": 0, "max_bytes": None,
+        "hits": 1, "misses": 1, "evictions": 0, "expirations": 0,
+    }
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """LRUCache - en az kullanilan eleman atilir"""
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_lru_cache_invalid_size():
+    """LRUCache - gecersiz boyut"""
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+
+
+def test_lru_cache_ttl_expiration():
+    """LRUCache - suresi dolan eleman miss sayilir"""
+    cache = LRUCache(max_size=2, ttl=10)
+    with patch('src.utils.cache.time.monotonic', return_value=100.0):
+        cache.put("a", 1)
+    with patch('src.utils.cache.time.monotonic', return_value=105.0):
+        assert cache.get("a") == 1
+    with patch('src.utils.cache.time.monotonic', return_value=110.0):
+        assert "a" not in cache
+        assert cache.get("a") is None
+
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_lru_cache_byte_cap():
+    """LRUCache - bayt siniri asildiginda eski elemanlar atilir"""
+    cache = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "yyyy")
+    cache.put("c", "zzzz")
+    cache.put("big", "x" * 11)
+
+    assert "a" not in cache
+    assert "big" not in cache
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persistent_cache_roundtrip_across_instances(tmp_path):
+    """PersistentCache - kayitlar yeni baglantida da okunur"""
+    path = str(tmp_path / "cache" / "results.sqlite3")
+    PersistentCache(path).put("calculus", "x^2", '{"result": 1}')
+
+    cache = PersistentCache(path)
+
+    assert cache.get("calculus", "x^2") == '{"result": 1}'
+    assert cache.get("statistics", "x^2") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_persistent_cache_evicts_least_recently_read(tmp_path):
+    """PersistentCache - bayt siniri asilinca en eski kayit silinir"""
+    cache = PersistentCache(str(tmp_path / "results.sqlite3"), max_bytes=8)
+    with patch('src.utils.cache.time.time', side_effect=[1.0, 2.0, 3.0]):
+        cache.put("m", "a", "xxxx")
+        cache.put("m", "b", "yyyy")
+        cache.get("m", "a")
+    with patch('src.utils.cache.time.time', return_value=4.0):
+        cache.put("m", "c", "zzzz")
+        cache.put("m", "big", "x" * 9)
+
+    assert cache.get("m", "a") == "xxxx"
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "big") is None
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persistent_cache_batches_access_time_updates(tmp_path):
+    """PersistentCache - okumalar erisim zamanini toplu yazar"""
+    path = str(tmp_path / "results.sqlite3")
+    cache = PersistentCache(path)
+    cache.TOUCH_BATCH_SIZE = 2
+    with patch('src.utils.cache.time.time', return_value=1.0):
+        cache.put("m", "a", "xxxx")
+        cache.put("m", "b", "yyyy")
+    reader = sqlite3.connect(path)
+    query = "SELECT accessed_at FROM entries WHERE key = ?"
+
+    with patch('src.utils.cache.time.time', return_value=5.0):
+        cache.get("m", "a")
+    assert reader.execute(query, ("a",)).fetchone()[0] == 1.0
+
+    with patch('src.utils.cache.time.time', return_value=6.0):
+        cache.get("m", "b")
+    assert reader.execute(query, ("a",)).fetchone()[0] == 5.0
+    assert reader.execute(query, ("b",)).fetchone()[0] == 6.0
+
+
+def test_persistent_cache_keeps_running_byte_total(tmp_path):
+    """PersistentCache - toplam boyut yeniden yazma ve temizlikte korunur"""
+    path = str(tmp_path / "results.sqlite3")
+    cache = PersistentCache(path)
+    cache.put("m", "a", "xxxx")
+    cache.put("m", "a", "xx")
+    cache.put("m", "b", "yyy")
+
+    assert cache.stats()["bytes"] == 5
+    assert PersistentCache(path).stats()["bytes"] == 5
+
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+def test_persistent_cache_locked_database_is_a_miss(tmp_path):
+    """PersistentCache - kilitli veritabani kisa surede miss/atlama olur"""
+    path = str(tmp_path / "results.sqlite3")
+    cache = PersistentCache(path, timeout=0.01)
+    cache.put("m", "a", "xxxx")
+    cache.get("m", "a")
+    cache.TOUCH_BATCH_SIZE = 1
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN EXCLUSIVE")
+    try:
+        assert cache.get("m", "a") is None
+        cache.put("m", "b", "yyyy")
+    finally:
+        writer.execute("ROLLBACK")
+
+    assert cache.get("m", "b") is None
+    assert cache.stats()["misses"] == 2
@@ -3,6 +3,8 @@
 import pytest
 from src.utils.helpers import (
     parse_matrix_string,
+    find_bracket_literals,
+    extract_json_object,
     extract_expression_from_command,
     validate_numeric_result,
     format_result_for_display,
@@ -39,6 +41,41 @@ def test_parse_matrix_string_invalid_syntax():
         parse_matrix_string("[[1,2,invalid]]")
 
 
+def test_find_bracket_literals_top_level_only():
+    """find_bracket_literals - sadece en dis seviye bloklar"""
+    expression = "[[1,2],[3,4]] * [[5],[6]]"
+    spans = find_bracket_literals(expression)
+
+    assert [expression[s:e] for s, e in spans] == [
+        "[[1,2],[3,4]]", "[[5],[6]]"
+    ]
+
+
+def test_find_bracket_literals_unbalanced():
+    """find_bracket_literals - dengesiz parantez"""
+    with pytest.raises(ValueError, match="Dengesiz"):
+        find_bracket_literals("[[1,2]")
+
+
+def test_extract_json_object_ignores_surrounding_text():
+    """extract_json_object - aciklama ve sondaki parantezler atlanir"""
+    text = (
+        'Cozum: {"result": 4, "steps": ["a = {\\"b\\"}"]} '
+        'Not: kume {x} }'
+    )
+
+    assert extract_json_object(text) == {
+        "result": 4, "steps": ['a = {"b"}']
+    }
+
+
+def test_extract_json_object_skips_invalid_blocks():
+    """extract_json_object - parse edilemeyen blok atlanir"""
+    assert extract_json_object('{x} {"a": {"b": 1}}') == {"a": {"b": 1}}
+    assert extract_json_object('{"a": 1') is None
+    assert extract_json_object("JSON yok") is None
+
+
 def test_extract_expression_from_command_calculus():
     """extract_expression_from_command - calculus prefix"""
     result = extract_expression_from_command("!calculus x^2")